@@ -2,10 +2,7 @@ from proximl.proximl import ProxiML
 import asyncio
 
 
-proximl_client = ProxiML()
-
-
-async def create_dataset():
+async def create_dataset(proximl_client):
     # Create the dataset
     dataset = await proximl_client.datasets.create(
         name="Local Dataset",
@@ -22,10 +19,7 @@ async def create_dataset():
     return dataset
 
 
-dataset = asyncio.run(create_dataset())
-
-
-async def run_job(dataset):
+async def run_job(proximl_client, dataset):
     # Create the job
 
     job = await proximl_client.jobs.create(
@@ -57,7 +51,14 @@ async def run_job(dataset):
     await job.remove()
 
 
-asyncio.run(run_job(dataset))
+async def main():
+    # The client reuses its pooled connections until the block exits
+    async with ProxiML() as proximl_client:
+        dataset = await create_dataset(proximl_client)
+        await run_job(proximl_client, dataset)
+
+        # Cleanup Dataset
+        await dataset.remove()
+
 
-# Cleanup Dataset
-asyncio.run(dataset.remove())
+asyncio.run(main())
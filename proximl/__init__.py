@@ -1,10 +1,6 @@
 import warnings
 import logging
-
-with warnings.catch_warnings():
-    # this will suppress all warnings in this block
-    warnings.filterwarnings("ignore", message="int_from_bytes is deprecated")
-    from .proximl import ProxiML
+import importlib
 
 logging.basicConfig(
     format="%(asctime)s.%(msecs)03dZ  %(levelname)s  %(message)s",
@@ -15,3 +11,20 @@ logger = logging.getLogger(__name__)
 
 __version__ = "1.0.1"
 __all__ = "ProxiML"
+
+
+def __getattr__(name):
+    # Import the client on first use, so that importing the package (or
+    # only some of its modules) stays fast.
+    if name == "ProxiML":
+        with warnings.catch_warnings():
+            # this will suppress all warnings in this block
+            warnings.filterwarnings(
+                "ignore", message="int_from_bytes is deprecated"
+            )
+            from .proximl import ProxiML
+        globals()["ProxiML"] = ProxiML
+        return ProxiML
+    if name == "sync":
+        return importlib.import_module(f"{__name__}.sync")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,8 @@ from .exceptions import (
     ProxiMLException,
 )
 from proximl.utils.transfer import upload, download
+from proximl.utils.metrics import measure_transfer
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Checkpoints(object):
@@ -28,6 +30,15 @@ class Checkpoints(object):
         ]
         return checkpoints
 
+    def iter(self, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            "/checkpoint",
+            lambda checkpoint: Checkpoint(self.proximl, **checkpoint),
+            kwargs,
+            page_size,
+        )
+
     async def list_public(self, **kwargs):
         resp = await self.proximl._query(f"/checkpoint/public", "GET", kwargs)
         datasets = [Checkpoint(self.proximl, **dataset) for dataset in resp]
@@ -40,6 +51,8 @@ class Checkpoints(object):
         source_uri,
         type="evefs",
         project_uuid=None,
+        include=None,
+        exclude=None,
         **kwargs,
     ):
         if not project_uuid:
@@ -56,6 +69,9 @@ class Checkpoints(object):
         logging.info(f"Creating Checkpoint {name}")
         resp = await self.proximl._query("/checkpoint", "POST", None, payload)
         checkpoint = Checkpoint(self.proximl, **resp)
+        if include is not None or exclude is not None:
+            # Only used locally, when uploading the source
+            checkpoint._upload_filter = dict(include=include, exclude=exclude)
         logging.info(f"Created Checkpoint {name} with id {checkpoint.id}")
 
         return checkpoint
@@ -67,6 +83,8 @@ class Checkpoints(object):
 
 
 class Checkpoint:
+    _upload_filter = dict()  # include/exclude patterns given to create
+
     def __init__(self, proximl, **kwargs):
         self.proximl = proximl
         self._checkpoint = kwargs
@@ -153,7 +171,17 @@ class Checkpoint:
                     f"Checkpoint in downloading status missing required connection properties (auth_token, hostname, source_uri).",
                 )
 
-            await upload(hostname, auth_token, source_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "upload",
+                upload(
+                    hostname,
+                    auth_token,
+                    source_uri,
+                    **self._upload_filter,
+                ),
+                entity="checkpoint",
+            )
         elif self.status == "exporting":
             # Download task - get auth_token, hostname, and output_uri from checkpoint
             auth_token = self._checkpoint.get("auth_token")
@@ -166,7 +194,12 @@ class Checkpoint:
                     f"Checkpoint in exporting status missing required connection properties (auth_token, hostname, output_uri).",
                 )
 
-            await download(hostname, auth_token, output_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "download",
+                download(hostname, auth_token, output_uri),
+                entity="checkpoint",
+            )
 
     async def remove(self, force=False):
         await self.proximl._query(
@@ -1,39 +1,175 @@
+import sys
 import asyncio
 import click
+import importlib
 import logging
 from os import devnull
 from sys import stderr, stdout
 
 
-from proximl.proximl import ProxiML
+def __getattr__(name):
+    # The SDK is only imported once a command needs the client, so that
+    # parsing arguments and --help stay fast.
+    if name == "ProxiML":
+        from proximl.proximl import ProxiML
+
+        globals()["ProxiML"] = ProxiML
+        return ProxiML
+    if "cli" in globals():
+        return cli.module_command(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazyGroup(click.Group):
+    """
+    Click group importing the modules of its subcommands when they are used.
+
+    Each lazy subcommand is defined in a module named after it, which
+    registers it on this group when imported.  Once loaded, the command
+    replaces the module as an attribute of its package (``proximl.cli.job``
+    is the ``job`` group), as importing every command used to do; the
+    package's ``__getattr__`` loads it on first access (see
+    ``module_command``).  A module imported directly stays the package
+    attribute until the command is loaded through its group.  Their short
+    help is given here so that ``--help`` does not import them (a test
+    checks it against the commands).
+
+    Args:
+        lazy_subcommands: Mapping of command name to (module name, short help)
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or dict())
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, _ = self.lazy_subcommands[cmd_name]
+            package, _, attr = module_name.rpartition(".")
+            if cmd_name not in self.commands:
+                module = importlib.import_module(module_name)
+                if cmd_name not in self.commands:
+                    self.add_command(getattr(module, attr), cmd_name)
+            # Importing the module set it as an attribute of the package
+            setattr(sys.modules[package], attr, self.commands[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+    def module_command(self, name):
+        """
+        Return the lazy subcommand defined in the module ``name``, loading
+        it if needed.  Called by the ``__getattr__`` of its package.
+
+        Raises:
+            AttributeError: If no lazy subcommand is defined in ``name``
+        """
+        for cmd_name, (module_name, _) in self.lazy_subcommands.items():
+            if module_name.rpartition(".")[2] == name:
+                return self.get_command(None, cmd_name)
+        raise AttributeError(f"{self.name} has no subcommand module {name!r}")
+
+    def format_commands(self, ctx, formatter):
+        commands = []
+        for cmd_name in self.list_commands(ctx):
+            command = self.commands.get(cmd_name)
+            if command is None:
+                commands.append((cmd_name, self.lazy_subcommands[cmd_name][1]))
+            elif not command.hidden:
+                commands.append((cmd_name, command))
+        if not commands:
+            return
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        rows = [
+            (
+                name,
+                (
+                    command
+                    if isinstance(command, str)
+                    else command.get_short_help_str(limit)
+                ),
+            )
+            for name, command in commands
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
 
 
 class ProxiMLRunner(object):
+    """
+    Runs the SDK coroutines of a CLI command.
+
+    One event loop and one client are kept for the life of the command, so
+    that its steps share the pooled HTTP connections and tokens, and tasks
+    a step leaves pending keep running while later steps are run.  The
+    loop is closed with the root click context, or by calling ``close``.
+    """
+
     def __init__(self):
         self._proximl_client = None
+        self._loop = None
 
     @property
-    def client(self) -> ProxiML:
+    def client(self) -> "ProxiML":
         if self._proximl_client is None:
             try:
-                self._proximl_client = ProxiML()
+                client_class = globals().get("ProxiML") or __getattr__(
+                    "ProxiML"
+                )
+                client = client_class()
             except Exception as err:
                 raise click.UsageError(err)
+            # Opened for the life of the command, so its steps share a pool
+            self.run(client.__aenter__())
+            self._proximl_client = client
         return self._proximl_client
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            ctx = click.get_current_context(silent=True)
+            if ctx is not None:
+                ctx.find_root().call_on_close(self.close)
+        return self._loop
+
     async def _run(self, *tasks):
         return await asyncio.gather(*tasks)
 
     def run(self, *tasks):
         try:
             if len(tasks) == 1:
-                return_value = asyncio.run(*tasks)
+                return_value = self.loop.run_until_complete(tasks[0])
             else:
-                return_value = asyncio.run(self._run(*tasks))
+                return_value = self.loop.run_until_complete(self._run(*tasks))
         except Exception as err:
             raise click.UsageError(err)
         return return_value
 
+    def close(self):
+        """Cancel pending tasks, close the client and the event loop."""
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            if self._proximl_client is not None:
+                loop.run_until_complete(self._proximl_client.close())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            # Added in Python 3.9; on 3.8 loop.close() shuts the default
+            # executor down without waiting for its threads
+            if hasattr(loop, "shutdown_default_executor"):
+                loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
 
 class Config(object):
     def __init__(self):
@@ -62,7 +198,29 @@ def search_by_id_name(term, list):
 pass_config = click.make_pass_decorator(Config, ensure=True)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "checkpoint": (
+            "proximl.cli.checkpoint",
+            "proxiML checkpoint commands.",
+        ),
+        "cloudbender": (
+            "proximl.cli.cloudbender",
+            "proxiML CloudBender™ commands.",
+        ),
+        "dataset": ("proximl.cli.dataset", "proxiML dataset commands."),
+        "environment": (
+            "proximl.cli.environment",
+            "proxiML environment commands.",
+        ),
+        "gpu": ("proximl.cli.gpu", "proxiML GPU commands."),
+        "job": ("proximl.cli.job", "proxiML job commands."),
+        "model": ("proximl.cli.model", "proxiML model commands."),
+        "project": ("proximl.cli.project", "proxiML project commands."),
+        "volume": ("proximl.cli.volume", "proxiML volume commands."),
+    },
+)
 @click.version_option(package_name="proximl", prog_name="proxiML CLI and SDK")
 @click.option(
     "--debug",
@@ -158,14 +316,3 @@ def configure(config):
         project for project in projects if project.name == name
     ]
     config.proximl.client.set_active_project(selected_project[0].id)
-
-
-from proximl.cli.dataset import dataset
-from proximl.cli.model import model
-from proximl.cli.checkpoint import checkpoint
-from proximl.cli.volume import volume
-from proximl.cli.environment import environment
-from proximl.cli.gpu import gpu
-from proximl.cli.job import job
-from proximl.cli.project import project
-from proximl.cli.cloudbender import cloudbender
@@ -1,19 +1,50 @@
 import click
 from webbrowser import open as browse
-from proximl.cli import cli, pass_config, search_by_id_name
+from proximl.cli import LazyGroup, cli, pass_config, search_by_id_name
 
 
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "data-connector": (
+            "proximl.cli.cloudbender.data_connector",
+            "proxiML CloudBender data connector commands.",
+        ),
+        "datastore": (
+            "proximl.cli.cloudbender.datastore",
+            "proxiML CloudBender datastore commands.",
+        ),
+        "device": (
+            "proximl.cli.cloudbender.device",
+            "proxiML CloudBender device commands.",
+        ),
+        "node": (
+            "proximl.cli.cloudbender.node",
+            "proxiML CloudBender node commands.",
+        ),
+        "provider": (
+            "proximl.cli.cloudbender.provider",
+            "proxiML CloudBender provider commands.",
+        ),
+        "region": (
+            "proximl.cli.cloudbender.region",
+            "proxiML CloudBender region commands.",
+        ),
+        "service": (
+            "proximl.cli.cloudbender.service",
+            "proxiML CloudBender service commands.",
+        ),
+    },
+)
 @pass_config
 def cloudbender(config):
     """proxiML CloudBender™ commands."""
     pass
 
 
-from proximl.cli.cloudbender.provider import provider
-from proximl.cli.cloudbender.region import region
-from proximl.cli.cloudbender.node import node
-from proximl.cli.cloudbender.device import device
-from proximl.cli.cloudbender.datastore import datastore
-from proximl.cli.cloudbender.data_connector import data_connector
-from proximl.cli.cloudbender.service import service
+def __getattr__(name):
+    # Subcommand modules are imported when first used.  If this package
+    # was imported directly, proximl.cli.cloudbender is still the module, so
+    # bind the group first.
+    cli.get_command(None, cloudbender.name)
+    return cloudbender.module_command(name)
@@ -1,16 +1,29 @@
 import asyncio
 import click
 from webbrowser import open as browse
-from proximl.cli import cli, pass_config, search_by_id_name
+from proximl.cli import LazyGroup, cli, pass_config, search_by_id_name
 
 
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": ("proximl.cli.job.create", "proxiML job create."),
+    },
+)
 @pass_config
 def job(config):
     """proxiML job commands."""
     pass
 
 
+def __getattr__(name):
+    # Subcommand modules are imported when first used.  If this package
+    # was imported directly, proximl.cli.job is still the module, so
+    # bind the group first.
+    cli.get_command(None, job.name)
+    return job.module_command(name)
+
+
 @job.command()
 @click.argument("job", type=click.STRING)
 @pass_config
@@ -262,6 +275,3 @@ def list(config, format):
         for job in jobs:
             output.append(job.dict)
         click.echo(output, file=config.stdout)
-
-
-from proximl.cli.job.create import create
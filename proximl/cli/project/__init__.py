@@ -1,14 +1,46 @@
 import click
-from proximl.cli import cli, pass_config, search_by_id_name
-
-
-@cli.group()
+from proximl.cli import LazyGroup, cli, pass_config, search_by_id_name
+
+
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "credential": (
+            "proximl.cli.project.credential",
+            "proxiML project credential commands.",
+        ),
+        "data-connector": (
+            "proximl.cli.project.data_connector",
+            "proxiML project data_connector commands.",
+        ),
+        "datastore": (
+            "proximl.cli.project.datastore",
+            "proxiML project datastore commands.",
+        ),
+        "secret": (
+            "proximl.cli.project.secret",
+            "proxiML project secret commands.",
+        ),
+        "service": (
+            "proximl.cli.project.service",
+            "proxiML project service commands.",
+        ),
+    },
+)
 @pass_config
 def project(config):
     """proxiML project commands."""
     pass
 
 
+def __getattr__(name):
+    # Subcommand modules are imported when first used.  If this package
+    # was imported directly, proximl.cli.project is still the module, so
+    # bind the group first.
+    cli.get_command(None, project.name)
+    return project.module_command(name)
+
+
 @project.command()
 @pass_config
 def list(config):
@@ -75,10 +107,3 @@ def remove(config, project):
         raise click.UsageError("Cannot find specified project.")
 
     return config.proximl.run(found.remove())
-
-
-from proximl.cli.project.secret import secret
-from proximl.cli.project.credential import credential
-from proximl.cli.project.data_connector import data_connector
-from proximl.cli.project.datastore import datastore
-from proximl.cli.project.service import service
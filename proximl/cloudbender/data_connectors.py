@@ -8,6 +8,7 @@ from proximl.exceptions import (
     SpecificationError,
     ProxiMLException,
 )
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class DataConnectors(object):
@@ -33,6 +34,19 @@ class DataConnectors(object):
         ]
         return data_connectors
 
+    def iter(
+        self, provider_uuid, region_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs
+    ):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region/{region_uuid}/data_connector",
+            lambda data_connector: DataConnector(
+                self.proximl, **data_connector
+            ),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         provider_uuid,
@@ -8,6 +8,7 @@ from proximl.exceptions import (
     SpecificationError,
     ProxiMLException,
 )
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Datastores(object):
@@ -31,6 +32,17 @@ class Datastores(object):
         datastores = [Datastore(self.proximl, **datastore) for datastore in resp]
         return datastores
 
+    def iter(
+        self, provider_uuid, region_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs
+    ):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region/{region_uuid}/datastore",
+            lambda datastore: Datastore(self.proximl, **datastore),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         provider_uuid,
@@ -1,5 +1,6 @@
 import json
 import logging
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class DeviceConfigs(object):
@@ -26,6 +27,17 @@ class DeviceConfigs(object):
         ]
         return device_configs
 
+    def iter(
+        self, provider_uuid, region_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs
+    ):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region/{region_uuid}/device/config",
+            lambda device_config: DeviceConfig(self.proximl, **device_config),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         provider_uuid,
@@ -1,5 +1,6 @@
 import json
 import logging
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Devices(object):
@@ -23,6 +24,17 @@ class Devices(object):
         devices = [Device(self.proximl, **device) for device in resp]
         return devices
 
+    def iter(
+        self, provider_uuid, region_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs
+    ):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region/{region_uuid}/device",
+            lambda device: Device(self.proximl, **device),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         provider_uuid,
@@ -4,6 +4,7 @@ import asyncio
 import math
 
 from proximl.exceptions import ApiError, SpecificationError, ProxiMLException, NodeError
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Nodes(object):
@@ -27,6 +28,17 @@ class Nodes(object):
         nodes = [Node(self.proximl, **node) for node in resp]
         return nodes
 
+    def iter(
+        self, provider_uuid, region_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs
+    ):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region/{region_uuid}/node",
+            lambda node: Node(self.proximl, **node),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         provider_uuid,
@@ -10,6 +10,7 @@ from proximl.exceptions import (
     ProxiMLException,
     ProviderError,
 )
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Providers(object):
@@ -25,6 +26,15 @@ class Providers(object):
         providers = [Provider(self.proximl, **provider) for provider in resp]
         return providers
 
+    def iter(self, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            "/provider",
+            lambda provider: Provider(self.proximl, **provider),
+            kwargs,
+            page_size,
+        )
+
     async def enable(self, type, **kwargs):
         data = dict(type=type, **kwargs)
         payload = {k: v for k, v in data.items() if v is not None}
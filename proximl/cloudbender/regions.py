@@ -9,6 +9,7 @@ from proximl.exceptions import (
     ProxiMLException,
     RegionError,
 )
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Regions(object):
@@ -28,6 +29,15 @@ class Regions(object):
         regions = [Region(self.proximl, **region) for region in resp]
         return regions
 
+    def iter(self, provider_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region",
+            lambda region: Region(self.proximl, **region),
+            kwargs,
+            page_size,
+        )
+
     async def create(self, provider_uuid, name, public, storage, **kwargs):
         logging.info(f"Creating Region {name}")
         data = dict(name=name, public=public, storage=storage, **kwargs)
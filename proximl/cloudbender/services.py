@@ -9,6 +9,7 @@ from proximl.exceptions import (
     SpecificationError,
     ProxiMLException,
 )
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 class SERVICE_CERT_ALGORITHMS(str, Enum):
     RSA_2048 = 'rsa2048'
@@ -40,6 +41,17 @@ class Services(object):
         services = [Service(self.proximl, **service) for service in resp]
         return services
 
+    def iter(
+        self, provider_uuid, region_uuid, page_size=DEFAULT_PAGE_SIZE, **kwargs
+    ):
+        return paginate(
+            self.proximl,
+            f"/provider/{provider_uuid}/region/{region_uuid}/service",
+            lambda service: Service(self.proximl, **service),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         provider_uuid,
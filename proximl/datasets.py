@@ -11,6 +11,8 @@ from .exceptions import (
     ProxiMLException,
 )
 from proximl.utils.transfer import upload, download
+from proximl.utils.metrics import measure_transfer
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Datasets(object):
@@ -26,6 +28,15 @@ class Datasets(object):
         datasets = [Dataset(self.proximl, **dataset) for dataset in resp]
         return datasets
 
+    def iter(self, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            "/dataset",
+            lambda dataset: Dataset(self.proximl, **dataset),
+            kwargs,
+            page_size,
+        )
+
     async def list_public(self, **kwargs):
         resp = await self.proximl._query(f"/dataset/public", "GET", kwargs)
         datasets = [Dataset(self.proximl, **dataset) for dataset in resp]
@@ -38,6 +49,8 @@ class Datasets(object):
         source_uri,
         type="evefs",
         project_uuid=None,
+        include=None,
+        exclude=None,
         **kwargs,
     ):
         if not project_uuid:
@@ -54,6 +67,9 @@ class Datasets(object):
         logging.info(f"Creating Dataset {name}")
         resp = await self.proximl._query("/dataset", "POST", None, payload)
         dataset = Dataset(self.proximl, **resp)
+        if include is not None or exclude is not None:
+            # Only used locally, when uploading the source
+            dataset._upload_filter = dict(include=include, exclude=exclude)
         logging.info(f"Created Dataset {name} with id {dataset.id}")
 
         return dataset
@@ -65,6 +81,8 @@ class Datasets(object):
 
 
 class Dataset:
+    _upload_filter = dict()  # include/exclude patterns given to create
+
     def __init__(self, proximl, **kwargs):
         self.proximl = proximl
         self._dataset = kwargs
@@ -149,7 +167,17 @@ class Dataset:
                     f"Dataset in downloading status missing required connection properties (auth_token, hostname, source_uri).",
                 )
 
-            await upload(hostname, auth_token, source_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "upload",
+                upload(
+                    hostname,
+                    auth_token,
+                    source_uri,
+                    **self._upload_filter,
+                ),
+                entity="dataset",
+            )
         elif self.status == "exporting":
             # Download task - get auth_token, hostname, and output_uri from dataset
             auth_token = self._dataset.get("auth_token")
@@ -162,7 +190,12 @@ class Dataset:
                     f"Dataset in exporting status missing required connection properties (auth_token, hostname, output_uri).",
                 )
 
-            await download(hostname, auth_token, output_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "download",
+                download(hostname, auth_token, output_uri),
+                entity="dataset",
+            )
 
     async def remove(self, force=False):
         await self.proximl._query(
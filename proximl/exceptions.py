@@ -132,6 +132,47 @@ class ConnectionError(ProxiMLException):
         return "ConnectionError({self.message})".format(self=self)
 
 
+class CircuitOpenError(ConnectionError):
+    def __init__(self, host, retry_in, *args):
+        super().__init__(
+            f"Circuit breaker open for {host}, retry in {retry_in:.1f}s",
+            *args,
+        )
+        self._host = host
+        self._retry_in = retry_in
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def retry_in(self) -> float:
+        return self._retry_in
+
+    def __repr__(self):
+        return "CircuitOpenError({self.host}, {self.message})".format(self=self)
+
+    def __str__(self):
+        return "CircuitOpenError({self.host}, {self.message})".format(self=self)
+
+
+class CognitoError(ProxiMLException):
+    def __init__(self, code, message, *args):
+        super().__init__(message, *args)
+        self._code = code
+        self._message = message
+
+    @property
+    def code(self) -> str:
+        return self._code
+
+    def __repr__(self):
+        return "CognitoError({self.code}, {self.message!r})".format(self=self)
+
+    def __str__(self):
+        return "CognitoError({self.code}, {self.message!r})".format(self=self)
+
+
 class SpecificationError(ProxiMLException):
     def __init__(self, attribute, message, *args):
         super().__init__(message, *args)
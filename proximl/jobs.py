@@ -13,6 +13,11 @@ from proximl.exceptions import (
     ProxiMLException,
 )
 from proximl.utils.transfer import upload, download
+from proximl.utils.metrics import measure_transfer
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
+
+# Keys of the model and data specifications passed to upload(), not the API
+UPLOAD_FILTERS = ("include", "exclude")
 
 
 class Jobs(object):
@@ -28,6 +33,15 @@ class Jobs(object):
         jobs = [Job(self.proximl, **job) for job in resp]
         return jobs
 
+    def iter(self, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            "/job",
+            lambda job: Job(self.proximl, **job),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         name,
@@ -66,6 +80,19 @@ class Jobs(object):
                 "Invalid resource specification, either 'gpu_type' or 'gpu_types' must be provided",
             )
 
+        # Patterns selecting the local model/data files to upload, which are
+        # not part of the job specification
+        upload_filters = {
+            key: {name: source.get(name) for name in UPLOAD_FILTERS}
+            for key, source in dict(model=model, data=data).items()
+            if source
+            and any(source.get(name) is not None for name in UPLOAD_FILTERS)
+        }
+        if model:
+            model = {k: v for k, v in model.items() if k not in UPLOAD_FILTERS}
+        if data:
+            data = {k: v for k, v in data.items() if k not in UPLOAD_FILTERS}
+
         config = dict(
             name=name,
             type=type,
@@ -93,6 +120,8 @@ class Jobs(object):
             payload["worker_commands"] = []
         logging.info(f"Creating Job {name}")
         job = await self.create_json(payload)
+        if upload_filters:
+            job._upload_filters = upload_filters
         logging.info(f"Created Job {name} with id {job.id}")
         return job
 
@@ -109,6 +138,8 @@ class Jobs(object):
 
 
 class Job:
+    _upload_filters = dict()  # include/exclude patterns of model and data
+
     def __init__(self, proximl, **kwargs):
         self.proximl = proximl
         self._job = kwargs
@@ -414,7 +445,17 @@ class Job:
                     )
 
                 upload_tasks.append(
-                    upload(model_hostname, model_auth_token, model_source_uri)
+                    measure_transfer(
+                        self.proximl.metrics,
+                        "upload",
+                        upload(
+                            model_hostname,
+                            model_auth_token,
+                            model_source_uri,
+                            **self._upload_filters.get("model", {}),
+                        ),
+                        entity="job",
+                    )
                 )
 
             if data_local:
@@ -433,7 +474,17 @@ class Job:
                     )
 
                 upload_tasks.append(
-                    upload(data_hostname, data_auth_token, data_input_uri)
+                    measure_transfer(
+                        self.proximl.metrics,
+                        "upload",
+                        upload(
+                            data_hostname,
+                            data_auth_token,
+                            data_input_uri,
+                            **self._upload_filters.get("data", {}),
+                        ),
+                        entity="job",
+                    )
                 )
 
             # Upload both in parallel if both are local
@@ -516,10 +567,15 @@ class Job:
                         )
                         try:
                             download_task = asyncio.create_task(
-                                download(
-                                    output_hostname,
-                                    output_auth_token,
-                                    output_uri,
+                                measure_transfer(
+                                    self.proximl.metrics,
+                                    "download",
+                                    download(
+                                        output_hostname,
+                                        output_auth_token,
+                                        output_uri,
+                                    ),
+                                    entity="job",
                                 )
                             )
                             download_tasks.append(download_task)
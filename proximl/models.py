@@ -11,6 +11,8 @@ from .exceptions import (
     ProxiMLException,
 )
 from proximl.utils.transfer import upload, download
+from proximl.utils.metrics import measure_transfer
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Models(object):
@@ -26,6 +28,15 @@ class Models(object):
         models = [Model(self.proximl, **model) for model in resp]
         return models
 
+    def iter(self, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            "/model",
+            lambda model: Model(self.proximl, **model),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         name,
@@ -33,6 +44,8 @@ class Models(object):
         source_uri,
         type="evefs",
         project_uuid=None,
+        include=None,
+        exclude=None,
         **kwargs,
     ):
         if not project_uuid:
@@ -49,6 +62,9 @@ class Models(object):
         logging.info(f"Creating Model {name}")
         resp = await self.proximl._query("/model", "POST", None, payload)
         model = Model(self.proximl, **resp)
+        if include is not None or exclude is not None:
+            # Only used locally, when uploading the source
+            model._upload_filter = dict(include=include, exclude=exclude)
         logging.info(f"Created Model {name} with id {model.id}")
 
         return model
@@ -60,6 +76,8 @@ class Models(object):
 
 
 class Model:
+    _upload_filter = dict()  # include/exclude patterns given to create
+
     def __init__(self, proximl, **kwargs):
         self.proximl = proximl
         self._model = kwargs
@@ -142,7 +160,17 @@ class Model:
                     f"Model in downloading status missing required connection properties (auth_token, hostname, source_uri).",
                 )
 
-            await upload(hostname, auth_token, source_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "upload",
+                upload(
+                    hostname,
+                    auth_token,
+                    source_uri,
+                    **self._upload_filter,
+                ),
+                entity="model",
+            )
         elif self.status == "exporting":
             # Download task - get auth_token, hostname, and output_uri from model
             auth_token = self._model.get("auth_token")
@@ -155,7 +183,12 @@ class Model:
                     f"Model in exporting status missing required connection properties (auth_token, hostname, output_uri).",
                 )
 
-            await download(hostname, auth_token, output_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "download",
+                download(hostname, auth_token, output_uri),
+                entity="model",
+            )
 
     async def remove(self, force=False):
         await self.proximl._query(
@@ -1,23 +1,41 @@
+import copy
 import json
 import os
+import time
+import weakref
 import asyncio
 import aiohttp
 import logging
 import traceback
-import random
+from contextlib import asynccontextmanager
 from importlib.metadata import version
+from urllib.parse import urlsplit
 
 from proximl.utils.auth import Auth
-from proximl.datasets import Datasets
-from proximl.models import Models
-from proximl.checkpoints import Checkpoints
-from proximl.volumes import Volumes
-from proximl.jobs import Jobs
-from proximl.gpu_types import GpuTypes
-from proximl.environments import Environments
-from proximl.exceptions import ApiError, ProxiMLException
-from proximl.projects import Projects
-from proximl.cloudbender import Cloudbender
+from proximl.utils.cache import ResponseCache
+from proximl.utils.circuit_breaker import CircuitBreakers
+from proximl.utils.codec import get_codec
+from proximl.utils.hedge import Hedger
+from proximl.utils.lazy import LazyAttribute
+from proximl.utils.metrics import Timer, path_template, record, trace_config
+from proximl.utils.rate_limit import (
+    DEFAULT_MAX_CONCURRENCY,
+    RateLimiter,
+    THROTTLE_STATUSES,
+    parse_retry_after,
+)
+from proximl.utils.retry import RetryPolicy
+from proximl.utils.singleflight import SingleFlight, freeze
+from proximl.utils.token_provider import TokenProvider, DEFAULT_REFRESH_MARGIN
+from proximl.exceptions import ApiError, CircuitOpenError, ProxiMLException
+
+DEFAULT_CONNECTION_LIMIT = 100  # Max open connections in the shared pool
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 20  # Max open connections per host
+DEFAULT_KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection is kept alive
+DEFAULT_DNS_CACHE_TTL = 300  # Seconds resolved addresses are cached
+RETRY_STATUSES = {429, 502, 503}  # API responses that are retried
+# Connection failures and timeouts that are retried
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
 
 
 async def delayed_close(ws):
@@ -27,6 +45,17 @@ async def delayed_close(ws):
 
 
 class ProxiML(object):
+    # Subsystems are imported and created on first use
+    datasets = LazyAttribute("proximl.datasets", "Datasets")
+    models = LazyAttribute("proximl.models", "Models")
+    checkpoints = LazyAttribute("proximl.checkpoints", "Checkpoints")
+    volumes = LazyAttribute("proximl.volumes", "Volumes")
+    jobs = LazyAttribute("proximl.jobs", "Jobs")
+    gpu_types = LazyAttribute("proximl.gpu_types", "GpuTypes")
+    environments = LazyAttribute("proximl.environments", "Environments")
+    projects = LazyAttribute("proximl.projects", "Projects")
+    cloudbender = LazyAttribute("proximl.cloudbender", "Cloudbender")
+
     def __init__(self, **kwargs):
         self._version = version("proximl")
         CONFIG_DIR = kwargs.get("config_dir") or os.path.expanduser(
@@ -62,21 +91,20 @@ class ProxiML(object):
             region=kwargs.get("region"),
             client_id=kwargs.get("client_id"),
             pool_id=kwargs.get("pool_id"),
+            token_cache=kwargs.get("token_cache"),
+            cognito_client=kwargs.get("cognito_client"),
+        )
+        self._token_provider = TokenProvider(
+            self.auth,
+            refresh_margin=kwargs.get(
+                "token_refresh_margin", DEFAULT_REFRESH_MARGIN
+            ),
         )
         self.active_project = (
             kwargs.get("project")
             or os.environ.get("PROXIML_PROJECT")
             or config.get("project")
         )
-        self.datasets = Datasets(self)
-        self.models = Models(self)
-        self.checkpoints = Checkpoints(self)
-        self.volumes = Volumes(self)
-        self.jobs = Jobs(self)
-        self.gpu_types = GpuTypes(self)
-        self.environments = Environments(self)
-        self.projects = Projects(self)
-        self.cloudbender = Cloudbender(self)
         self.api_url = (
             kwargs.get("api_url")
             or os.environ.get("PROXIML_API_URL")
@@ -89,11 +117,126 @@ class ProxiML(object):
             or env.get("ws_url")
             or f"api-ws.{self.domain_suffix}"
         )
+        self._connector_options = dict(
+            limit=kwargs.get("connection_limit", DEFAULT_CONNECTION_LIMIT),
+            limit_per_host=kwargs.get(
+                "connection_limit_per_host", DEFAULT_CONNECTION_LIMIT_PER_HOST
+            ),
+            keepalive_timeout=kwargs.get(
+                "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+            ttl_dns_cache=kwargs.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL),
+        )
+        self._sessions = weakref.WeakKeyDictionary()  # loop -> session
+        self._pooled = False  # True while used as an async context manager
+        self._singleflight = (
+            SingleFlight() if kwargs.get("coalesce_requests") else None
+        )
+        self.codec = get_codec(kwargs.get("json_codec"))
+        rate_limiter = kwargs.get("rate_limiter")
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                requests_per_second=kwargs.get("requests_per_second"),
+                max_concurrency=kwargs.get(
+                    "max_concurrency", DEFAULT_MAX_CONCURRENCY
+                ),
+            )
+        self._rate_limiter = rate_limiter or None
+        cache = kwargs.get("cache")
+        if cache is True:
+            cache = ResponseCache()
+        self._cache = None if cache is False else cache
+        hedger = kwargs.get("hedge_requests")
+        if hedger is True:
+            hedger = Hedger()
+        self._hedger = hedger or None
+        self._metrics = kwargs.get("metrics")
+        self.retry_policy = kwargs.get("retry_policy") or RetryPolicy(
+            statuses=RETRY_STATUSES, exceptions=RETRY_EXCEPTIONS
+        )
+        circuit_breakers = kwargs.get("circuit_breakers")
+        if circuit_breakers is None:
+            circuit_breakers = CircuitBreakers()
+        self._circuit_breakers = circuit_breakers or None
+
+    async def __aenter__(self):
+        self._pooled = True
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
 
     @property
     def project(self) -> str:
         return self.active_project
 
+    @property
+    def metrics(self):
+        """Metrics sink receiving SDK timings, or None."""
+        return self._metrics
+
+    def _new_session(self):
+        options = dict(
+            connector=aiohttp.TCPConnector(**self._connector_options)
+        )
+        if self._metrics is not None:
+            options["trace_configs"] = [trace_config(self._metrics)]
+        return aiohttp.ClientSession(**options)
+
+    async def _get_session(self):
+        """
+        Return the pooled HTTP session of the running event loop, creating it
+        on first use.
+
+        The session owns a pooled TCPConnector so that consecutive API calls
+        reuse open connections instead of repeating the DNS lookup and TCP/TLS
+        handshake.  A session is bound to the event loop it was created on, so
+        each loop using the client gets its own.  Sessions of loops that have
+        been closed are closed; those of loops still running, possibly in
+        another thread, are left to them.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            await self._close_sessions()
+            session = self._sessions[loop] = self._new_session()
+        return session
+
+    async def _close_sessions(self, loop=None):
+        """Close the pooled sessions of ``loop`` and of closed loops."""
+        for owner, session in list(self._sessions.items()):
+            if owner is loop or owner.is_closed():
+                del self._sessions[owner]
+                if not session.closed:
+                    await session.close()
+
+    @asynccontextmanager
+    async def _call_session(self):
+        """
+        Yield the session for one API call: the pooled session of the
+        running loop while the client is used as an async context manager,
+        otherwise a session closed once the call is done.
+        """
+        if self._pooled:
+            yield await self._get_session()
+            return
+        session = self._new_session()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def close(self):
+        """
+        Close the pooled HTTP session of the running event loop (and those of
+        closed loops), releasing its connections, and stop background token
+        refreshes.  Sessions of loops running in other threads are left open.
+        """
+        self._token_provider.close()
+        await self._close_sessions(asyncio.get_running_loop())
+        self._pooled = bool(self._sessions)
+
     async def _query(
         self,
         path,
@@ -101,11 +244,17 @@ class ProxiML(object):
         params=None,
         data=None,
         headers=None,
-        max_retries=3,
-        backoff_factor=0.5,
+        max_retries=None,
+        backoff_factor=None,
+        retry_policy=None,
     ):
+        policy = retry_policy or self.retry_policy
+        if max_retries is not None:
+            policy = policy.replace(max_attempts=max_retries)
+        if backoff_factor is not None:
+            policy = policy.replace(initial_backoff=backoff_factor)
         try:
-            tokens = self.auth.get_tokens()
+            tokens = await self._token_provider.get_tokens()
         except ProxiMLException as e:
             raise e
         except Exception:
@@ -156,73 +305,209 @@ class ProxiML(object):
         logging.debug(
             f"Request - Url: {url}, Method: {method}, Params: {params}, Body: {data}, Headers: {headers}"
         )
-        for attempt in range(max_retries):
+        cache_key = cache_entry = None
+        if self._cache is not None and method != "GET":
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.request(
-                        method,
-                        url,
-                        data=json.dumps(data),
-                        headers=headers,
-                        params=params,
-                    ) as resp:
-                        if (resp.status // 100) in [4, 5]:
-                            if (
-                                resp.status == 502
-                                and attempt < max_retries - 1
-                            ):
-                                wait_time = (
-                                    (2**attempt)
-                                    * backoff_factor
-                                    * (random.random() + 0.5)
+                return await self._request(
+                    method,
+                    url,
+                    params,
+                    data,
+                    headers,
+                    policy,
+                    path=path,
+                )
+            finally:
+                self._cache.invalidate(path)
+        elif self._cache is not None and self._cache.ttl_for(path):
+            cache_key = (url, freeze(params))
+            cache_entry = self._cache.get(cache_key)
+            if cache_entry is not None:
+                if cache_entry.fresh:
+                    logging.debug(f"Cached response for {url}")
+                    return copy.deepcopy(cache_entry.value)
+                headers = {**headers, **cache_entry.validators}
+
+        def request():
+            return self._request(
+                method,
+                url,
+                params,
+                data,
+                headers,
+                policy,
+                path=path,
+                cache_key=cache_key,
+                cache_entry=cache_entry,
+            )
+
+        async def fetch():
+            if method == "GET" and self._hedger is not None:
+                return await self._hedger.run(request)
+            return await request()
+
+        if method == "GET" and self._singleflight is not None:
+            return await self._singleflight.do(
+                (url, freeze(params), freeze(headers)), fetch
+            )
+        return await fetch()
+
+    async def _request(
+        self,
+        method,
+        url,
+        params,
+        data,
+        headers,
+        policy,
+        path=None,
+        cache_key=None,
+        cache_entry=None,
+    ):
+        async with self._call_session() as session:
+            state = policy.start(method)
+            breaker = (
+                self._circuit_breakers.get(url)
+                if self._circuit_breakers is not None
+                else None
+            )
+            body = self.codec.encode(data)
+            stats = (
+                dict(bytes_received=0) if self._metrics is not None else None
+            )
+            with Timer(
+                self._metrics,
+                "api.request",
+                method=method,
+                path=path_template(path or urlsplit(url).path),
+            ) as timer:
+                attempts = 0
+                while True:
+                    wait_time = None
+                    throttled = False
+                    retry_after = None
+                    if breaker is not None:
+                        try:
+                            breaker.check()
+                        except CircuitOpenError as e:
+                            # New requests fail fast, but a request that is
+                            # already being retried waits for the circuit to be
+                            # probed, within its retry budget
+                            wait_time = (
+                                state.wait(e.retry_in) if attempts else None
+                            )
+                            if wait_time is None:
+                                raise
+                            logging.debug(
+                                f"Circuit for {e.host} open, retrying {method} {url} in {wait_time:.2f}s"
+                            )
+                            await asyncio.sleep(wait_time)
+                            continue
+                    if self._rate_limiter is not None:
+                        window = await self._rate_limiter.acquire()
+                    attempts += 1
+                    try:
+                        async with session.request(
+                            method,
+                            url,
+                            data=body,
+                            headers=headers,
+                            params=params,
+                            trace_request_ctx=stats,
+                        ) as resp:
+                            timer.tags["status"] = resp.status
+                            if breaker is not None:
+                                breaker.record(status=resp.status)
+                            if resp.status == 304 and cache_entry is not None:
+                                logging.debug(
+                                    f"Revalidated cached response: {url}"
                                 )
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                what = await resp.read()
-                                content_type = resp.headers.get(
-                                    "content-type", ""
+                                return copy.deepcopy(
+                                    self._cache.revalidated(
+                                        cache_key, cache_entry
+                                    )
                                 )
-                                resp.close()
-                                if content_type == "application/json":
-                                    raise ApiError(
-                                        resp.status,
-                                        json.loads(what.decode("utf8")),
+                            if resp.status in THROTTLE_STATUSES:
+                                throttled = True
+                                retry_after = parse_retry_after(
+                                    resp.headers.get("Retry-After")
+                                )
+                            if (resp.status // 100) in [4, 5]:
+                                wait_time = state.retry(
+                                    status=resp.status, retry_after=retry_after
+                                )
+                                if wait_time is None:
+                                    what = await resp.read()
+                                    content_type = resp.headers.get(
+                                        "content-type", ""
                                     )
-                                else:
-                                    raise ApiError(
-                                        resp.status,
-                                        {"message": what.decode("utf8")},
+                                    resp.close()
+                                    if content_type == "application/json":
+                                        raise ApiError(
+                                            resp.status,
+                                            self.codec.loads(what),
+                                        )
+                                    else:
+                                        raise ApiError(
+                                            resp.status,
+                                            {"message": what.decode("utf8")},
+                                        )
+                            else:
+                                results = await resp.json(
+                                    loads=self.codec.loads
+                                )
+                                if cache_key is not None:
+                                    self._cache.set(
+                                        cache_key, path, results, resp.headers
                                     )
-                        results = await resp.json()
-                        return results
-            except aiohttp.ClientResponseError as e:
-                if e.status == 502 and attempt < max_retries - 1:
-                    wait_time = (
-                        (2**attempt) * backoff_factor * (random.random() + 0.5)
+                                return results
+                    except aiohttp.ClientResponseError as e:
+                        if breaker is not None:
+                            breaker.record(error=e)
+                        wait_time = state.retry(e)
+                        if wait_time is None:
+                            raise ApiError(e.status, f"Error {e.message}")
+                    except RETRY_EXCEPTIONS as e:
+                        if breaker is not None:
+                            breaker.record_failure()
+                        wait_time = state.retry(e)
+                        if wait_time is None:
+                            raise
+                    finally:
+                        if self._rate_limiter is not None:
+                            self._rate_limiter.release(
+                                throttled, retry_after, window
+                            )
+                        if stats is not None:
+                            timer.add("api.request.attempts", attempts)
+                            timer.add(
+                                "api.request.bytes_sent", len(body) * attempts
+                            )
+                            timer.add(
+                                "api.request.bytes_received",
+                                stats["bytes_received"],
+                            )
+                    logging.debug(
+                        f"Retrying {method} {url} in {wait_time:.2f}s (attempt {state.attempt})"
                     )
                     await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    raise ApiError(e.status, f"Error {e.message}")
-
-        raise ProxiMLException("Unexpected API failure")
 
     async def _ws_subscribe(self, entity, project_uuid, id, msg_handler):
         headers = {
             "User-Agent": f"proxiML-sdk/{self._version}",
             "Content-Type": "application/json",
         }
+        started = time.monotonic()
         try:
             try:
-                tokens = self.auth.get_tokens()
+                tokens = await self._token_provider.get_tokens()
             except ProxiMLException as e:
                 raise e
             except Exception:
                 raise ProxiMLException(
                     f"Error getting authorization tokens.  Verify configured credentials. Error: {traceback.format_exc()}"
                 )
-            async with aiohttp.ClientSession() as session:
+            async with self._call_session() as session:
                 done = False
                 async with session.ws_connect(
                     f"wss://{self.ws_url}?Authorization={tokens.get('id_token')}",
@@ -239,7 +524,8 @@ class ProxiML(object):
                                     id=id,
                                     project_uuid=project_uuid,
                                 ),
-                            )
+                            ),
+                            dumps=self.codec.dumps,
                         )
                     )
                     asyncio.create_task(
@@ -252,7 +538,8 @@ class ProxiML(object):
                                     id=id,
                                     project_uuid=project_uuid,
                                 ),
-                            )
+                            ),
+                            dumps=self.codec.dumps,
                         )
                     )
                     async for msg in ws:
@@ -266,7 +553,13 @@ class ProxiML(object):
                             )
                             await ws.close()
                             break
-                        data = json.loads(msg.data)
+                        record(
+                            self._metrics,
+                            "ws.message",
+                            len(msg.data),
+                            entity=entity,
+                        )
+                        data = self.codec.loads(msg.data)
                         if data.get("type") == "end":
                             done = True
                             asyncio.create_task(delayed_close(ws))
@@ -276,7 +569,7 @@ class ProxiML(object):
 
                 connection_tries = 0
                 while not done:
-                    tokens = self.auth.get_tokens()
+                    tokens = await self._token_provider.get_tokens()
                     try:
                         async with session.ws_connect(
                             f"wss://{self.ws_url}?Authorization={tokens.get('id_token')}",
@@ -293,7 +586,8 @@ class ProxiML(object):
                                             id=id,
                                             project_uuid=project_uuid,
                                         ),
-                                    )
+                                    ),
+                                    dumps=self.codec.dumps,
                                 )
                             )
                             async for msg in ws:
@@ -307,7 +601,13 @@ class ProxiML(object):
                                     )
                                     await ws.close()
                                     break
-                                data = json.loads(msg.data)
+                                record(
+                                    self._metrics,
+                                    "ws.message",
+                                    len(msg.data),
+                                    entity=entity,
+                                )
+                                data = self.codec.loads(msg.data)
                                 if data.get("type") == "end":
                                     done = True
                                     asyncio.create_task(delayed_close(ws))
@@ -337,6 +637,13 @@ class ProxiML(object):
             # Re-raise CancelledError to properly propagate task cancellation
             logging.debug("Websocket subscription task cancelled")
             raise
+        finally:
+            record(
+                self._metrics,
+                "ws.subscribe",
+                time.monotonic() - started,
+                entity=entity,
+            )
 
     def set_active_project(self, project_uuid):
         CONFIG_DIR = os.path.expanduser(
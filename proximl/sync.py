@@ -0,0 +1,248 @@
+import asyncio
+import inspect
+import threading
+import functools
+
+from proximl.exceptions import ProxiMLException
+from proximl.proximl import ProxiML as AsyncProxiML
+
+
+class EventLoopThread(object):
+    """
+    Event loop running in a background daemon thread.
+
+    Coroutines can be submitted from any other thread, which blocks until
+    their result is available.
+
+    Args:
+        name: Name of the thread
+    """
+
+    def __init__(self, name="proximl-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def closed(self) -> bool:
+        return self.loop.is_closed()
+
+    def run(self, coro, timeout=None):
+        """
+        Run a coroutine on the loop and return its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result, or None to wait forever
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            ProxiMLException: If the loop is closed or the call is made from
+                              the loop thread itself, which would deadlock
+        """
+        if self.closed:
+            coro.close()
+            raise ProxiMLException("Client is closed.")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise ProxiMLException(
+                "Synchronous client methods cannot be called from its own "
+                "event loop. Use the async client instead."
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self, final=None):
+        """
+        Stop the loop and its thread.
+
+        Args:
+            final: Coroutine function run on the loop before it is stopped
+        """
+        if self.closed:
+            return
+
+        async def shutdown():
+            if final is not None:
+                await final()
+            pending = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self.loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+
+
+class SyncProxy(object):
+    """
+    Synchronous view of an SDK object.
+
+    Coroutines returned by its methods are run on the event loop thread and
+    their results returned instead.  SDK objects in results (jobs, datasets,
+    subsystems, ...) are wrapped in turn, and async iterators such as
+    ``jobs.iter()`` become plain iterators.  Other attributes are returned
+    unchanged.
+
+    Args:
+        target: Async SDK object
+        loop_thread: EventLoopThread running its coroutines
+    """
+
+    def __init__(self, target, loop_thread):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_loop_thread", loop_thread)
+
+    def _wrap(self, value):
+        if inspect.iscoroutine(value):
+            return self._wrap(self._loop_thread.run(value))
+        if inspect.isawaitable(value):
+            return self._wrap(self._loop_thread.run(_awaited(value)))
+        if hasattr(value, "__aiter__"):
+            return self._iterate(value)
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self._wrap(item) for item in value)
+        if (
+            type(value).__module__.startswith("proximl.")
+            and not isinstance(value, (BaseException, type))
+            and not callable(value)
+        ):
+            return SyncProxy(value, self._loop_thread)
+        return value
+
+    def _iterate(self, iterable):
+        iterator = iterable.__aiter__()
+        try:
+            while True:
+                try:
+                    item = self._loop_thread.run(
+                        _awaited(iterator.__anext__())
+                    )
+                except StopAsyncIteration:
+                    return
+                yield self._wrap(item)
+        finally:
+            if hasattr(iterator, "aclose") and not self._loop_thread.closed:
+                self._loop_thread.run(iterator.aclose())
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if inspect.ismethod(value) or inspect.iscoroutinefunction(value):
+
+            @functools.wraps(value)
+            def method(*args, **kwargs):
+                args = [_unwrap(arg) for arg in args]
+                kwargs = {key: _unwrap(arg) for key, arg in kwargs.items()}
+                return self._wrap(value(*args, **kwargs))
+
+            return method
+        return self._wrap(value)
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, _unwrap(value))
+
+    def __dir__(self):
+        return dir(self._target)
+
+    def __str__(self):
+        return str(self._target)
+
+    def __repr__(self):
+        return repr(self._target)
+
+    def __bool__(self):
+        return bool(self._target)
+
+    def __eq__(self, other):
+        return self._target == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+
+async def _awaited(awaitable):
+    return await awaitable
+
+
+def _unwrap(value):
+    if isinstance(value, SyncProxy):
+        return object.__getattribute__(value, "_target")
+    return value
+
+
+class ProxiML(SyncProxy):
+    """
+    Synchronous proxiML client, for code that does not use asyncio.
+
+    The async ProxiML client is created with the same arguments and owned by
+    a background event loop thread, so that its connection pool and tokens
+    are shared by every call.  Methods have the same names and arguments as
+    the async client but block until the result is available, and can be
+    called from any thread, including from inside a running event loop such
+    as a notebook.
+
+    ```
+    with proximl.sync.ProxiML() as proximl_client:
+        for job in proximl_client.jobs.list():
+            print(job.name, job.status)
+    ```
+
+    Call ``close`` (or use the client as a context manager) to release its
+    connections and stop the thread.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(AsyncProxiML(**kwargs), EventLoopThread())
+        # Opened on the background loop, so every call shares its pool
+        self._loop_thread.run(self._target.__aenter__())
+
+    @property
+    def client(self) -> AsyncProxiML:
+        """The underlying async client."""
+        return self._target
+
+    def run(self, coro, timeout=None):
+        """
+        Run a coroutine of the async client on the background loop.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result, or None to wait forever
+
+        Returns:
+            Result of the coroutine
+        """
+        return self._loop_thread.run(coro, timeout)
+
+    def close(self):
+        """Close the async client and stop the background loop."""
+        self._loop_thread.close(self._target.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
@@ -187,17 +187,29 @@ import hashlib
 import hmac
 import re
 import json
-import requests
 import logging
+import threading
 import time
 from datetime import datetime
 
-import boto3
 import os
 import six
-from jose import jwt
 
-from proximl.exceptions import ProxiMLException
+from proximl.exceptions import CognitoError, ProxiMLException
+from proximl.utils.cognito import CognitoIdpClient
+from proximl.utils.lazy import LazyModule
+from proximl.utils.jwks import JwksCache, JWKS_CACHE_FILE
+from proximl.utils.token_cache import (
+    TokenCache,
+    TOKEN_CACHE_FILE,
+    write_private_json,
+)
+
+# Optional, only imported when selected with cognito_client="boto3"
+boto3 = LazyModule("boto3")
+# Only needed to sign in and verify tokens, not when cached tokens are used
+jwt = LazyModule("jose.jwt")
+requests = LazyModule("requests")
 
 # https://github.com/aws/amazon-cognito-identity-js/blob/master/src/AuthenticationHelper.js#L22
 n_hex = (
@@ -223,6 +235,19 @@ g_hex = "2"
 info_bits = bytearray("Caldera Derived Key", "utf-8")
 
 
+def cognito_error_code(error):
+    """
+    Return the Cognito error code of a CognitoError or of a boto3
+    ClientError, or None for other errors.
+    """
+    if isinstance(error, CognitoError):
+        return error.code
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code")
+    return None
+
+
 def hash_sha256(buf):
     """AuthenticationHelper.hash"""
     a = hashlib.sha256(buf).hexdigest()
@@ -313,11 +338,7 @@ class AWSSRP(object):
         self.pool_id = pool_id
         self.client_id = client_id
         self.client_secret = client_secret
-        self.client = (
-            client
-            if client
-            else boto3.client("cognito-idp", region_name=pool_region)
-        )
+        self.client = client if client else CognitoIdpClient(pool_region)
         self.big_n = hex_to_long(n_hex)
         self.g = hex_to_long(g_hex)
         self.k = hex_to_long(hex_hash("00" + n_hex + "0" + g_hex))
@@ -507,6 +528,52 @@ class AWSSRP(object):
             )
 
 
+AUTH_CONFIG_FILE = "auth_config.json"  # Discovered settings cache file
+AUTH_CONFIG_TTL = 86400  # Seconds discovered settings are reused for
+# Auth settings and the auth-config.json fields providing their defaults
+AUTH_CONFIG_FIELDS = dict(
+    region="region",
+    client_id="userPoolSDKClientId",
+    pool_id="userPoolId",
+)
+
+
+def get_auth_config(domain_suffix, path=None, ttl=AUTH_CONFIG_TTL):
+    """
+    Return the auth settings published by the proxiML web app.
+
+    Args:
+        domain_suffix: Domain of the proxiML environment
+        path: File caching the settings per domain, or None
+        ttl: Seconds a cached copy is used for
+
+    Returns:
+        dict parsed from ``/.well-known/auth-config.json``
+    """
+    stored = dict()
+    if path is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                stored = json.load(file)
+            entry = stored[domain_suffix]
+            if time.time() - float(entry["fetched"]) <= ttl:
+                return entry["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if not isinstance(stored, dict):
+            stored = dict()
+    config = requests.get(
+        "https://app.{}/.well-known/auth-config.json".format(domain_suffix)
+    ).json()
+    if path is not None:
+        stored[domain_suffix] = dict(fetched=time.time(), config=config)
+        try:
+            write_private_json(path, stored)
+        except OSError as e:
+            logging.debug(f"Unable to write auth config {path}: {e}")
+    return config
+
+
 class Auth(object):
     def __init__(self, config_dir, domain_suffix="proximl.ai", **kwargs):
         try:
@@ -516,28 +583,17 @@ class Auth(object):
         except:
             env = dict()
 
-        auth_defaults = requests.get(
-            "https://app.{}/.well-known/auth-config.json".format(domain_suffix)
-        ).json()
-
-        self.region = (
-            kwargs.get("region")
-            or os.environ.get("PROXIML_REGION")
-            or env.get("region")
-            or auth_defaults.get("region")
-        )
-        self.client_id = (
-            kwargs.get("client_id")
-            or os.environ.get("PROXIML_CLIENT_ID")
-            or env.get("client_id")
-            or auth_defaults.get("userPoolSDKClientId")
-        )
-        self.pool_id = (
-            kwargs.get("pool_id")
-            or os.environ.get("PROXIML_POOL_ID")
-            or env.get("pool_id")
-            or auth_defaults.get("userPoolId")
-        )
+        self._domain_suffix = domain_suffix
+        self._cognito_client = kwargs.get("cognito_client")
+        # Settings that are not configured are discovered on first use
+        for name in AUTH_CONFIG_FIELDS:
+            value = (
+                kwargs.get(name)
+                or os.environ.get(f"PROXIML_{name.upper()}")
+                or env.get(name)
+            )
+            if value:
+                setattr(self, name, value)
 
         try:
             with open(f"{config_dir}/credentials.json", "r") as file:
@@ -558,11 +614,57 @@ class Auth(object):
         )
         if not self.username or not self.password:
             raise ProxiMLException("proxiML credentials not found.")
-        self.client = boto3.client("cognito-idp", region_name=self.region)
         self.id_token = None
         self.access_token = None
         self.refresh_token = None
         self.expires = 0
+        token_cache = kwargs.get("token_cache")
+        if token_cache is None:
+            token_cache = TokenCache(f"{config_dir}/{TOKEN_CACHE_FILE}")
+        self.token_cache = token_cache or None
+        self._lock = threading.Lock()
+
+    def _cache_path(self, file_name):
+        if not self.token_cache:
+            return None
+        return os.path.join(os.path.dirname(self.token_cache.path), file_name)
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set: settings left to
+        # discovery and clients created on first use.
+        if name in AUTH_CONFIG_FIELDS:
+            config = get_auth_config(
+                self._domain_suffix, path=self._cache_path(AUTH_CONFIG_FILE)
+            )
+            for setting, field in AUTH_CONFIG_FIELDS.items():
+                if setting not in self.__dict__:
+                    setattr(self, setting, config.get(field))
+            return self.__dict__[name]
+        if name == "client":
+            if self._cognito_client == "boto3":
+                try:
+                    self.client = boto3.client(
+                        "cognito-idp", region_name=self.region
+                    )
+                except ImportError:
+                    raise ProxiMLException(
+                        "cognito_client='boto3' requires the boto3 package."
+                    )
+            else:
+                self.client = self._cognito_client or CognitoIdpClient(
+                    self.region
+                )
+            return self.client
+        if name == "jwks":
+            self.jwks = JwksCache(
+                self.get_keys,
+                path=self._cache_path(JWKS_CACHE_FILE),
+                source=f"{self.region}/{self.pool_id}",
+            )
+            return self.jwks
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def get_keys(self):
         pool_jwk = requests.get(
@@ -573,9 +675,10 @@ class Auth(object):
         return pool_jwk
 
     def get_key(self, kid):
-        keys = self.get_keys().get("keys")
-        key = list(filter(lambda x: x.get("kid") == kid, keys))
-        return key[0]
+        key = self.jwks.get(kid)
+        if key is None:
+            raise ProxiMLException(f"Unknown token signing key: {kid}")
+        return key
 
     def verify_token(self, token, id_name):
         kid = jwt.get_unverified_header(token).get("kid")
@@ -602,14 +705,51 @@ class Auth(object):
             client=self.client,
         )
         tokens = aws.authenticate_user()
-        refresh_token = tokens["AuthenticationResult"]["RefreshToken"]
+        self._set_tokens(tokens)
+
+    def refresh_tokens(self):
+        """
+        Renew the id and access tokens with the refresh token.
+
+        Raises:
+            ProxiMLException: If there is no refresh token or the refreshed
+                              id token fails verification
+            CognitoError: If the refresh token is rejected
+        """
+        if not self.refresh_token:
+            raise ProxiMLException("No refresh token available.")
+        tokens = self.client.initiate_auth(
+            AuthFlow="REFRESH_TOKEN_AUTH",
+            AuthParameters={"REFRESH_TOKEN": self.refresh_token},
+            ClientId=self.client_id,
+        )
+        self._set_tokens(tokens)
+
+    def _renew_tokens(self):
+        if self.refresh_token:
+            try:
+                self.refresh_tokens()
+                return
+            except Exception as e:
+                # Only a rejected (expired or revoked) refresh token calls
+                # for signing in again, other failures would fail it too
+                if cognito_error_code(e) != "NotAuthorizedException":
+                    raise
+                logging.debug(f"Refresh token rejected, signing in again: {e}")
+        self.get_new_tokens()
+
+    def _set_tokens(self, tokens):
+        # REFRESH_TOKEN_AUTH responses do not include a new refresh token
+        refresh_token = tokens["AuthenticationResult"].get(
+            "RefreshToken", self.refresh_token
+        )
         id_verify = self.verify_token(
             tokens["AuthenticationResult"]["IdToken"], "id_token"
         )
         logging.debug(f"ID Token Verification: {id_verify}")
-        if id_verify:
-            id_token = tokens["AuthenticationResult"]["IdToken"]
-            self.id_token = id_token
+        if not id_verify:
+            raise ProxiMLException("ID token failed verification.")
+        self.id_token = tokens["AuthenticationResult"]["IdToken"]
 
         access_verify = self.verify_token(
             tokens["AuthenticationResult"]["AccessToken"], "access_token"
@@ -624,18 +764,57 @@ class Auth(object):
             id_verify.get("exp") - 300
         )  ## prevent just about to expire tokens from being used
 
-    def get_tokens(self):
-        logging.debug(f"Token expires: {self.expires}")
-        logging.debug(f"Token is expired: {self.expires < time.time()}")
-        if not self.id_token:
-            self.get_new_tokens()
-        elif self.expires < time.time():
-            self.get_new_tokens()
-        logging.debug(f"New token expires: {self.expires}")
-
+    def _tokens(self):
         return dict(
             id_token=self.id_token,
             access_token=self.access_token,
             refresh_token=self.refresh_token,
             expires=self.expires,
         )
+
+    def _refresh_cached_tokens(self, min_valid=0):
+        key = TokenCache.key(self.pool_id, self.client_id, self.username)
+        with self.token_cache.lock():
+            # Another process may have refreshed the tokens while this one
+            # waited for the lock.
+            tokens = self.token_cache.get(key, min_valid)
+            if tokens:
+                logging.debug("Using cached tokens")
+                self.id_token = tokens.get("id_token")
+                self.access_token = tokens.get("access_token")
+                self.refresh_token = tokens.get("refresh_token")
+                self.expires = tokens.get("expires")
+                return
+            if not self.refresh_token:
+                # The refresh token of an expired entry is still usable
+                expired = self.token_cache.load().get(key)
+                if isinstance(expired, dict):
+                    self.refresh_token = expired.get("refresh_token")
+            self._renew_tokens()
+            self.token_cache.set(key, self._tokens())
+
+    def get_tokens(self, min_valid=0):
+        """
+        Return the current tokens, renewing them if they have expired.
+
+        This makes blocking network calls; use TokenProvider from
+        coroutines.  Safe to call from multiple threads.
+
+        Args:
+            min_valid: Also renew tokens expiring within this many seconds
+
+        Returns:
+            dict with ``id_token``, ``access_token``, ``refresh_token`` and
+            ``expires``
+        """
+        with self._lock:
+            logging.debug(f"Token expires: {self.expires}")
+            logging.debug(f"Token is expired: {self.expires < time.time()}")
+            if not self.id_token or self.expires < time.time() + min_valid:
+                if self.token_cache:
+                    self._refresh_cached_tokens(min_valid)
+                else:
+                    self._renew_tokens()
+            logging.debug(f"New token expires: {self.expires}")
+
+            return self._tokens()
@@ -0,0 +1,146 @@
+import re
+import copy
+import time
+import logging
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256  # Max responses held before LRU eviction
+# Read-mostly endpoints and how long (seconds) their responses stay fresh
+DEFAULT_TTLS = {
+    r"/job/environments": 3600,
+    r"/project": 60,
+    r"/project/[^/]+/gputypes": 300,
+    r"/provider": 300,
+    r"/provider/[^/]+": 300,
+    r"/provider/[^/]+/region": 300,
+    r"/provider/[^/]+/region/[^/]+": 300,
+}
+
+
+class CacheEntry(object):
+    def __init__(self, path, value, expires, etag=None, last_modified=None):
+        self.path = path
+        self.value = value
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires > time.monotonic()
+
+    @property
+    def validators(self) -> dict:
+        """Conditional request headers to revalidate this entry."""
+        headers = dict()
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """
+    Size-bounded LRU cache of parsed API responses with per-path TTLs.
+
+    Only GET responses for paths matching one of the configured TTL patterns
+    are cached.  Expired entries are kept until evicted so that they can be
+    revalidated with the ``ETag``/``Last-Modified`` validators the server
+    returned.  Any write to a path invalidates cached entries on the same
+    resource, its parents and its children.
+
+    Args:
+        ttls: Mapping of path regular expression to TTL in seconds.
+              Defaults to DEFAULT_TTLS.
+        max_entries: Maximum number of responses to keep
+    """
+
+    def __init__(self, ttls=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self._ttls = [
+            (re.compile(f"^{pattern}$"), ttl)
+            for pattern, ttl in (
+                DEFAULT_TTLS if ttls is None else ttls
+            ).items()
+        ]
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, path):
+        """Return the TTL for ``path``, or 0 if it should not be cached."""
+        for pattern, ttl in self._ttls:
+            if pattern.match(path):
+                return ttl
+        return 0
+
+    def get(self, key):
+        """
+        Look up a cached entry.
+
+        Returns:
+            The CacheEntry (which may be stale) or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.fresh:
+            self.hits += 1
+        return entry
+
+    def set(self, key, path, value, headers=None):
+        ttl = self.ttl_for(path)
+        if not ttl:
+            return
+        headers = headers or dict()
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        self._entries[key] = CacheEntry(
+            path,
+            copy.deepcopy(value),
+            time.monotonic() + ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logging.debug(f"Evicted cached response: {evicted}")
+
+    def revalidated(self, key, entry):
+        """
+        Mark a stale entry as fresh again after a 304 Not Modified response.
+
+        Returns:
+            The cached value
+        """
+        entry.expires = time.monotonic() + self.ttl_for(entry.path)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self.revalidations += 1
+        return entry.value
+
+    def invalidate(self, path):
+        """Drop cached entries on ``path``, its parents and its children."""
+        path = path.rstrip("/")
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.path == path
+            or path.startswith(f"{entry.path}/")
+            or entry.path.startswith(f"{path}/")
+        ]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logging.debug(f"Invalidated {len(stale)} cached responses")
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,183 @@
+import time
+import asyncio
+import logging
+import functools
+import aiohttp
+from urllib.parse import urlsplit
+
+from proximl.exceptions import CircuitOpenError
+
+DEFAULT_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+DEFAULT_RECOVERY_TIMEOUT = 30  # Seconds before an open circuit is probed
+# Responses indicating the host is down.  429 and 503 are not failures:
+# the API sends them to throttle clients (see rate_limit.THROTTLE_STATUSES)
+# and answers again once they have backed off.
+FAILURE_STATUSES = {
+    500,
+    502,
+    504,
+}
+# Errors indicating the host is unreachable or not responding
+FAILURE_EXCEPTIONS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_failure(error=None, status=None):
+    """Return True if a request outcome counts against the host."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        status = error.status
+    elif error is not None:
+        return isinstance(error, FAILURE_EXCEPTIONS)
+    return status in FAILURE_STATUSES
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker for a single host.
+
+    The circuit opens after ``failure_threshold`` consecutive failures.
+    While it is open, requests fail immediately with CircuitOpenError.  Once
+    ``recovery_timeout`` seconds have passed the circuit is half-open: the
+    next request is let through as a probe while others keep failing fast.
+    A successful probe closes the circuit; a failed one keeps it open for
+    another ``recovery_timeout``.
+
+    Args:
+        host: Host the circuit protects
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds to wait before probing an open circuit
+    """
+
+    def __init__(
+        self,
+        host,
+        failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout=DEFAULT_RECOVERY_TIMEOUT,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self.retry_in > 0:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a probe request through."""
+        if self._opened_at is None:
+            return 0.0
+        return max(
+            0.0, self._opened_at + self.recovery_timeout - time.monotonic()
+        )
+
+    def check(self):
+        """
+        Allow or reject a request to the host.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        state = self.state
+        if state == OPEN:
+            raise CircuitOpenError(self.host, self.retry_in)
+        if state == HALF_OPEN:
+            # Let this request through as the probe and fail the others
+            # fast until it completes or another recovery_timeout passes.
+            logging.debug(f"Probing circuit for {self.host}")
+            self._opened_at = time.monotonic()
+
+    def record_success(self):
+        """Record that the host responded."""
+        if self._opened_at is not None:
+            logging.info(f"Circuit for {self.host} closed")
+        self.failures = 0
+        self._opened_at = None
+
+    def record_failure(self):
+        """Record that the host failed or could not be reached."""
+        self.failures += 1
+        if self._opened_at is not None:
+            self._opened_at = time.monotonic()
+        elif self.failures >= self.failure_threshold:
+            logging.warning(
+                f"Circuit for {self.host} opened after {self.failures} consecutive failures"
+            )
+            self._opened_at = time.monotonic()
+            self.trips += 1
+
+    def record(self, error=None, status=None):
+        """Record a request outcome given its exception or HTTP status."""
+        if is_failure(error, status):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def wrap(self, func):
+        """
+        Guard a coroutine function with this circuit.
+
+        Each call is checked against the circuit before it starts and its
+        outcome is recorded when it completes.
+        """
+
+        @functools.wraps(func)
+        async def guarded(*args, **kwargs):
+            self.check()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self.record(error=e)
+                raise
+            self.record_success()
+            return result
+
+        return guarded
+
+
+class CircuitBreakers(object):
+    """
+    Circuit breakers keyed by host.
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit
+        recovery_timeout: Seconds to wait before probing an open circuit
+    """
+
+    def __init__(
+        self,
+        failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout=DEFAULT_RECOVERY_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers = dict()
+
+    def get(self, url):
+        """Return the circuit breaker for the host of ``url``."""
+        host = urlsplit(url).netloc or url
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+            )
+        return breaker
+
+    def clear(self):
+        self._breakers.clear()
@@ -0,0 +1,100 @@
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec(object):
+    """
+    Standard library JSON codec.
+
+    Codecs expose ``dumps`` (object to ``str``, for websocket frames),
+    ``encode`` (object to ``bytes``, for request bodies) and ``loads``
+    (``str`` or ``bytes`` to object, for responses and websocket frames).
+    """
+
+    name = "json"
+
+    def dumps(self, obj) -> str:
+        return json.dumps(obj)
+
+    def encode(self, obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def dumps(self, obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def encode(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def dumps(self, obj) -> str:
+        return ujson.dumps(obj, ensure_ascii=False)
+
+    def encode(self, obj) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+CODECS = {
+    "orjson": (OrjsonCodec, lambda: orjson is not None),
+    "ujson": (UjsonCodec, lambda: ujson is not None),
+    "json": (JsonCodec, lambda: True),
+}
+
+
+def get_codec(codec=None):
+    """
+    Resolve the JSON codec to use for API bodies and websocket frames.
+
+    Args:
+        codec: Codec instance, codec name (``orjson``, ``ujson`` or
+               ``json``), or None to pick the fastest installed codec
+
+    Returns:
+        JsonCodec instance
+
+    Raises:
+        ValueError: If the named codec is unknown or not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        for name, (codec_class, available) in CODECS.items():
+            if available():
+                logging.debug(f"Using {name} JSON codec")
+                return codec_class()
+    if codec not in CODECS:
+        raise ValueError(
+            f"Unknown JSON codec {codec}.  Valid codecs are: {list(CODECS)}"
+        )
+    codec_class, available = CODECS[codec]
+    if not available():
+        raise ValueError(f"JSON codec {codec} is not installed")
+    return codec_class()
@@ -0,0 +1,70 @@
+import json
+import threading
+
+from proximl.exceptions import CognitoError
+from proximl.utils.lazy import LazyModule
+
+requests = LazyModule("requests")
+
+DEFAULT_TIMEOUT = 30  # Seconds to wait for a Cognito response
+TARGET_PREFIX = "AWSCognitoIdentityProviderService."
+
+
+class CognitoIdpClient(object):
+    """
+    Minimal client for the Cognito user pool operations used to sign in.
+
+    Implements ``initiate_auth`` and ``respond_to_auth_challenge`` with the
+    same arguments and responses as boto3's ``cognito-idp`` client.  These
+    operations are authenticated by their parameters rather than by AWS
+    credentials, so requests are plain JSON posts and boto3 is not needed.
+    Connections are reused through a requests Session.
+
+    Args:
+        region_name: AWS region of the user pool
+        timeout: Seconds to wait for a response
+    """
+
+    def __init__(self, region_name, timeout=DEFAULT_TIMEOUT):
+        self.region_name = region_name
+        self.endpoint = f"https://cognito-idp.{region_name}.amazonaws.com/"
+        self.timeout = timeout
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _call(self, operation, params):
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+        response = self._session.post(
+            self.endpoint,
+            data=json.dumps(params),
+            headers={
+                "Content-Type": "application/x-amz-json-1.1",
+                "X-Amz-Target": f"{TARGET_PREFIX}{operation}",
+            },
+            timeout=self.timeout,
+        )
+        try:
+            data = response.json()
+        except ValueError:
+            data = dict()
+        if response.status_code != 200:
+            # Error types look like "...#NotAuthorizedException"
+            code = (data.get("__type") or "").rsplit("#", 1)[-1]
+            raise CognitoError(
+                code or f"HTTP {response.status_code}",
+                data.get("message") or data.get("Message") or response.text,
+            )
+        return data
+
+    def initiate_auth(self, **kwargs):
+        return self._call("InitiateAuth", kwargs)
+
+    def respond_to_auth_challenge(self, **kwargs):
+        return self._call("RespondToAuthChallenge", kwargs)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
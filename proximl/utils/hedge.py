@@ -0,0 +1,132 @@
+import time
+import asyncio
+import logging
+from collections import deque
+
+DEFAULT_PERCENTILE = 95  # Latency percentile after which a hedge is sent
+DEFAULT_BUDGET = 0.05  # Max fraction of requests that may be hedged
+DEFAULT_BURST = 10  # Max hedges that may be sent in a row from saved budget
+DEFAULT_INITIAL_DELAY = 1.0  # Hedge delay (seconds) until enough samples
+DEFAULT_MIN_DELAY = 0.05  # Lower bound (seconds) for the hedge delay
+DEFAULT_WINDOW = 256  # Recent latencies kept to compute the percentile
+MIN_SAMPLES = 20  # Latencies needed before the percentile is used
+
+
+class Hedger(object):
+    """
+    Hedge slow requests with a second identical request.
+
+    If a request has not completed once the configured percentile of recent
+    request latencies has elapsed, an identical request is sent and the
+    first one to succeed is used; the other is cancelled.  At most
+    ``budget`` of all requests are hedged, so hedging cannot double the
+    load on the API.  The budget is a token bucket: every request adds
+    ``budget`` to it, up to ``burst``, and every hedge takes one, so budget
+    saved during a long healthy run cannot be spent hedging every request
+    once the API slows down.  Only use this for idempotent requests.
+
+    Args:
+        percentile: Latency percentile (0-100) used as the hedge delay
+        budget: Maximum fraction of requests that may be hedged
+        burst: Maximum number of hedges the saved budget allows in a row
+        delay: Fixed hedge delay in seconds instead of the percentile
+        initial_delay: Hedge delay until MIN_SAMPLES latencies are recorded
+        min_delay: Lower bound for the hedge delay
+        window: Number of recent latencies kept
+    """
+
+    def __init__(
+        self,
+        percentile=DEFAULT_PERCENTILE,
+        budget=DEFAULT_BUDGET,
+        burst=DEFAULT_BURST,
+        delay=None,
+        initial_delay=DEFAULT_INITIAL_DELAY,
+        min_delay=DEFAULT_MIN_DELAY,
+        window=DEFAULT_WINDOW,
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self._credit = 0.0  # Hedges allowed by the budget, while positive
+        self.fixed_delay = delay
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self._latencies = deque(maxlen=window)
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+
+    def delay(self):
+        """Seconds to wait for a response before sending a hedge."""
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        if len(self._latencies) < MIN_SAMPLES:
+            return self.initial_delay
+        latencies = sorted(self._latencies)
+        index = min(
+            len(latencies) - 1,
+            int(len(latencies) * self.percentile / 100),
+        )
+        return max(self.min_delay, latencies[index])
+
+    def record(self, latency):
+        self._latencies.append(latency)
+
+    def _can_hedge(self):
+        return self._credit > 0
+
+    async def _timed(self, func):
+        start = time.monotonic()
+        result = await func()
+        self.record(time.monotonic() - start)
+        return result
+
+    async def run(self, func):
+        """
+        Await ``func()``, hedging it with a second call if it is slow.
+
+        Args:
+            func: Callable returning a new awaitable for each call
+
+        Returns:
+            The result of the first call to succeed
+        """
+        self.requests += 1
+        self._credit = min(self.burst, self._credit + self.budget)
+        primary = asyncio.ensure_future(self._timed(func))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if not done and self._can_hedge():
+                self.fired += 1
+                self._credit -= 1
+                logging.debug("Request slow, sending hedged request")
+                tasks.append(asyncio.ensure_future(self._timed(func)))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in tasks:
+                    if (
+                        task in done
+                        and not task.cancelled()
+                        and task.exception() is None
+                    ):
+                        if task is not primary:
+                            self.won += 1
+                        return task.result()
+                if not pending:
+                    # Every request failed, report the original failure
+                    return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Retrieve the error of the losing request so it is not
+                    # reported as never retrieved.
+                    task.exception()
@@ -0,0 +1,227 @@
+import os
+import re
+import logging
+
+IGNORE_FILE = ".proximlignore"  # Ignore file name in an uploaded directory
+
+
+def _translate(pattern):
+    """Translate the body of a gitignore pattern to a regular expression."""
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")  # Zero or more directories
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == n:
+            parts.append("/.*")  # Everything inside
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                chars = pattern[i + 1 : end].replace("\\", "\\\\")
+                if chars[0] in "!^":
+                    chars = "^" + chars[1:]
+                parts.append(f"[{chars}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return "".join(parts)
+
+
+class IgnoreRule(object):
+    """
+    A single pattern in gitignore syntax.
+
+    Args:
+        pattern: Pattern, without its ``!`` prefix
+        negated: True if the pattern re-includes what it matches
+    """
+
+    def __init__(self, pattern, negated=False):
+        self.pattern = pattern
+        self.negated = negated
+        self.directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # Patterns with a slash other than a trailing one are relative to
+        # the root, others match at any depth
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        body = _translate(pattern)
+        self.regex = re.compile(
+            body if anchored else f"(?:.*/)?{body}", re.DOTALL
+        )
+        # Path components of an anchored pattern, None for those with a
+        # ``**``, which may span several components
+        self.segments = None
+        if anchored:
+            self.segments = [
+                None if "**" in segment else re.compile(_translate(segment))
+                for segment in pattern.split("/")
+            ]
+
+    def match(self, relpath, is_dir) -> bool:
+        if self.directory_only and not is_dir:
+            return False
+        return self.regex.fullmatch(relpath) is not None
+
+    def match_inside(self, relpath) -> bool:
+        """
+        Return False if no path inside the directory ``relpath`` (nor the
+        directory itself) can match, True if one may.
+        """
+        if self.segments is None:
+            return True  # Matches at any depth
+        for part, segment in zip(relpath.split("/"), self.segments):
+            if segment is None:
+                return True
+            if segment.fullmatch(part) is None:
+                return False
+        return True
+
+
+class IgnoreRules(object):
+    """
+    Ordered patterns in gitignore syntax, as found in a ``.gitignore`` file.
+
+    The last pattern matching a path decides: a path matches if that
+    pattern is not negated with ``!``.  Blank lines and lines starting with
+    ``#`` are ignored, ``\\#`` and ``\\!`` escape a leading ``#`` or ``!``,
+    a trailing ``/`` only matches directories, and ``*``, ``?``, ``[...]``
+    and ``**`` have their gitignore meanings.  Paths are POSIX paths
+    relative to the root directory.
+
+    Args:
+        lines: Pattern lines
+    """
+
+    def __init__(self, lines=()):
+        self.rules = []
+        for line in lines:
+            line = line.rstrip("\n")
+            if line.endswith(" ") and not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            elif line.startswith(("\\#", "\\!")):
+                line = line[1:]
+            if line:
+                self.rules.append(IgnoreRule(line, negated))
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Read the patterns of an ignore file.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            return cls(file.read().splitlines())
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def __add__(self, other):
+        rules = IgnoreRules()
+        rules.rules = self.rules + other.rules
+        return rules
+
+    def match(self, relpath, is_dir) -> bool:
+        """Return True if the last matching pattern is not negated."""
+        matched = False
+        for rule in self.rules:
+            if rule.negated == matched and rule.match(relpath, is_dir):
+                matched = not rule.negated
+        return matched
+
+    def match_tree(self, relpath, is_dir) -> bool:
+        """Return True if the path or a parent directory matches."""
+        parts = relpath.split("/")
+        for depth in range(1, len(parts)):
+            if self.match("/".join(parts[:depth]), True):
+                return True
+        return self.match(relpath, is_dir)
+
+    def match_inside(self, relpath) -> bool:
+        """
+        Return False if no path inside the directory ``relpath`` can match
+        (see ``match_tree``), True if one may.
+        """
+        # Negated patterns only exclude paths, they cannot add any
+        return any(
+            rule.match_inside(relpath)
+            for rule in self.rules
+            if not rule.negated
+        )
+
+
+def archive_filter(path, include=None, exclude=None, filter=None):
+    """
+    Return the TarStream filter selecting the entries of a directory to
+    upload, or None if every entry is uploaded.
+
+    Entries matching the patterns of the directory's IGNORE_FILE or of
+    ``exclude`` are left out, and excluded directories are not walked.  If
+    ``include`` is given, only the files matching its patterns (or inside a
+    directory matching them) are uploaded, and directories none of them can
+    match inside are not walked.  All patterns use gitignore syntax (see
+    IgnoreRules).
+
+    Args:
+        path: Uploaded file or directory
+        include: Patterns of the files to upload, or None for all files
+        exclude: Patterns of the entries to leave out, in addition to those
+                 of the ignore file
+        filter: Another ``filter(relpath, is_dir)`` callable the entries
+                must also pass
+
+    Returns:
+        Callable ``filter(relpath, is_dir)`` returning False for the entries
+        to leave out, or None
+    """
+    ignored = IgnoreRules()
+    ignore_file = os.path.join(path, IGNORE_FILE)
+    if os.path.isfile(ignore_file):
+        try:
+            ignored = IgnoreRules.from_file(ignore_file)
+        except (OSError, UnicodeDecodeError) as e:
+            logging.warning(f"Unable to read {ignore_file}: {e}")
+        logging.debug(f"{ignore_file}: {len(ignored.rules)} patterns")
+    ignored = ignored + IgnoreRules(exclude or [])
+    included = IgnoreRules(include) if include is not None else None
+    if not ignored and included is None:
+        return filter
+
+    def select(relpath, is_dir):
+        if ignored.match(relpath, is_dir):
+            return False
+        if included is not None:
+            if is_dir:
+                if not included.match_inside(relpath):
+                    return False
+            elif not included.match_tree(relpath, is_dir):
+                return False
+        return filter is None or filter(relpath, is_dir)
+
+    return select
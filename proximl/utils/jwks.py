@@ -0,0 +1,106 @@
+import json
+import time
+import logging
+import threading
+
+from proximl.utils.token_cache import write_private_json
+
+JWKS_CACHE_FILE = "jwks.json"  # Key set file name next to the token cache
+DEFAULT_JWKS_TTL = 86400  # Seconds a fetched key set is used for
+MIN_REFETCH_INTERVAL = 60  # Minimum seconds between fetches for unknown kids
+
+
+class JwksCache(object):
+    """
+    Signing keys of a user pool, indexed by key id.
+
+    The JSON Web Key Set is fetched once and reused for ``ttl`` seconds.
+    A token signed with an unknown key id (for example after a key
+    rotation) triggers a refetch, at most once every
+    MIN_REFETCH_INTERVAL seconds.  If ``path`` is set, the key set is also
+    stored there so that new processes do not need to fetch it.
+
+    Args:
+        fetch: Callable returning the key set document
+        path: File to store the key set in, or None
+        source: Identifier of the key set (e.g. the user pool), so that a
+                stored key set of another source is ignored
+        ttl: Seconds a fetched key set is used for
+    """
+
+    def __init__(self, fetch, path=None, source=None, ttl=DEFAULT_JWKS_TTL):
+        self.fetch = fetch
+        self.path = path
+        self.source = source
+        self.ttl = ttl
+        self.fetches = 0
+        self._keys = None
+        self._fetched = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _index(document):
+        return {
+            key.get("kid"): key
+            for key in (document or dict()).get("keys") or []
+            if isinstance(key, dict)
+        }
+
+    def _load(self):
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                stored = json.load(file)
+            if stored.get("source") != self.source:
+                return
+            fetched = float(stored["fetched"])
+            keys = self._index(stored["jwks"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+        if fetched > self._fetched:
+            self._keys = keys
+            self._fetched = fetched
+
+    def _refresh(self):
+        document = self.fetch()
+        self.fetches += 1
+        self._keys = self._index(document)
+        self._fetched = time.time()
+        if self.path is not None:
+            try:
+                write_private_json(
+                    self.path,
+                    dict(
+                        source=self.source,
+                        fetched=self._fetched,
+                        jwks=document,
+                    ),
+                )
+            except OSError as e:
+                logging.debug(f"Unable to write key set {self.path}: {e}")
+
+    def get(self, kid):
+        """
+        Return the key with id ``kid``.
+
+        Returns:
+            JSON Web Key dict, or None if the key set does not contain it
+        """
+        with self._lock:
+            if self._keys is None or time.time() - self._fetched > self.ttl:
+                self._load()
+            if self._keys is None or time.time() - self._fetched > self.ttl:
+                self._refresh()
+            elif (
+                kid not in self._keys
+                and time.time() - self._fetched > MIN_REFETCH_INTERVAL
+            ):
+                logging.debug(f"Unknown key id {kid}, refetching key set")
+                self._refresh()
+            return self._keys.get(kid)
+
+    def clear(self):
+        with self._lock:
+            self._keys = None
+            self._fetched = 0.0
@@ -0,0 +1,54 @@
+import importlib
+
+
+class LazyModule(object):
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Keeps optional or slow-to-import dependencies off the import path of
+    code that may never use them.  Accessing an attribute raises
+    ImportError if the module is not installed.
+
+    Args:
+        name: Absolute module name
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __repr__(self):
+        return f"LazyModule({self._name!r})"
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+class LazyAttribute(object):
+    """
+    Instance attribute created on first access.
+
+    On first access, ``factory`` is imported from ``module`` and called
+    with the instance; the result is stored on the instance, so later
+    accesses are plain attribute lookups and the attribute can still be
+    assigned.
+
+    Args:
+        module: Absolute name of the module defining ``factory``
+        factory: Name of the class or function creating the value
+    """
+
+    def __init__(self, module, factory):
+        self.module = module
+        self.factory = factory
+        self.attr = None
+
+    def __set_name__(self, owner, attr):
+        self.attr = attr
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        factory = getattr(importlib.import_module(self.module), self.factory)
+        value = instance.__dict__[self.attr] = factory(instance)
+        return value
@@ -0,0 +1,340 @@
+import re
+import time
+import logging
+import traceback
+import aiohttp
+from collections import deque
+
+DEFAULT_RESERVOIR_SIZE = 1024  # Recent values kept per histogram
+# Metrics reported by the SDK and their units
+METRICS = {
+    "api.request": "s",  # _query latency, including retries
+    "api.request.attempts": "1",  # Attempts made by a _query call
+    "api.request.bytes_sent": "By",
+    "api.request.bytes_received": "By",
+    "http.request": "s",  # Single HTTP request, until response headers
+    "http.dns": "s",  # DNS resolution
+    "http.connect": "s",  # New connection, including TLS handshake
+    "http.connection_reused": "1",  # Requests sent on a pooled connection
+    "ws.subscribe": "s",  # Websocket log subscription
+    "ws.message": "By",  # Websocket message received
+    "transfer.duration": "s",  # Upload or download
+    "transfer.bytes": "By",
+    "transfer.throughput": "By/s",
+}
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+def path_template(path):
+    """
+    Replace resource ids in an API path with ``{id}``.
+
+    Example: ``/job/5a1b...e9/logs`` becomes ``/job/{id}/logs``, so that
+    metrics are grouped by endpoint rather than by resource.
+    """
+    return "/".join(
+        "{id}" if ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def record(sink, name, value, **tags):
+    """
+    Report a value to a metrics sink.
+
+    Does nothing if ``sink`` is None.  Errors raised by the sink are logged
+    and never propagate to the instrumented code.
+    """
+    if sink is None:
+        return
+    try:
+        sink.record(name, value, tags)
+    except Exception:
+        logging.debug(
+            f"Metrics sink failed to record {name}: {traceback.format_exc()}"
+        )
+
+
+class Timer(object):
+    """
+    Context manager reporting the time spent in its block.
+
+    Tags can be added while the block runs through ``tags``.  Values set
+    with ``add`` are reported with the same tags when the block exits; a
+    later ``add`` of the same metric replaces the earlier value.  If
+    the block raises, the exception class name is reported as the ``error``
+    tag.
+    """
+
+    def __init__(self, sink, name, **tags):
+        self.sink = sink
+        self.name = name
+        self.tags = tags
+        self._values = dict()
+        self.start = None
+
+    def add(self, name, value):
+        self._values[name] = value
+
+    def __enter__(self):
+        self.start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if self.sink is None:
+            return False
+        if exc_type is not None:
+            self.tags.setdefault("error", exc_type.__name__)
+        record(
+            self.sink, self.name, time.monotonic() - self.start, **self.tags
+        )
+        for name, value in self._values.items():
+            record(self.sink, name, value, **self.tags)
+        return False
+
+
+def trace_config(sink):
+    """
+    Build an aiohttp TraceConfig reporting HTTP-level metrics to ``sink``.
+
+    Reports request latency, DNS resolution and connection setup times and
+    connection reuse.  If a request is made with a dict as
+    ``trace_request_ctx``, the response bytes received are counted in its
+    ``bytes_received`` key.
+    """
+
+    async def on_request_start(session, ctx, params):
+        ctx.start = time.monotonic()
+
+    async def on_request_end(session, ctx, params):
+        record(
+            sink,
+            "http.request",
+            time.monotonic() - ctx.start,
+            method=params.method,
+            host=params.url.host,
+            status=params.response.status,
+        )
+
+    async def on_request_exception(session, ctx, params):
+        record(
+            sink,
+            "http.request",
+            time.monotonic() - ctx.start,
+            method=params.method,
+            host=params.url.host,
+            error=type(params.exception).__name__,
+        )
+
+    async def on_response_chunk_received(session, ctx, params):
+        if isinstance(ctx.trace_request_ctx, dict):
+            stats = ctx.trace_request_ctx
+            stats["bytes_received"] = stats.get("bytes_received", 0) + len(
+                params.chunk
+            )
+
+    async def on_dns_resolvehost_start(session, ctx, params):
+        ctx.dns_start = time.monotonic()
+
+    async def on_dns_resolvehost_end(session, ctx, params):
+        record(
+            sink,
+            "http.dns",
+            time.monotonic() - ctx.dns_start,
+            host=params.host,
+        )
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.connect_start = time.monotonic()
+
+    async def on_connection_create_end(session, ctx, params):
+        record(sink, "http.connect", time.monotonic() - ctx.connect_start)
+
+    async def on_connection_reuseconn(session, ctx, params):
+        record(sink, "http.connection_reused", 1)
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_request_end.append(on_request_end)
+    config.on_request_exception.append(on_request_exception)
+    config.on_response_chunk_received.append(on_response_chunk_received)
+    config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    config.on_connection_create_start.append(on_connection_create_start)
+    config.on_connection_create_end.append(on_connection_create_end)
+    config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return config
+
+
+async def measure_transfer(sink, direction, transfer, **tags):
+    """
+    Await an upload or download and report its duration and throughput.
+
+    Args:
+        sink: Metrics sink, or None
+        direction: ``upload`` or ``download``
+        transfer: Awaitable returning the number of bytes transferred
+
+    Returns:
+        The result of ``transfer``
+    """
+    with Timer(sink, "transfer.duration", direction=direction, **tags) as t:
+        size = await transfer
+    if size:
+        elapsed = time.monotonic() - t.start
+        record(sink, "transfer.bytes", size, direction=direction, **tags)
+        if elapsed > 0:
+            record(
+                sink,
+                "transfer.throughput",
+                size / elapsed,
+                direction=direction,
+                **tags,
+            )
+    return size
+
+
+class Histogram(object):
+    """
+    Distribution of recorded values.
+
+    Count, total, minimum and maximum cover every value; percentiles are
+    computed over the most recent ``reservoir_size`` values.
+    """
+
+    def __init__(self, reservoir_size=DEFAULT_RESERVOIR_SIZE):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._values = deque(maxlen=reservoir_size)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._values.append(value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile):
+        if not self._values:
+            return None
+        values = sorted(self._values)
+        index = min(len(values) - 1, int(len(values) * percentile / 100))
+        return values[index]
+
+    def snapshot(self) -> dict:
+        return dict(
+            count=self.count,
+            total=self.total,
+            mean=self.mean,
+            min=self.min,
+            max=self.max,
+            p50=self.percentile(50),
+            p90=self.percentile(90),
+            p99=self.percentile(99),
+        )
+
+
+class MetricsSink(object):
+    """
+    Destination for SDK metrics.
+
+    Subclasses implement ``record``, which is called with the metric name
+    (see METRICS), its value and a dict of tags such as ``method``,
+    ``path`` and ``status``.
+    """
+
+    def record(self, name, value, tags):
+        raise NotImplementedError
+
+
+class InMemorySink(MetricsSink):
+    """
+    Metrics sink keeping a histogram per metric name and tag set.
+
+    Args:
+        reservoir_size: Recent values kept per histogram for percentiles
+    """
+
+    def __init__(self, reservoir_size=DEFAULT_RESERVOIR_SIZE):
+        self.reservoir_size = reservoir_size
+        self.histograms = dict()
+
+    def record(self, name, value, tags):
+        key = (name, tuple(sorted(tags.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.reservoir_size)
+        histogram.add(value)
+
+    def get(self, name, **tags):
+        """Return the histogram for ``name`` with exactly ``tags``, if any."""
+        return self.histograms.get((name, tuple(sorted(tags.items()))))
+
+    def summary(self, name=None):
+        """
+        Summarize the recorded histograms.
+
+        Args:
+            name: Only include histograms of this metric
+
+        Returns:
+            List of dicts with the metric name, tags and histogram
+            statistics, largest total first
+        """
+        rows = [
+            dict(name=key_name, tags=dict(tags), **histogram.snapshot())
+            for (key_name, tags), histogram in self.histograms.items()
+            if name is None or key_name == name
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def clear(self):
+        self.histograms.clear()
+
+
+class OpenTelemetrySink(MetricsSink):
+    """
+    Metrics sink recording to OpenTelemetry histograms.
+
+    Args:
+        meter: OpenTelemetry Meter.  Defaults to the ``proximl`` meter of the
+               global meter provider.
+        prefix: Prefix for instrument names
+
+    Raises:
+        ImportError: If no meter is given and opentelemetry-api is not
+                     installed
+    """
+
+    def __init__(self, meter=None, prefix="proximl"):
+        if meter is None:
+            # Optional, only imported when the sink is used
+            try:
+                from opentelemetry import metrics
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetrySink requires the opentelemetry-api package"
+                ) from e
+            meter = metrics.get_meter("proximl")
+        self.meter = meter
+        self.prefix = prefix
+        self._instruments = dict()
+
+    def record(self, name, value, tags):
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            instrument = self._instruments[name] = self.meter.create_histogram(
+                f"{self.prefix}.{name}", unit=METRICS.get(name, "")
+            )
+        instrument.record(
+            value,
+            attributes={k: v for k, v in tags.items() if v is not None},
+        )
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+DEFAULT_PAGE_SIZE = 100  # Items requested per page
+PAGE_SIZE_PARAM = "limit"  # Query parameter carrying the page size
+PAGE_OFFSET_PARAM = "offset"  # Query parameter carrying the page offset
+
+
+async def paginate(
+    proximl, path, wrap, params=None, page_size=DEFAULT_PAGE_SIZE
+):
+    """
+    Asynchronously iterate over a list endpoint one page at a time.
+
+    Each page is requested with ``limit``/``offset`` query parameters.  As
+    soon as a full page arrives, the request for the next page is started in
+    the background so that it overlaps with the caller processing the current
+    page.  Items are wrapped one at a time as they are yielded, so only the
+    current page is held in memory.
+
+    Endpoints that do not support paging return the complete list on the
+    first request; this is detected (more items than requested, or the same
+    page returned again) and iteration stops without yielding duplicates.
+
+    Args:
+        proximl: ProxiML client
+        path: API path of the list endpoint
+        wrap: Callable converting a response item into an SDK object
+        params: Additional query parameters
+        page_size: Number of items to request per page
+
+    Yields:
+        Wrapped items, in the order returned by the API
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    params = dict(params or dict())
+
+    def fetch(offset):
+        return asyncio.ensure_future(
+            proximl._query(
+                path,
+                "GET",
+                {
+                    **params,
+                    PAGE_SIZE_PARAM: page_size,
+                    PAGE_OFFSET_PARAM: offset,
+                },
+            )
+        )
+
+    offset = 0
+    previous_first = None
+    pending = fetch(offset)
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            if not page or (
+                previous_first is not None and page[0] == previous_first
+            ):
+                break
+            if len(page) == page_size:
+                offset += page_size
+                pending = fetch(offset)
+            elif len(page) > page_size:
+                logging.debug(
+                    f"{path} returned {len(page)} items for a page of {page_size}, paging not supported"
+                )
+            previous_first = page[0]
+            for item in page:
+                yield wrap(item)
+    finally:
+        if pending is not None:
+            if pending.done() and not pending.cancelled():
+                # Retrieve the result so an unused prefetch error is not
+                # reported as never retrieved.
+                pending.exception()
+            elif not pending.done():
+                pending.cancel()
@@ -0,0 +1,263 @@
+import time
+import weakref
+import asyncio
+import logging
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+DEFAULT_INITIAL_CONCURRENCY = 16  # Concurrent API requests allowed at start
+DEFAULT_MAX_CONCURRENCY = 64  # Upper bound for the adaptive concurrency limit
+THROTTLE_STATUSES = {429, 503}  # Responses indicating the API is overloaded
+
+
+def parse_retry_after(value):
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value in delay-seconds or HTTP-date form
+
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket(object):
+    """
+    Token bucket limiting the sustained request rate.
+
+    Args:
+        rate: Tokens (requests) added per second
+        burst: Bucket capacity.  Defaults to one second worth of tokens.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self):
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _Slots(object):
+    """Requests in flight and requests waiting on one event loop."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.waiters = deque()
+
+
+class AimdLimiter(object):
+    """
+    Adaptive concurrency limit using additive increase/multiplicative decrease.
+
+    Every successful request grows the limit by ``increase / limit`` (about
+    ``increase`` per full window of requests) and a throttled request
+    multiplies it by ``decrease``, at most once per congestion window: the
+    other requests in flight when the limit is decreased were sent under the
+    previous limit, so their throttled responses do not decrease it again.
+
+    The limit is shared, but requests in flight and waiters are counted per
+    event loop, so that a limiter shared by a long-lived client keeps
+    working when the client is used from several event loops, whether in
+    turn or at the same time from different threads.
+    """
+
+    def __init__(
+        self,
+        initial=DEFAULT_INITIAL_CONCURRENCY,
+        minimum=1,
+        maximum=DEFAULT_MAX_CONCURRENCY,
+        increase=1.0,
+        decrease=0.5,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.window = 0  # Congestion window, counts the decreases
+        self._slots = weakref.WeakKeyDictionary()  # event loop -> _Slots
+
+    @property
+    def in_flight(self) -> int:
+        """Requests in flight on all open event loops."""
+        return sum(
+            slots.in_flight
+            for loop, slots in list(self._slots.items())
+            if not loop.is_closed()
+        )
+
+    def _loop_slots(self, create=True):
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None and create:
+            # Slots of closed loops can never be released
+            for other in list(self._slots):
+                if other.is_closed():
+                    del self._slots[other]
+            slots = self._slots[loop] = _Slots()
+        return slots
+
+    def _wake(self, slots=None):
+        if slots is None:
+            try:
+                slots = self._slots.get(asyncio.get_running_loop())
+            except RuntimeError:
+                return
+            if slots is None:
+                return
+        available = int(self.limit) - slots.in_flight
+        while available > 0 and slots.waiters:
+            waiter = slots.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    async def acquire(self):
+        """
+        Wait until a request may be sent.
+
+        Returns:
+            Congestion window the request is sent in, for ``on_throttle``
+        """
+        slots = self._loop_slots()
+        while slots.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            slots.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in slots.waiters:
+                    slots.waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # Pass the wake-up on to the next waiter
+                    self._wake(slots)
+                raise
+        slots.in_flight += 1
+        return self.window
+
+    def release(self):
+        slots = self._loop_slots(create=False)
+        if slots is None:
+            return
+        slots.in_flight = max(0, slots.in_flight - 1)
+        self._wake(slots)
+
+    def on_success(self):
+        self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+        self._wake()
+
+    def on_throttle(self, window=None):
+        """
+        Decrease the limit after a throttled request.
+
+        Args:
+            window: Congestion window returned by ``acquire`` for the
+                    request, or None to decrease the limit regardless
+        """
+        if window is not None and window != self.window:
+            return  # Sent before the limit was last decreased
+        self.window += 1
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        logging.debug(f"API throttled, concurrency limit now {self.limit:.1f}")
+
+
+class RateLimiter(object):
+    """
+    Client-side rate and concurrency control for API requests.
+
+    Combines an optional token bucket (sustained requests per second) with an
+    AIMD concurrency limit, and pauses all new requests when the API asks
+    for it with ``Retry-After``.  One limiter is shared by every subsystem of
+    a ProxiML client.
+
+    Args:
+        requests_per_second: Sustained request rate, or None for no limit
+        burst: Requests allowed in a burst above the sustained rate
+        initial_concurrency: Starting concurrency limit
+        max_concurrency: Upper bound for the concurrency limit
+    """
+
+    def __init__(
+        self,
+        requests_per_second=None,
+        burst=None,
+        initial_concurrency=DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.bucket = (
+            TokenBucket(requests_per_second, burst)
+            if requests_per_second
+            else None
+        )
+        self.concurrency = AimdLimiter(
+            initial=initial_concurrency, maximum=max_concurrency
+        )
+        self._resume_at = 0.0
+        self.throttled = 0
+
+    async def acquire(self):
+        """
+        Wait until a new request may be sent.
+
+        Returns:
+            Congestion window the request is sent in, to pass to ``release``
+        """
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        if self.bucket is not None:
+            await self.bucket.acquire()
+        return await self.concurrency.acquire()
+
+    def release(self, throttled=False, retry_after=None, window=None):
+        """
+        Release the slot taken by ``acquire`` and record the outcome.
+
+        Args:
+            throttled: True if the API rejected the request as overloaded
+            retry_after: Seconds the API asked clients to wait, if any
+            window: Congestion window returned by ``acquire``
+        """
+        self.concurrency.release()
+        if throttled:
+            self.throttled += 1
+            self.concurrency.on_throttle(window)
+            if retry_after:
+                self._resume_at = max(
+                    self._resume_at, time.monotonic() + retry_after
+                )
+        else:
+            self.concurrency.on_success()
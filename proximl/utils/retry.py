@@ -0,0 +1,221 @@
+import copy
+import time
+import random
+import asyncio
+import logging
+from aiohttp.client_exceptions import ClientConnectorError, ClientResponseError
+
+DEFAULT_MAX_BACKOFF = 30  # Upper bound (seconds) for a single backoff sleep
+# Methods that can be repeated without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy(object):
+    """
+    Retry rules shared by the API client and the transfer layer.
+
+    Backoff is capped exponential with full jitter: the wait before retry
+    ``n`` is drawn uniformly from ``[0, min(max_backoff, initial_backoff *
+    multiplier ** (n - 1))]``.  A ``Retry-After`` delay reported by the
+    server is used when it is longer than the drawn backoff.
+
+    Requests with a non-idempotent method (e.g. POST) are only retried when
+    the server cannot have processed them: statuses in ``unsafe_statuses``
+    and exceptions in ``unsafe_exceptions``.
+
+    Args:
+        max_attempts: Maximum number of attempts, including the first.
+                      None for no limit other than ``budget``.
+        statuses: HTTP statuses to retry
+        exceptions: Exception types to retry
+        exception_attempts: Mapping of exception type to the number of
+                            attempts allowed once that exception is seen,
+                            when it is higher than ``max_attempts``
+        initial_backoff: Backoff ceiling (seconds) before the first retry
+        multiplier: Growth factor of the backoff ceiling per retry
+        max_backoff: Maximum backoff ceiling (seconds)
+        budget: Total time (seconds) after the first attempt beyond which
+                no retry is started.  None for no limit.
+        jitter: Draw the backoff uniformly below its ceiling
+        unsafe_statuses: Statuses retried for non-idempotent methods
+        unsafe_exceptions: Exception types retried for non-idempotent methods
+
+    Raises:
+        ValueError: If neither ``max_attempts`` nor ``budget`` is set
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        statuses=(),
+        exceptions=(),
+        exception_attempts=None,
+        initial_backoff=0.5,
+        multiplier=2,
+        max_backoff=DEFAULT_MAX_BACKOFF,
+        budget=None,
+        jitter=True,
+        unsafe_statuses=(429,),
+        unsafe_exceptions=(ClientConnectorError,),
+    ):
+        if max_attempts is None and budget is None:
+            raise ValueError("Either max_attempts or budget must be set")
+        self.max_attempts = max_attempts
+        self.statuses = statuses
+        self.exceptions = tuple(exceptions)
+        self.exception_attempts = dict(exception_attempts or dict())
+        self.initial_backoff = initial_backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.jitter = jitter
+        self.unsafe_statuses = unsafe_statuses
+        self.unsafe_exceptions = tuple(unsafe_exceptions)
+
+    def __repr__(self):
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"budget={self.budget}, max_backoff={self.max_backoff})"
+        )
+
+    def replace(self, **overrides):
+        """
+        Return a copy of this policy with some settings changed.
+
+        Raises:
+            TypeError: If an override is not a policy setting
+        """
+        policy = copy.copy(self)
+        for name, value in overrides.items():
+            if name not in vars(self):
+                raise TypeError(f"Unknown retry policy setting: {name}")
+            setattr(policy, name, value)
+        if policy.max_attempts is None and policy.budget is None:
+            raise ValueError("Either max_attempts or budget must be set")
+        return policy
+
+    def backoff(self, retry):
+        """Seconds to wait before retry number ``retry`` (1-based)."""
+        ceiling = min(
+            self.max_backoff,
+            self.initial_backoff * self.multiplier ** (retry - 1),
+        )
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def retries_status(self, status, idempotent=True):
+        if idempotent:
+            return status in self.statuses
+        return status in self.statuses and status in self.unsafe_statuses
+
+    def retries_exception(self, error, idempotent=True):
+        if isinstance(error, ClientResponseError):
+            return self.retries_status(error.status, idempotent)
+        retryable = isinstance(error, self.exceptions) or any(
+            isinstance(error, kind) for kind in self.exception_attempts
+        )
+        if idempotent:
+            return retryable
+        return retryable and isinstance(error, self.unsafe_exceptions)
+
+    def start(self, method=None):
+        """
+        Begin tracking the attempts of one request.
+
+        Args:
+            method: HTTP method of the request, or None if it is idempotent
+
+        Returns:
+            RetryState
+        """
+        return RetryState(self, method)
+
+    async def call(self, func, *args, method=None, **kwargs):
+        """
+        Await ``func(*args, **kwargs)``, retrying according to this policy.
+
+        Exceptions that are not retried, or that persist once the policy
+        gives up, are re-raised unchanged.
+        """
+        state = self.start(method)
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = state.retry(e)
+                if delay is None:
+                    raise
+                logging.debug(
+                    f"Retry {state.attempt - 1}/{state.max_attempts} due to {type(e).__name__}: {str(e)}"
+                )
+            await asyncio.sleep(delay)
+
+
+class RetryState(object):
+    """Attempt counter and time budget of a single request."""
+
+    def __init__(self, policy, method=None):
+        self.policy = policy
+        self.idempotent = (
+            method is None or method.upper() in IDEMPOTENT_METHODS
+        )
+        self.attempt = 1
+        self.max_attempts = policy.max_attempts
+        self.deadline = (
+            time.monotonic() + policy.budget
+            if policy.budget is not None
+            else None
+        )
+
+    def retry(self, error=None, status=None, retry_after=None):
+        """
+        Record a failed attempt and decide whether to try again.
+
+        Args:
+            error: Exception raised by the attempt
+            status: HTTP status of the failed response, if no exception
+            retry_after: Seconds the server asked clients to wait, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        policy = self.policy
+        if error is not None:
+            if not policy.retries_exception(error, self.idempotent):
+                return None
+            for kind, attempts in policy.exception_attempts.items():
+                if isinstance(error, kind) and self.max_attempts is not None:
+                    self.max_attempts = max(self.max_attempts, attempts)
+        elif not policy.retries_status(status, self.idempotent):
+            return None
+        if self.max_attempts is not None and self.attempt >= self.max_attempts:
+            return None
+        delay = max(policy.backoff(self.attempt), retry_after or 0)
+        if (
+            self.deadline is not None
+            and time.monotonic() + delay > self.deadline
+        ):
+            return None
+        self.attempt += 1
+        return delay
+
+    def wait(self, delay):
+        """
+        Decide whether to wait before the next attempt when it cannot be
+        made yet, e.g. while the host's circuit is open.  The wait counts as
+        an attempt, so it is bounded by the policy like retries are.
+
+        Args:
+            delay: Seconds until the next attempt can be made
+
+        Returns:
+            ``delay``, or None to give up
+        """
+        if self.max_attempts is not None and self.attempt >= self.max_attempts:
+            return None
+        if (
+            self.deadline is not None
+            and time.monotonic() + delay > self.deadline
+        ):
+            return None
+        self.attempt += 1
+        return delay
@@ -0,0 +1,81 @@
+import copy
+import asyncio
+import logging
+
+
+def freeze(value):
+    """
+    Convert query parameters or headers into a hashable, order-independent key.
+
+    Args:
+        value: Dictionary (or None) to convert
+
+    Returns:
+        Tuple of sorted (key, repr(value)) pairs
+    """
+    if not value:
+        return ()
+    return tuple(sorted((str(k), repr(v)) for k, v in value.items()))
+
+
+class SingleFlight(object):
+    """
+    Coalesce identical concurrent calls into a single in-flight call.
+
+    The first caller for a key starts the call; every caller that arrives
+    with the same key while it is still running awaits the same result
+    instead of issuing its own.  Followers receive a deep copy of the result
+    so that callers cannot mutate each other's data.
+    """
+
+    def __init__(self):
+        self._calls = dict()
+        self._waiters = dict()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every waiter was
+            # cancelled before the call completed.
+            task.exception()
+
+    async def _wait(self, task):
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield the shared call so that cancelling one caller does not
+            # cancel the request for everyone else waiting on it.
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    async def do(self, key, func):
+        """
+        Run ``func()`` for ``key`` or join the call already in flight.
+
+        Args:
+            key: Hashable identifier of the call
+            func: Zero argument callable returning an awaitable
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._calls.get(key)
+        if task is not None and not task.done():
+            logging.debug(f"Joining in-flight call: {key}")
+            result = await self._wait(task)
+            return copy.deepcopy(result)
+
+        task = asyncio.ensure_future(func())
+        self._calls[key] = task
+        task.add_done_callback(lambda t: self._forget(key, t))
+        return await self._wait(task)
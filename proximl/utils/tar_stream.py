@@ -0,0 +1,220 @@
+import io
+import os
+import logging
+import tarfile
+
+FORMAT = tarfile.GNU_FORMAT  # Default format of GNU tar
+
+
+def _by_name(entry):
+    return entry.name
+
+
+class TarStream(object):
+    """
+    Readable TAR archive of a file or directory, built while it is read.
+
+    Produces the same archive as ``tar -c -C <parent> <file>`` for a file and
+    ``tar -c -C <directory> .`` for a directory (GNU format, entries named
+    ``./...``), without a tar process.  Directories are walked with
+    ``os.scandir`` and file contents are read with ``readinto`` directly into
+    the caller's buffer, so only the current file is open and nothing is
+    buffered between reads.
+
+    Args:
+        path: File or directory to archive
+        filter: Callable ``filter(relpath, is_dir)`` returning False for
+                entries to leave out, where ``relpath`` is the POSIX path
+                relative to the directory.  Excluded directories are not
+                walked.
+        sort_key: Key ordering the entries of each directory (called with
+                  an ``os.DirEntry``), by name by default
+        progress: Callable ``progress(relpath, size)`` called once each
+                  file has been read
+        empty_directories: False to leave out the directories without
+                           archived files (other than the archived
+                           directory itself)
+
+    Raises:
+        ValueError: If path is neither a file nor a directory
+    """
+
+    def __init__(
+        self,
+        path,
+        filter=None,
+        sort_key=None,
+        progress=None,
+        empty_directories=True,
+    ):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        if not (os.path.isfile(self.path) or os.path.isdir(self.path)):
+            raise ValueError(
+                f"Path is neither a file nor directory: {self.path}"
+            )
+        self.filter = filter
+        self.sort_key = sort_key or _by_name
+        self.progress = progress
+        self.empty_directories = empty_directories
+        self.files = 0  # Files archived so far
+        self.position = 0  # Bytes read so far
+        # Only used to build headers (owner names, hard links)
+        self._tarfile = tarfile.TarFile(
+            fileobj=io.BytesIO(), mode="w", format=FORMAT
+        )
+        # Directory entries held back until a file inside them is archived
+        self._directories = []
+        self._entries = self._walk()
+        self._pending = memoryview(b"")
+        self._file = None
+        self._entry = None
+        self._remaining = 0
+        self._done = False
+
+    def _walk(self):
+        # The archived path itself is followed if it is a symbolic link, so
+        # the root is always archived as the directory or file it points to
+        path = os.path.realpath(self.path)
+        if os.path.isdir(path):
+            yield from self._walk_directory(path, ".", "")
+        else:
+            name = os.path.basename(self.path)
+            yield self._tarinfo(path, name), path, name
+
+    def _walk_directory(self, directory, arcname, relpath):
+        item = (self._tarinfo(directory, arcname), directory, relpath)
+        if self.empty_directories or not relpath:
+            yield item
+        else:
+            self._directories.append(item)
+        with os.scandir(directory) as scan:
+            entries = sorted(scan, key=self.sort_key)
+        for entry in entries:
+            entry_relpath = f"{relpath}{entry.name}"
+            entry_arcname = f"{arcname}/{entry.name}"
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if self.filter is not None and not self.filter(
+                entry_relpath, is_dir
+            ):
+                continue
+            if is_dir:
+                yield from self._walk_directory(
+                    entry.path, entry_arcname, f"{entry_relpath}/"
+                )
+            else:
+                tarinfo = self._tarinfo(entry.path, entry_arcname)
+                if tarinfo is not None:
+                    yield from self._directories
+                    self._directories.clear()
+                    yield tarinfo, entry.path, entry_relpath
+        if self._directories and self._directories[-1] is item:
+            self._directories.pop()
+
+    def _tarinfo(self, path, arcname):
+        tarinfo = self._tarfile.gettarinfo(path, arcname)
+        if tarinfo is None:
+            logging.debug(f"Skipping {path}: unsupported file type")
+        return tarinfo
+
+    def _next_entry(self):
+        item = next(self._entries, None)
+        if item is None:
+            if self._done:
+                return False
+            # End of archive marker, padded to a full record as tar does
+            end = 2 * tarfile.BLOCKSIZE
+            end += -(self.position + len(self._pending) + end) % (
+                tarfile.RECORDSIZE
+            )
+            self._pending = memoryview(bytes(end))
+            self._done = True
+            return True
+        tarinfo, path, relpath = item
+        self._pending = memoryview(
+            tarinfo.tobuf(FORMAT, tarfile.ENCODING, "surrogateescape")
+        )
+        if tarinfo.isreg():
+            self._file = open(path, "rb", buffering=0)
+            self._entry = (relpath, tarinfo.size)
+            self._remaining = tarinfo.size
+        return True
+
+    def _end_file(self):
+        self._file.close()
+        self._file = None
+        relpath, size = self._entry
+        padding = -size % tarfile.BLOCKSIZE
+        self._pending = memoryview(bytes(padding))
+        self.files += 1
+        logging.debug(f"Archived {relpath} ({size} bytes)")
+        if self.progress is not None:
+            self.progress(relpath, size)
+
+    def readinto(self, buffer):
+        """
+        Read the next bytes of the archive into a writable buffer.
+
+        Returns:
+            Number of bytes read, 0 at the end of the archive
+        """
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(view):
+            if self._pending:
+                count = min(len(self._pending), len(view) - filled)
+                view[filled : filled + count] = self._pending[:count]
+                self._pending = self._pending[count:]
+            elif self._file is not None:
+                if not self._remaining:
+                    self._end_file()
+                    continue
+                count = min(self._remaining, len(view) - filled)
+                read = self._file.readinto(view[filled : filled + count])
+                if not read:
+                    # The file shrank since its header was written
+                    logging.warning(
+                        f"{self._entry[0]} changed while being archived"
+                    )
+                    view[filled : filled + count] = bytes(count)
+                else:
+                    count = read
+                self._remaining -= count
+            elif self._next_entry():
+                continue
+            else:
+                break
+            filled += count
+            self.position += count
+        return filled
+
+    def read(self, size=-1):
+        """
+        Read up to ``size`` bytes of the archive (all if negative).
+
+        Returns:
+            bytearray, shorter than ``size`` only at the end of the archive
+        """
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = self.read(io.DEFAULT_BUFFER_SIZE * 16)
+                if not chunk:
+                    return bytearray().join(chunks)
+                chunks.append(chunk)
+        buffer = bytearray(size)
+        del buffer[self.readinto(buffer) :]
+        return buffer
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._entries.close()
+        self._done = True
+        self._pending = memoryview(b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import logging
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+TOKEN_CACHE_FILE = "token_cache.json"  # Cache file name in the config dir
+DEFAULT_LOCK_TIMEOUT = 30  # Seconds to wait for another process's refresh
+LOCK_POLL_INTERVAL = 0.05  # Seconds between attempts to take the lock
+
+
+def write_private_json(path, data):
+    """
+    Atomically replace ``path`` with ``data`` as JSON, readable by the owner
+    only.  Missing parent directories are created readable by the owner only.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    # mkstemp creates the file readable and writable by the owner only
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".proximl.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class TokenCache(object):
+    """
+    Tokens shared by every process using the same config directory.
+
+    Tokens are stored per user pool, client and user in a JSON file that is
+    only readable by its owner and replaced atomically on every write.  The
+    ``lock`` context manager serializes token refreshes across processes,
+    so concurrent processes wait for one refresh instead of each
+    authenticating.  Locking is skipped on platforms without ``fcntl``.
+
+    Args:
+        path: Cache file path
+        lock_timeout: Seconds to wait for the lock before continuing without
+                      it
+    """
+
+    def __init__(self, path, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+        self.path = path
+        self.lock_timeout = lock_timeout
+
+    @staticmethod
+    def key(pool_id, client_id, username):
+        return f"{pool_id}:{client_id}:{username}"
+
+    def load(self) -> dict:
+        """Return all cached entries, or an empty dict if none are readable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return dict()
+        return entries if isinstance(entries, dict) else dict()
+
+    def get(self, key, min_valid=0):
+        """
+        Return the cached tokens for ``key`` if they have not expired.
+
+        Args:
+            key: Cache key from ``TokenCache.key``
+            min_valid: Seconds the tokens must remain valid for
+
+        Returns:
+            dict with ``id_token``, ``access_token``, ``refresh_token`` and
+            ``expires``, or None
+        """
+        tokens = self.load().get(key)
+        if (
+            not isinstance(tokens, dict)
+            or not tokens.get("id_token")
+            or tokens.get("expires", 0) < time.time() + min_valid
+        ):
+            return None
+        return tokens
+
+    def set(self, key, tokens):
+        """
+        Store tokens for ``key``, pruning the expired entries of other users.
+
+        Only the refresh token of an expired entry is kept, since it outlives
+        the id and access tokens and spares that user signing in again.
+        Entries without one are dropped.  Failures to write are logged and
+        otherwise ignored, the tokens remain usable by the current process.
+        """
+        now = time.time()
+        entries = dict()
+        for other, value in self.load().items():
+            if not isinstance(value, dict):
+                continue
+            if value.get("expires", 0) < now:
+                if not value.get("refresh_token"):
+                    continue
+                value = dict(
+                    refresh_token=value["refresh_token"],
+                    expires=value.get("expires", 0),
+                )
+            entries[other] = value
+        entries[key] = tokens
+        self._write(entries)
+
+    def remove(self, key):
+        entries = self.load()
+        if entries.pop(key, None) is not None:
+            self._write(entries)
+
+    def _write(self, entries):
+        try:
+            write_private_json(self.path, entries)
+        except OSError as e:
+            logging.debug(f"Unable to write token cache {self.path}: {e}")
+
+    @contextmanager
+    def lock(self):
+        """
+        Hold an exclusive lock on the cache across processes.
+
+        If the lock cannot be taken within ``lock_timeout`` seconds, the
+        block runs without it.
+        """
+        fd = None
+        if fcntl is not None:
+            try:
+                os.makedirs(
+                    os.path.dirname(self.path) or ".",
+                    mode=0o700,
+                    exist_ok=True,
+                )
+                fd = os.open(
+                    f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600
+                )
+            except OSError as e:
+                logging.debug(f"Unable to open token cache lock: {e}")
+        if fd is not None:
+            deadline = time.monotonic() + self.lock_timeout
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except OSError:
+                    if time.monotonic() >= deadline:
+                        logging.debug(
+                            "Timed out waiting for the token cache lock"
+                        )
+                        os.close(fd)
+                        fd = None
+                        break
+                    time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
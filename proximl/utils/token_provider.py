@@ -0,0 +1,139 @@
+import time
+import weakref
+import asyncio
+import logging
+import functools
+
+DEFAULT_REFRESH_MARGIN = 600  # Seconds before expiry to renew tokens
+
+
+class _LoopRefresh(object):
+    """Token refresh task and refresh timer of one event loop."""
+
+    def __init__(self):
+        self.task = None
+        self.timer = None
+
+
+class TokenProvider(object):
+    """
+    Asynchronous access to the tokens of an Auth instance.
+
+    ``Auth.get_tokens`` makes blocking network calls, so it is run in the
+    default executor and never on the event loop.  Concurrent callers share
+    a single refresh.  Tokens are renewed in the background
+    ``refresh_margin`` seconds before they expire (at most half way through
+    their lifetime), both on a timer and when a request finds them close to
+    expiry, so requests only wait for authentication when there are no
+    valid tokens at all.
+
+    Tokens are shared, but refreshes and timers belong to the event loop
+    they run on, so a provider can be used from several event loops, in
+    turn or at the same time from different threads.
+
+    Args:
+        auth: Auth instance providing the tokens
+        refresh_margin: Seconds before expiry to renew the tokens
+    """
+
+    def __init__(self, auth, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        self.auth = auth
+        self.refresh_margin = refresh_margin
+        self.refreshes = 0
+        self._tokens = None
+        self._obtained = 0.0
+        self._loops = weakref.WeakKeyDictionary()  # loop -> _LoopRefresh
+
+    def _expires(self):
+        return (self._tokens or dict()).get("expires") or 0
+
+    def _margin(self):
+        lifetime = max(0.0, self._expires() - self._obtained)
+        return min(self.refresh_margin, lifetime / 2)
+
+    def _loop_refresh(self):
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            # A refresh or timer of a closed loop will never run
+            for other in list(self._loops):
+                if other.is_closed():
+                    del self._loops[other]
+            state = self._loops[loop] = _LoopRefresh()
+        return state
+
+    def _start_refresh(self, state):
+        if state.task is None:
+            state.task = asyncio.ensure_future(self._run_refresh(state))
+            state.task.add_done_callback(self._refresh_done)
+        return state.task
+
+    @staticmethod
+    def _refresh_done(task):
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"Token refresh failed: {task.exception()}")
+
+    async def _run_refresh(self, state):
+        min_valid = self._margin() if self._tokens else 0
+        try:
+            tokens = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(self.auth.get_tokens, min_valid=min_valid),
+            )
+        finally:
+            if state.task is asyncio.current_task():
+                state.task = None
+        self.refreshes += 1
+        self._tokens = tokens
+        self._obtained = time.time()
+        self._schedule(state)
+        return tokens
+
+    def _schedule(self, state):
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        delay = self._expires() - self._margin() - time.time()
+        if delay > 0:
+            state.timer = asyncio.get_running_loop().call_later(
+                delay, self._start_refresh, state
+            )
+
+    async def get_tokens(self) -> dict:
+        """
+        Return valid tokens, waiting for authentication only if needed.
+
+        Returns:
+            dict with ``id_token``, ``access_token``, ``refresh_token`` and
+            ``expires``
+        """
+        state = self._loop_refresh()
+        now = time.time()
+        if self._tokens is None or self._expires() <= now:
+            # Shield the shared refresh so that a cancelled caller does not
+            # cancel it for everyone else.
+            return await asyncio.shield(self._start_refresh(state))
+        if self._expires() - self._margin() <= now:
+            self._start_refresh(state)
+        return self._tokens
+
+    def close(self):
+        """
+        Stop background refreshes of the running event loop, and the timers
+        of loops that are not running.  Loops running in other threads keep
+        theirs.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, state in list(self._loops.items()):
+            if loop is not running and loop.is_running():
+                continue
+            if state.timer is not None:
+                state.timer.cancel()
+                state.timer = None
+            task, state.task = state.task, None
+            if task is not None and not task.done() and loop is running:
+                task.cancel()
+            del self._loops[loop]
@@ -1,11 +1,12 @@
 import os
 import re
-import math
+import time
 import asyncio
 import aiohttp
 import aiofiles
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from aiohttp.client_exceptions import (
     ClientResponseError,
     ClientConnectorError,
@@ -15,12 +16,23 @@ from aiohttp.client_exceptions import (
     ClientPayloadError,
     InvalidURL,
 )
-from proximl.exceptions import ConnectionError, ProxiMLException
+from proximl.exceptions import (
+    CircuitOpenError,
+    ConnectionError,
+    ProxiMLException,
+)
+from proximl.utils.circuit_breaker import CircuitBreakers
+from proximl.utils.codec import get_codec
+from proximl.utils.ignore import archive_filter
+from proximl.utils.retry import RetryPolicy
+from proximl.utils.tar_stream import TarStream
 
 MAX_RETRIES = 5
-RETRY_BACKOFF = 2  # Exponential backoff base (2^attempt)
+RETRY_BACKOFF = 2  # Growth factor of the backoff ceiling per retry
+MAX_BACKOFF = 30  # Upper bound (seconds) for a single backoff sleep
 PARALLEL_UPLOADS = 10  # Max concurrent uploads
 CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
+UPLOAD_QUEUE_SIZE = 5  # Max chunks read ahead of the uploads
 RETRY_STATUSES = {
     502,
     503,
@@ -28,9 +40,48 @@ RETRY_STATUSES = {
 }  # Server errors to retry during upload/download
 # Additional retries for DNS/connection errors (ClientConnectorError)
 DNS_MAX_RETRIES = 7  # More retries for DNS resolution issues
-DNS_INITIAL_DELAY = 1  # Initial delay in seconds before first DNS retry
-# Ping warmup timeout: calculate retries so last retry is this many seconds after first try
+DNS_INITIAL_DELAY = 1  # Backoff ceiling in seconds before the first retry
+# Ping warmup timeout: no retry is started this many seconds after first try
 PING_WARMUP_TIMEOUT = 8 * 60  # 8 minutes in seconds
+CODEC = get_codec()  # JSON codec for info/finalize request and response bodies
+RETRY_EXCEPTIONS = (
+    ServerDisconnectedError,
+    ClientOSError,
+    ServerTimeoutError,
+    ClientPayloadError,
+    asyncio.TimeoutError,
+)  # Transient network errors to retry
+# Retry policy for chunk uploads, downloads and info/finalize requests
+RETRY_POLICY = RetryPolicy(
+    max_attempts=MAX_RETRIES,
+    statuses=RETRY_STATUSES,
+    exceptions=RETRY_EXCEPTIONS,
+    exception_attempts={ClientConnectorError: DNS_MAX_RETRIES},
+    initial_backoff=DNS_INITIAL_DELAY,
+    multiplier=RETRY_BACKOFF,
+    max_backoff=MAX_BACKOFF,
+)
+# Retry policy for the ping warmup: any status other than 200 is retried,
+# and an open circuit is waited out, until the endpoint has had
+# PING_WARMUP_TIMEOUT seconds to start
+PING_RETRY_POLICY = RETRY_POLICY.replace(
+    max_attempts=None,
+    statuses=range(100, 600),
+    exceptions=RETRY_EXCEPTIONS + (CircuitOpenError,),
+    budget=PING_WARMUP_TIMEOUT,
+)
+
+# Circuit breakers for transfer endpoints, shared by all transfers
+CIRCUIT_BREAKERS = CircuitBreakers()
+
+
+def _retry_policy(policy, max_retries=None, retry_backoff=None):
+    """Apply the ``max_retries``/``retry_backoff`` overrides to a policy."""
+    if max_retries is not None:
+        policy = policy.replace(max_attempts=max_retries)
+    if retry_backoff is not None:
+        policy = policy.replace(multiplier=retry_backoff)
+    return policy
 
 
 def normalize_endpoint(endpoint):
@@ -59,83 +110,51 @@ def normalize_endpoint(endpoint):
     return endpoint
 
 
-def calculate_ping_retries(timeout_seconds, backoff_base):
-    """
-    Calculate the number of retries needed for ping warmup to reach timeout.
-
-    With exponential backoff, if we have n retries, the total wait time is:
-    backoff_base^1 + backoff_base^2 + ... + backoff_base^(n-1) = (backoff_base^n - backoff_base) / (backoff_base - 1)
-
-    For backoff_base = 2, this simplifies to: 2^n - 2
-
-    Args:
-        timeout_seconds: Total timeout in seconds
-        backoff_base: Exponential backoff base
-
-    Returns:
-        Number of retries needed to reach or exceed the timeout
-    """
-    if backoff_base == 2:
-        # Simplified calculation for base 2
-        # 2^n - 2 >= timeout_seconds
-        # 2^n >= timeout_seconds + 2
-        # n >= log2(timeout_seconds + 2)
-        n = math.ceil(math.log2(timeout_seconds + 2))
-    else:
-        # General case: (backoff_base^n - backoff_base) / (backoff_base - 1) >= timeout_seconds
-        # backoff_base^n >= timeout_seconds * (backoff_base - 1) + backoff_base
-        # n >= log_base(timeout_seconds * (backoff_base - 1) + backoff_base)
-        target = timeout_seconds * (backoff_base - 1) + backoff_base
-        n = math.ceil(math.log(target, backoff_base))
-
-    return max(1, int(n))
-
-
 async def ping_endpoint(
-    endpoint, auth_token, max_retries=MAX_RETRIES, retry_backoff=RETRY_BACKOFF
+    endpoint,
+    auth_token,
+    max_retries=None,
+    retry_backoff=None,
+    retry_policy=None,
 ):
     """
     Ping the endpoint to ensure it's ready before upload/download operations.
 
-    Retries on all errors (404, 500, DNS errors, etc.) with exponential backoff
-    until a 200 response is received. This handles startup timing issues.
+    Retries on all errors (404, 500, DNS errors, etc.) with capped
+    exponential backoff until a 200 response is received. This handles
+    startup timing issues.
 
     Creates a fresh TCPConnector for each attempt to force fresh DNS resolution
     and avoid stale DNS cache issues.
 
-    For ping warmup, calculates retries dynamically to ensure the last retry
-    occurs PING_WARMUP_TIMEOUT seconds after the first try.
+    By default, retries continue until PING_WARMUP_TIMEOUT seconds after the
+    first try.  Connection failures count against the endpoint's circuit
+    breaker; while the circuit is open, attempts wait for it to be probed
+    instead of contacting the endpoint.
 
     Args:
         endpoint: Server endpoint URL
         auth_token: Authentication token
-        max_retries: Maximum number of retry attempts (ignored for ping warmup)
-        retry_backoff: Exponential backoff base
+        max_retries: Maximum number of attempts, overriding the time budget
+        retry_backoff: Growth factor of the backoff ceiling per retry
+        retry_policy: RetryPolicy to use instead of PING_RETRY_POLICY
 
     Raises:
-        ConnectionError: If ping never returns 200 after max retries
-        ClientConnectorError: If DNS/connection errors persist after max retries
+        ConnectionError: If ping never returns 200 before retries run out
     """
     endpoint = normalize_endpoint(endpoint)
-    attempt = 1
-    # Calculate retries for ping warmup to reach PING_WARMUP_TIMEOUT
-    # Allow max_retries to override when explicitly provided (for testing)
-    if max_retries == MAX_RETRIES:
-        # Use default, calculate retries for ping warmup
-        ping_max_retries = calculate_ping_retries(
-            PING_WARMUP_TIMEOUT, retry_backoff
-        )
-        effective_max_retries = ping_max_retries
-    else:
-        # Use explicitly provided max_retries (for testing)
-        effective_max_retries = max_retries
-        ping_max_retries = max_retries  # For DNS error handling below
+    state = _retry_policy(
+        retry_policy or PING_RETRY_POLICY, max_retries, retry_backoff
+    ).start()
+    breaker = CIRCUIT_BREAKERS.get(endpoint)
+    reason = None
 
-    while attempt <= effective_max_retries:
+    while True:
         # Create a fresh connector for each attempt to force DNS re-resolution
         # This helps avoid stale DNS cache issues
         connector = None
         try:
+            breaker.check()
             connector = aiohttp.TCPConnector(limit=1, limit_per_host=1)
             async with aiohttp.ClientSession(connector=connector) as session:
                 async with session.get(
@@ -143,6 +162,7 @@ async def ping_endpoint(
                     headers={"Authorization": f"Bearer {auth_token}"},
                     timeout=30,
                 ) as response:
+                    breaker.record(status=response.status)
                     if response.status == 200:
                         logging.debug(
                             f"Endpoint {endpoint} is ready (ping successful)"
@@ -157,56 +177,20 @@ async def ping_endpoint(
                         message=text,
                     )
         except ClientResponseError as e:
-            # Retry on any HTTP error status
-            if attempt < effective_max_retries:
-                logging.debug(
-                    f"Ping attempt {attempt}/{effective_max_retries} failed with status {e.status}: {str(e)}"
-                )
-                await asyncio.sleep(retry_backoff**attempt)
-                attempt += 1
-                continue
-            raise ConnectionError(
-                f"Endpoint {endpoint} ping failed after {effective_max_retries} attempts. "
-                f"Last error: HTTP {e.status} - {str(e)}"
-            )
+            reason = f". Last error: HTTP {e.status} - {str(e)}"
+            delay = state.retry(e)
+        except CircuitOpenError as e:
+            # Keep reporting the failure that opened the circuit
+            reason = reason or f": {e.message}"
+            delay = state.retry(e, retry_after=e.retry_in)
         except ClientConnectorError as e:
-            # DNS resolution errors need more retries and initial delay
-            # Use the higher of DNS_MAX_RETRIES or calculated ping retries
-            if effective_max_retries == ping_max_retries:
-                effective_max_retries = max(ping_max_retries, DNS_MAX_RETRIES)
-
-            if attempt < effective_max_retries:
-                # Use initial delay for first retry, then exponential backoff
-                if attempt == 1:
-                    delay = DNS_INITIAL_DELAY
-                else:
-                    delay = retry_backoff ** (attempt - 1)
-                logging.debug(
-                    f"Ping attempt {attempt}/{effective_max_retries} failed due to DNS/connection error: {str(e)}"
-                )
-                await asyncio.sleep(delay)
-                attempt += 1
-                continue
-            raise ConnectionError(
-                f"Endpoint {endpoint} ping failed after {effective_max_retries} attempts due to DNS/connection error: {str(e)}"
-            )
-        except (
-            ServerDisconnectedError,
-            ClientOSError,
-            ServerTimeoutError,
-            ClientPayloadError,
-            asyncio.TimeoutError,
-        ) as e:
-            if attempt < effective_max_retries:
-                logging.debug(
-                    f"Ping attempt {attempt}/{effective_max_retries} failed: {str(e)}"
-                )
-                await asyncio.sleep(retry_backoff**attempt)
-                attempt += 1
-                continue
-            raise ConnectionError(
-                f"Endpoint {endpoint} ping failed after {effective_max_retries} attempts: {str(e)}"
-            )
+            breaker.record_failure()
+            reason = f" due to DNS/connection error: {str(e)}"
+            delay = state.retry(e)
+        except RETRY_EXCEPTIONS as e:
+            breaker.record_failure()
+            reason = f": {str(e)}"
+            delay = state.retry(e)
         finally:
             # Ensure connector is closed to free resources and clear DNS cache
             # This forces fresh DNS resolution on the next attempt
@@ -216,64 +200,39 @@ async def ping_endpoint(
                 except Exception:
                     # Ignore errors during cleanup
                     pass
+        if delay is None:
+            raise ConnectionError(
+                f"Endpoint {endpoint} ping failed after {state.attempt} attempts{reason}"
+            )
+        logging.debug(f"Ping attempt {state.attempt - 1} failed{reason}")
+        await asyncio.sleep(delay)
 
 
 async def retry_request(
-    func, *args, max_retries=MAX_RETRIES, retry_backoff=RETRY_BACKOFF, **kwargs
+    func,
+    *args,
+    max_retries=None,
+    retry_backoff=None,
+    retry_policy=None,
+    **kwargs,
 ):
     """
     Shared retry logic for network requests.
 
-    For DNS/connection errors (ClientConnectorError), uses more retries and
-    an initial delay to handle transient DNS resolution issues.
-    """
-    attempt = 1
-    effective_max_retries = max_retries
+    Retries according to RETRY_POLICY (or ``retry_policy``).  DNS/connection
+    errors (ClientConnectorError) are allowed up to DNS_MAX_RETRIES attempts
+    to ride out transient DNS resolution issues.
 
-    while attempt <= effective_max_retries:
-        try:
-            return await func(*args, **kwargs)
-        except ClientResponseError as e:
-            if e.status in RETRY_STATUSES and attempt < max_retries:
-                logging.debug(
-                    f"Retry {attempt}/{max_retries} due to {e.status}: {str(e)}"
-                )
-                await asyncio.sleep(retry_backoff**attempt)
-                attempt += 1
-                continue
-            raise
-        except ClientConnectorError as e:
-            # DNS resolution errors need more retries and initial delay
-            # Update effective_max_retries if this is the first DNS error
-            if effective_max_retries == max_retries:
-                effective_max_retries = max(max_retries, DNS_MAX_RETRIES)
-
-            if attempt < effective_max_retries:
-                # Use initial delay for first retry, then exponential backoff
-                if attempt == 1:
-                    delay = DNS_INITIAL_DELAY
-                else:
-                    delay = retry_backoff ** (attempt - 1)
-                logging.debug(
-                    f"Retry {attempt}/{effective_max_retries} due to DNS/connection error: {str(e)}"
-                )
-                await asyncio.sleep(delay)
-                attempt += 1
-                continue
-            raise
-        except (
-            ServerDisconnectedError,
-            ClientOSError,
-            ServerTimeoutError,
-            ClientPayloadError,
-            asyncio.TimeoutError,
-        ) as e:
-            if attempt < max_retries:
-                logging.debug(f"Retry {attempt}/{max_retries} due to {str(e)}")
-                await asyncio.sleep(retry_backoff**attempt)
-                attempt += 1
-                continue
-            raise
+    Args:
+        func: Coroutine function performing the request
+        max_retries: Maximum number of attempts, overriding the policy
+        retry_backoff: Growth factor of the backoff ceiling per retry
+        retry_policy: RetryPolicy to use instead of RETRY_POLICY
+    """
+    policy = _retry_policy(
+        retry_policy or RETRY_POLICY, max_retries, retry_backoff
+    )
+    return await policy.call(func, *args, **kwargs)
 
 
 async def upload_chunk(
@@ -316,17 +275,206 @@ async def upload_chunk(
                     f"Chunk {start}-{end} failed with status {response.status}: {text}"
                 )
 
+    # Not guarded by the endpoint's circuit breaker: the parallel chunks of
+    # an upload would trip it together, and an open circuit would then fail
+    # every other chunk's retries and abort the whole upload.  The upload
+    # is guarded by the ping before it and the finalize after it.
     await retry_request(_upload)
 
 
-async def upload(endpoint, auth_token, path):
+async def read_chunk(stream, size=CHUNK_SIZE):
+    """
+    Read ``size`` bytes from a stream, or fewer at its end.
+
+    Pipes return whatever is available (typically 64KB), so reads are
+    repeated until a full chunk is collected.
+    """
+    parts = []
+    remaining = size
+    while remaining > 0:
+        part = await stream.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    if len(parts) == 1:
+        return parts[0]  # Avoid copying full chunks
+    return b"".join(parts)
+
+
+class ChunkHasher(object):
+    """
+    Hash of a sequence of chunks, computed on a dedicated thread.
+
+    Hashing a large chunk takes milliseconds, which would block the event
+    loop (and every other transfer and log stream on it).  hashlib releases
+    the GIL for large buffers, so hashing on a thread runs in parallel with
+    the loop.  ``update`` hands a chunk to the thread once the previous one
+    is hashed, so hashing a chunk overlaps reading the next one and sending
+    the previous ones, and at most one chunk is held for hashing.
+
+    Args:
+        hash: hashlib object to update, SHA-512 by default
+    """
+
+    def __init__(self, hash=None):
+        self.hash = hash or hashlib.sha512()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="proximl-hash"
+        )
+        self._pending = None
+
+    async def update(self, chunk):
+        await self.wait()
+        self._pending = asyncio.get_running_loop().run_in_executor(
+            self._executor, self.hash.update, chunk
+        )
+
+    async def wait(self):
+        """Wait until every chunk passed to ``update`` is hashed."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
+
+    async def hexdigest(self) -> str:
+        await self.wait()
+        return self.hash.hexdigest()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+async def _upload_stream(session, endpoint, auth_token, stream, sha512):
+    """
+    Upload a stream in chunks through a pipeline of concurrent PUTs.
+
+    A reader task fills a queue of at most UPLOAD_QUEUE_SIZE chunks, which
+    PARALLEL_UPLOADS upload tasks drain, each chunk addressed by its offset
+    in ``Content-Range``.  At most UPLOAD_QUEUE_SIZE + PARALLEL_UPLOADS + 1
+    chunks are held in memory.  If any task fails, the others are cancelled.
+    ``sha512`` is updated with the stream off the event loop (see
+    ChunkHasher), and is complete when this returns.
+
+    Returns:
+        Number of bytes uploaded
+    """
+    queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+    hasher = ChunkHasher(sha512)
+    offset = 0
+
+    async def read():
+        nonlocal offset
+        while True:
+            chunk = await read_chunk(stream, CHUNK_SIZE)
+            if chunk:
+                await hasher.update(chunk)
+                chunk_offset = offset
+                offset += len(chunk)
+                # The total size is not known until the end of the stream,
+                # the server handles Content-Range with the size so far.
+                await queue.put((chunk, chunk_offset, offset))
+            if len(chunk) < CHUNK_SIZE:
+                break  # End of stream
+        for _ in range(PARALLEL_UPLOADS):
+            await queue.put(None)
+        await hasher.wait()
+
+    async def send():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            chunk, chunk_offset, total_size = item
+            await upload_chunk(
+                session,
+                endpoint,
+                auth_token,
+                total_size,
+                chunk,
+                chunk_offset,
+            )
+
+    tasks = [asyncio.ensure_future(read())] + [
+        asyncio.ensure_future(send()) for _ in range(PARALLEL_UPLOADS)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        hasher.close()
+    return offset
+
+
+class ArchiveReader(object):
+    """
+    Asynchronous reads of a TarStream, run off the event loop.
+
+    Reads (and closing) run in order on a dedicated thread, so that closing
+    the archive after a cancelled read waits for that read to finish.
+
+    Args:
+        archive: TarStream to read
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="proximl-archive"
+        )
+
+    async def read(self, size):
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.archive.read, size
+            )
+        except OSError as e:
+            raise ProxiMLException(
+                f"Unable to archive {self.archive.path}: {e}"
+            ) from e
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.archive.close
+        )
+        self._executor.shutdown(wait=False)
+
+
+async def upload(
+    endpoint,
+    auth_token,
+    path,
+    filter=None,
+    progress=None,
+    include=None,
+    exclude=None,
+):
     """
     Upload a local file or directory as a TAR stream to the server.
 
+    The archive is built while it is uploaded (see TarStream).  Entries of a
+    directory matching the patterns of its ``.proximlignore`` file or of
+    ``exclude`` are left out, and if ``include`` is given, only the files
+    matching it are uploaded (see ``archive_filter``), leaving out the
+    directories without any.
+
     Args:
         endpoint: Server endpoint URL
         auth_token: Authentication token
         path: Local file or directory path to upload
+        filter: Callable ``filter(relpath, is_dir)`` returning False for
+                directory entries to leave out of the archive
+        progress: Callable ``progress(relpath, size)`` called once each file
+                  has been archived
+        include: Patterns (gitignore syntax) of the files to upload, or None
+                 for all files
+        exclude: Patterns (gitignore syntax) of the entries to leave out
+
+    Returns:
+        Number of bytes uploaded
 
     Raises:
         ValueError: If path doesn't exist or is invalid
@@ -345,67 +493,41 @@ async def upload(endpoint, auth_token, path):
     if not os.path.exists(path):
         raise ValueError(f"Path not found: {path}")
 
-    # Determine if it's a file or directory and build tar command accordingly
     abs_path = os.path.abspath(path)
 
     if os.path.isfile(path):
-        # For a single file, create a tar with just that file
-        file_name = os.path.basename(abs_path)
-        parent_dir = os.path.dirname(abs_path)
-        # Use tar -c to create archive with single file, stream to stdout
-        # -C changes to parent directory so the file appears at root of tar
-        command = ["tar", "-c", "-C", parent_dir, file_name]
-        desc = f"Uploading file {file_name}"
+        # A single file is archived at the root of the tar file
+        desc = f"Uploading file {os.path.basename(abs_path)}"
     elif os.path.isdir(path):
-        # For a directory, archive its contents at the root of the tar file
-        # -C changes to the directory itself, and . archives all contents
-        command = ["tar", "-c", "-C", abs_path, "."]
-        dir_name = os.path.basename(abs_path)
-        desc = f"Uploading directory {dir_name}"
+        # A directory's contents are archived at the root of the tar file
+        desc = f"Uploading directory {os.path.basename(abs_path)}"
     else:
         raise ValueError(f"Path is neither a file nor directory: {path}")
 
-    process = await asyncio.create_subprocess_exec(
-        *command,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+    if os.path.isdir(abs_path):
+        filter = archive_filter(abs_path, include, exclude, filter)
+    archive = TarStream(
+        abs_path,
+        filter=filter,
+        progress=progress,
+        empty_directories=include is None,
     )
-
-    # We need to know the total size for progress, but tar doesn't tell us
-    # So we'll estimate or track bytes uploaded
+    reader = ArchiveReader(archive)
     sha512 = hashlib.sha512()
-    offset = 0
-    semaphore = asyncio.Semaphore(PARALLEL_UPLOADS)
+    started = time.monotonic()
 
     async with aiohttp.ClientSession() as session:
-        async with semaphore:
-            while True:
-                chunk = await process.stdout.read(CHUNK_SIZE)
-                if not chunk:
-                    break  # End of stream
-
-                sha512.update(chunk)
-                chunk_offset = offset
-                offset += len(chunk)
-
-                # For total_size, we'll use a large number since we don't know the actual size
-                # The server will handle the Content-Range correctly
-                await upload_chunk(
-                    session,
-                    endpoint,
-                    auth_token,
-                    offset,  # Use current offset as total (will be updated)
-                    chunk,
-                    chunk_offset,
-                )
-
-        # Wait for process to finish
-        await process.wait()
-        if process.returncode != 0:
-            stderr = await process.stderr.read()
-            raise ProxiMLException(
-                f"tar command failed: {stderr.decode() if stderr else 'Unknown error'}"
+        try:
+            offset = await _upload_stream(
+                session, endpoint, auth_token, reader, sha512
             )
+        finally:
+            await reader.close()
+        elapsed = time.monotonic() - started
+        logging.info(
+            f"{desc}: {archive.files} files, {offset} bytes in "
+            f"{elapsed:.1f}s ({offset / max(elapsed, 1e-6) / 1e6:.1f} MB/s)"
+        )
 
         # Finalize upload
         file_hash = sha512.hexdigest()
@@ -413,16 +535,22 @@ async def upload(endpoint, auth_token, path):
         async def _finalize():
             async with session.post(
                 f"{endpoint}/finalize",
-                headers={"Authorization": f"Bearer {auth_token}"},
-                json={"hash": file_hash},
+                headers={
+                    "Authorization": f"Bearer {auth_token}",
+                    "Content-Type": "application/json",
+                },
+                data=CODEC.encode({"hash": file_hash}),
             ) as response:
                 if response.status != 200:
                     text = await response.text()
                     raise ConnectionError(f"Finalize failed: {text}")
-                return await response.json()
+                return await response.json(loads=CODEC.loads)
 
-        data = await retry_request(_finalize)
+        data = await retry_request(
+            CIRCUIT_BREAKERS.get(endpoint).wrap(_finalize)
+        )
         logging.debug(f"Upload finalized: {data}")
+        return offset
 
 
 async def download(endpoint, auth_token, target_directory, file_name=None):
@@ -436,6 +564,9 @@ async def download(endpoint, auth_token, target_directory, file_name=None):
         file_name: Optional filename override for zip archive (if ARCHIVE=true).
                    If not provided, filename is extracted from Content-Disposition header.
 
+    Returns:
+        Number of bytes downloaded
+
     Raises:
         ConnectionError: If download fails or endpoint ping fails
         ProxiMLException: For other errors
@@ -475,9 +606,11 @@ async def download(endpoint, auth_token, target_directory, file_name=None):
                             status=response.status,
                             message=error_text,
                         )
-                    return await response.json()
+                    return await response.json(loads=CODEC.loads)
 
-            info = await retry_request(_get_info)
+            info = await retry_request(
+                CIRCUIT_BREAKERS.get(endpoint).wrap(_get_info)
+            )
             use_archive = info.get("archive", False)
         except InvalidURL as e:
             raise ConnectionError(
@@ -534,7 +667,9 @@ async def download(endpoint, auth_token, target_directory, file_name=None):
                 )
             return response
 
-        response = await retry_request(_download)
+        response = await retry_request(
+            CIRCUIT_BREAKERS.get(endpoint).wrap(_download)
+        )
 
         # Check Content-Type header as fallback to determine if it's a zip file
         content_type = response.headers.get("Content-Type", "").lower()
@@ -614,7 +749,9 @@ async def download(endpoint, auth_token, target_directory, file_name=None):
                 )
 
                 # Stream response to tar process
+                total_bytes = 0
                 async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    total_bytes += len(chunk)
                     extract_process.stdin.write(chunk)
                     await extract_process.stdin.drain()
 
@@ -635,13 +772,19 @@ async def download(endpoint, auth_token, target_directory, file_name=None):
         async def _finalize():
             async with session.post(
                 f"{endpoint}/finalize",
-                headers={"Authorization": f"Bearer {auth_token}"},
-                json={},
+                headers={
+                    "Authorization": f"Bearer {auth_token}",
+                    "Content-Type": "application/json",
+                },
+                data=CODEC.encode({}),
             ) as response:
                 if response.status != 200:
                     text = await response.text()
                     raise ConnectionError(f"Finalize failed: {text}")
-                return await response.json()
+                return await response.json(loads=CODEC.loads)
 
-        data = await retry_request(_finalize)
+        data = await retry_request(
+            CIRCUIT_BREAKERS.get(endpoint).wrap(_finalize)
+        )
         logging.debug(f"Download finalized: {data}")
+        return total_bytes
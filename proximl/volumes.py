@@ -11,6 +11,8 @@ from .exceptions import (
     ProxiMLException,
 )
 from proximl.utils.transfer import upload, download
+from proximl.utils.metrics import measure_transfer
+from proximl.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 
 class Volumes(object):
@@ -26,6 +28,15 @@ class Volumes(object):
         volumes = [Volume(self.proximl, **volume) for volume in resp]
         return volumes
 
+    def iter(self, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        return paginate(
+            self.proximl,
+            "/volume",
+            lambda volume: Volume(self.proximl, **volume),
+            kwargs,
+            page_size,
+        )
+
     async def create(
         self,
         name,
@@ -34,6 +45,8 @@ class Volumes(object):
         capacity,
         type="evefs",
         project_uuid=None,
+        include=None,
+        exclude=None,
         **kwargs,
     ):
         if not project_uuid:
@@ -51,6 +64,9 @@ class Volumes(object):
         logging.info(f"Creating Volume {name}")
         resp = await self.proximl._query("/volume", "POST", None, payload)
         volume = Volume(self.proximl, **resp)
+        if include is not None or exclude is not None:
+            # Only used locally, when uploading the source
+            volume._upload_filter = dict(include=include, exclude=exclude)
         logging.info(f"Created Volume {name} with id {volume.id}")
 
         return volume
@@ -62,6 +78,8 @@ class Volumes(object):
 
 
 class Volume:
+    _upload_filter = dict()  # include/exclude patterns given to create
+
     def __init__(self, proximl, **kwargs):
         self.proximl = proximl
         self._volume = kwargs
@@ -147,7 +165,17 @@ class Volume:
                     f"Volume in downloading status missing required connection properties (auth_token, hostname, source_uri).",
                 )
 
-            await upload(hostname, auth_token, source_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "upload",
+                upload(
+                    hostname,
+                    auth_token,
+                    source_uri,
+                    **self._upload_filter,
+                ),
+                entity="volume",
+            )
         elif self.status == "exporting":
             # Download task - get auth_token, hostname, and output_uri from volume
             auth_token = self._volume.get("auth_token")
@@ -160,7 +188,12 @@ class Volume:
                     f"Volume in exporting status missing required connection properties (auth_token, hostname, output_uri).",
                 )
 
-            await download(hostname, auth_token, output_uri)
+            await measure_transfer(
+                self.proximl.metrics,
+                "download",
+                download(hostname, auth_token, output_uri),
+                entity="volume",
+            )
 
     async def remove(self, force=False):
         await self.proximl._query(
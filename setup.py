@@ -37,6 +37,11 @@ setup(
     include_package_data=True,
     python_requires=">=3.8",
     install_requires=install_requires,
+    extras_require={
+        "speedups": ["orjson"],
+        "otel": ["opentelemetry-api"],
+        "boto3": ["boto3"],
+    },
     entry_points="""
         [console_scripts]
         proximl=proximl.cli:cli
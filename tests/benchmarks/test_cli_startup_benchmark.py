@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import time
+from pytest import mark
+
+pytestmark = [mark.sdk, mark.benchmark]
+
+# Modules the CLI used to import before parsing any argument
+EAGER_IMPORTS = [
+    "proximl.proximl",
+    "proximl.cli.dataset",
+    "proximl.cli.model",
+    "proximl.cli.checkpoint",
+    "proximl.cli.volume",
+    "proximl.cli.environment",
+    "proximl.cli.gpu",
+    "proximl.cli.job",
+    "proximl.cli.job.create",
+    "proximl.cli.project.secret",
+    "proximl.cli.cloudbender.service",
+]
+
+
+def _cold_start(args, preload=(), repeat=5):
+    """Best wall time of running the CLI in a fresh interpreter."""
+    code = "; ".join(
+        [
+            *[f"import {module}" for module in preload],
+            "from proximl.cli import cli",
+        ]
+        + ["cli()"]
+    )
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code, *args],
+            capture_output=True,
+            check=True,
+        )
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_cli_help_cold_start_benchmark():
+    """Compare ``proximl --help`` with lazy and eagerly imported commands."""
+    results = dict()
+    for args in (["--help"], ["job", "--help"]):
+        lazy = _cold_start(args)
+        eager = _cold_start(args, preload=EAGER_IMPORTS)
+        results[" ".join(["proximl", *args])] = (lazy, eager)
+    print(
+        "\nCLI cold start: "
+        + ", ".join(
+            f"{name} lazy={lazy * 1000:.0f}ms eager={eager * 1000:.0f}ms"
+            for name, (lazy, eager) in results.items()
+        )
+    )
@@ -0,0 +1,87 @@
+import json
+import timeit
+from pytest import mark
+
+import proximl.utils.codec as specimen
+
+pytestmark = [mark.sdk, mark.benchmark]
+
+
+def _jobs_list_response(count=2000):
+    return [
+        {
+            "job_uuid": f"job-{i}",
+            "name": f"Training Job {i}",
+            "type": "training",
+            "status": "finished",
+            "project_uuid": "proj-id-1",
+            "createdAt": "2021-01-01T00:00:01.000Z",
+            "resources": {"gpu_count": 1, "gpu_types": ["rtx3090"]},
+            "environment": {
+                "type": "DEEPLEARNING_PY39",
+                "env": [
+                    {"key": f"KEY_{k}", "value": "x" * 32} for k in range(8)
+                ],
+            },
+            "workers": [
+                {
+                    "job_worker_uuid": f"worker-{i}-{w}",
+                    "command": "python train.py --epochs 10",
+                    "status": "finished",
+                }
+                for w in range(4)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def _best_time(func, repeat=5):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def test_codec_jobs_list_decode_benchmark():
+    """Compare decoding a large jobs.list() response with each codec."""
+    body = json.dumps(_jobs_list_response()).encode("utf-8")
+    results = dict()
+    for name, (codec_class, available) in specimen.CODECS.items():
+        if not available():
+            continue
+        codec = codec_class()
+        assert codec.loads(body) == json.loads(body)
+        results[name] = _best_time(lambda: codec.loads(body))
+    print(
+        "\njobs.list() decode ({:.1f} MB): {}".format(
+            len(body) / 1e6,
+            ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in results.items()),
+        )
+    )
+
+
+def test_codec_log_frames_benchmark():
+    """Compare decoding a stream of websocket log frames with each codec."""
+    frames = [
+        json.dumps(
+            dict(
+                type="subscription",
+                stream="worker-1",
+                time=1609459200000 + i,
+                msg=f"Epoch {i}: loss=0.{i:04d} accuracy=0.9{i:03d}\n",
+            )
+        )
+        for i in range(20000)
+    ]
+    results = dict()
+    for name, (codec_class, available) in specimen.CODECS.items():
+        if not available():
+            continue
+        codec = codec_class()
+        results[name] = _best_time(
+            lambda: [codec.loads(frame) for frame in frames]
+        )
+    print(
+        "\nwebsocket log frames ({} frames): {}".format(
+            len(frames),
+            ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in results.items()),
+        )
+    )
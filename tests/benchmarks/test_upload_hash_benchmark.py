@@ -0,0 +1,76 @@
+import time
+import asyncio
+import hashlib
+from unittest.mock import Mock, patch
+from pytest import mark
+
+import proximl.utils.transfer as specimen
+
+pytestmark = [mark.sdk, mark.benchmark]
+
+UPLOAD_SIZE = 256 * 1024 * 1024  # Bytes uploaded per run
+PROBE_INTERVAL = 0.001  # Seconds between event loop latency probes
+
+
+class InlineHasher(specimen.ChunkHasher):
+    """Hashes on the event loop, as upload() used to."""
+
+    async def update(self, chunk):
+        self.hash.update(chunk)
+
+
+class MemoryStream:
+    """Stream returning full chunks of in-memory data."""
+
+    def __init__(self, size):
+        self.chunk = bytes(specimen.CHUNK_SIZE)
+        self.remaining = size
+
+    async def read(self, n):
+        size = min(n, self.remaining, len(self.chunk))
+        self.remaining -= size
+        return self.chunk[:size]
+
+
+async def _upload_chunk(*args):
+    await asyncio.sleep(0.002)
+
+
+async def _max_loop_latency(hasher_class):
+    """Largest delay of a periodic event loop timer during an upload."""
+    latencies = []
+    done = False
+
+    async def probe():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(PROBE_INTERVAL)
+            latencies.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+    probe_task = asyncio.ensure_future(probe())
+    sha512 = hashlib.sha512()
+    with patch.object(specimen, "ChunkHasher", hasher_class), patch(
+        "proximl.utils.transfer.upload_chunk", side_effect=_upload_chunk
+    ):
+        await specimen._upload_stream(
+            Mock(),
+            "https://example.com",
+            "token",
+            MemoryStream(UPLOAD_SIZE),
+            sha512,
+        )
+    done = True
+    await probe_task
+    assert sha512.hexdigest() == hashlib.sha512(bytes(UPLOAD_SIZE)).hexdigest()
+    return max(latencies)
+
+
+def test_upload_hash_loop_latency_benchmark():
+    """Compare event loop latency while hashing on and off the loop."""
+    inline = asyncio.run(_max_loop_latency(InlineHasher))
+    threaded = asyncio.run(_max_loop_latency(specimen.ChunkHasher))
+    print(
+        f"\nMax event loop latency uploading {UPLOAD_SIZE // 2 ** 20} MB: "
+        f"hash on loop={inline * 1000:.1f}ms, "
+        f"hash thread={threaded * 1000:.1f}ms"
+    )
@@ -0,0 +1,128 @@
+import sys
+import asyncio
+import click
+from unittest.mock import AsyncMock, patch
+from pytest import mark, raises
+
+pytestmark = [mark.cli, mark.unit]
+
+import proximl.cli as specimen
+
+
+def test_help_lists_lazy_commands(runner):
+    result = runner.invoke(specimen.cli, ["--help"])
+    assert result.exit_code == 0
+    for name in specimen.cli.lazy_subcommands:
+        assert name in result.output
+    assert "configure" in result.output
+
+
+def test_subcommand_loaded_on_use(runner):
+    result = runner.invoke(specimen.cli, ["cloudbender", "region", "--help"])
+    assert result.exit_code == 0
+    assert "proximl.cli.cloudbender.region" in sys.modules
+    assert specimen.cli.get_command(None, "cloudbender") is (
+        specimen.cloudbender
+    )
+    assert "region" in specimen.cloudbender.commands
+
+
+def test_package_attribute_is_command():
+    from proximl.cli.project import secret
+
+    assert specimen.project.name == "project"
+    assert specimen.project.commands["secret"] is secret
+    assert sys.modules["proximl.cli.project"].secret is secret
+    with raises(AttributeError):
+        specimen.missing
+
+
+def test_lazy_commands_short_help():
+    def check(group):
+        for name, (_, short_help) in group.lazy_subcommands.items():
+            command = group.get_command(None, name)
+            assert short_help == command.get_short_help_str(limit=100), name
+            if isinstance(command, specimen.LazyGroup):
+                check(command)
+
+    check(specimen.cli)
+
+
+class ProxiMLRunnerTests:
+    def test_runner_keeps_loop_between_steps(self):
+        proximl_runner = specimen.ProxiMLRunner()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = proximl_runner.run(current_loop())
+        second, third = proximl_runner.run(current_loop(), current_loop())
+        assert first is second is third
+        proximl_runner.close()
+        assert first.is_closed()
+
+    def test_runner_background_task_spans_steps(self):
+        proximl_runner = specimen.ProxiMLRunner()
+        events = []
+
+        async def background():
+            events.append("started")
+            await asyncio.sleep(0.01)
+            events.append("finished")
+            return "done"
+
+        async def start():
+            return asyncio.ensure_future(background())
+
+        task = proximl_runner.run(start())
+        proximl_runner.run(asyncio.sleep(0.05))
+        assert events == ["started", "finished"]
+        assert proximl_runner.run(task) == "done"
+        proximl_runner.close()
+
+    def test_runner_close_cancels_pending_and_closes_client(self):
+        with patch("proximl.cli.ProxiML", new=AsyncMock):
+            proximl_runner = specimen.ProxiMLRunner()
+            client = proximl_runner.client
+
+            async def start():
+                return asyncio.ensure_future(asyncio.sleep(60))
+
+            task = proximl_runner.run(start())
+            proximl_runner.close()
+        assert task.cancelled()
+        client.__aenter__.assert_awaited_once()
+        client.close.assert_awaited_once()
+
+    def test_runner_close_without_shutdown_default_executor(self):
+        class Python38EventLoop(asyncio.SelectorEventLoop):
+            @property
+            def shutdown_default_executor(self):
+                raise AttributeError("shutdown_default_executor")
+
+        loop = Python38EventLoop()
+        with patch("proximl.cli.asyncio.new_event_loop", return_value=loop):
+            proximl_runner = specimen.ProxiMLRunner()
+            proximl_runner.run(loop.run_in_executor(None, sum, [1, 2]))
+            proximl_runner.close()
+        assert loop.is_closed()
+
+    def test_runner_closed_with_root_context(self, runner):
+        proximl_runner = specimen.ProxiMLRunner()
+
+        @click.command()
+        def command():
+            proximl_runner.run(asyncio.sleep(0))
+
+        runner.invoke(command)
+        assert proximl_runner._loop is None
+
+    def test_runner_error(self):
+        proximl_runner = specimen.ProxiMLRunner()
+
+        async def fail():
+            raise ValueError("bad request")
+
+        with raises(click.UsageError):
+            proximl_runner.run(fail())
+        proximl_runner.close()
@@ -60,6 +60,20 @@ class RegionsTests:
             "/provider/1234/region", "GET", {}
         )
 
+    @mark.asyncio
+    async def test_iter_regions(
+        self,
+        regions,
+        mock_proximl,
+    ):
+        api_response = [dict(provider_uuid="1234", region_uuid="a")]
+        mock_proximl._query = AsyncMock(return_value=api_response)
+        result = [region async for region in regions.iter("1234")]
+        assert [region.id for region in result] == ["a"]
+        mock_proximl._query.assert_called_once_with(
+            "/provider/1234/region", "GET", {"limit": 100, "offset": 0}
+        )
+
     @mark.asyncio
     async def test_remove_region(
         self,
@@ -1,12 +1,15 @@
 import re
 import logging
 import json
+import time
 import os
 from unittest.mock import AsyncMock, patch, mock_open, MagicMock
 from pytest import mark, fixture, raises
 from aiohttp import WSMessage, WSMsgType
+from botocore.exceptions import ClientError
 
 import proximl.utils.auth as specimen
+from proximl.exceptions import CognitoError
 
 pytestmark = [mark.sdk, mark.unit]
 
@@ -43,3 +46,380 @@ def test_auth_from_envs(mock_open, mock_requests_get, mock_boto3_client):
     assert auth.__dict__.get("region") == "ap-east-1"
     assert auth.__dict__.get("client_id") == "client_id"
     assert auth.__dict__.get("pool_id") == "pool_id"
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_tokens_shared_through_cache(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+
+    def get_new_tokens(auth):
+        auth.id_token = "id"
+        auth.access_token = "access"
+        auth.refresh_token = "refresh"
+        auth.expires = time.time() + 3600
+
+    first = specimen.Auth(config_dir=str(tmp_path))
+    second = specimen.Auth(config_dir=str(tmp_path))
+    with patch.object(
+        specimen.Auth,
+        "get_new_tokens",
+        autospec=True,
+        side_effect=get_new_tokens,
+    ) as mock_get_new_tokens:
+        tokens = first.get_tokens()
+        assert second.get_tokens() == tokens
+        assert mock_get_new_tokens.call_count == 1
+    assert (
+        oct(os.stat(tmp_path / "token_cache.json").st_mode & 0o777) == "0o600"
+    )
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_token_cache_disabled(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+
+    auth = specimen.Auth(config_dir=str(tmp_path), token_cache=False)
+    assert auth.token_cache is None
+    with patch.object(specimen.Auth, "get_new_tokens") as mock_get_new_tokens:
+        auth.get_tokens()
+        mock_get_new_tokens.assert_called_once()
+    assert not os.path.exists(tmp_path / "token_cache.json")
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_renews_with_refresh_token(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+    client = MagicMock()
+    client.initiate_auth.return_value = {
+        "AuthenticationResult": {
+            "IdToken": "new-id",
+            "AccessToken": "new-access",
+        }
+    }
+
+    auth = specimen.Auth(
+        config_dir=str(tmp_path), token_cache=False, cognito_client=client
+    )
+    auth.id_token = "old-id"
+    auth.refresh_token = "refresh"
+    auth.expires = time.time() - 1
+    exp = time.time() + 3600
+    with patch.object(
+        specimen.Auth, "verify_token", return_value=dict(exp=exp)
+    ), patch.object(specimen.Auth, "get_new_tokens") as mock_get_new_tokens:
+        tokens = auth.get_tokens()
+    mock_get_new_tokens.assert_not_called()
+    client.initiate_auth.assert_called_once_with(
+        AuthFlow="REFRESH_TOKEN_AUTH",
+        AuthParameters={"REFRESH_TOKEN": "refresh"},
+        ClientId="client_id",
+    )
+    assert tokens["id_token"] == "new-id"
+    assert tokens["access_token"] == "new-access"
+    assert tokens["refresh_token"] == "refresh"
+    assert tokens["expires"] == exp - 300
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.parametrize(
+    "error",
+    [
+        CognitoError("NotAuthorizedException", "Refresh Token has expired"),
+        ClientError(
+            {"Error": {"Code": "NotAuthorizedException", "Message": ""}},
+            "InitiateAuth",
+        ),
+    ],
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_rejected_refresh_token_signs_in(
+    mock_requests_get, mock_boto3_client, error, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+    client = MagicMock()
+    client.initiate_auth.side_effect = error
+
+    auth = specimen.Auth(
+        config_dir=str(tmp_path), token_cache=False, cognito_client=client
+    )
+    auth.id_token = "old-id"
+    auth.refresh_token = "refresh"
+    auth.expires = time.time() - 1
+    with patch.object(specimen.Auth, "get_new_tokens") as mock_get_new_tokens:
+        auth.get_tokens()
+    mock_get_new_tokens.assert_called_once()
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_failed_refresh_does_not_sign_in(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+    client = MagicMock()
+    client.initiate_auth.side_effect = ConnectionError("Connection refused")
+
+    auth = specimen.Auth(
+        config_dir=str(tmp_path), token_cache=False, cognito_client=client
+    )
+    auth.id_token = "old-id"
+    auth.refresh_token = "refresh"
+    auth.expires = time.time() - 1
+    with patch.object(specimen.Auth, "get_new_tokens") as mock_get_new_tokens:
+        with raises(ConnectionError, match="Connection refused"):
+            auth.get_tokens()
+    mock_get_new_tokens.assert_not_called()
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_refreshes_with_expired_cached_refresh_token(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+
+    auth = specimen.Auth(config_dir=str(tmp_path))
+    key = auth.token_cache.key("pool_id", "client_id", "user-id")
+    auth.token_cache.set(
+        key,
+        dict(
+            id_token="old-id",
+            access_token="old-access",
+            refresh_token="cached-refresh",
+            expires=time.time() - 1,
+        ),
+    )
+
+    def refresh_tokens(auth):
+        assert auth.refresh_token == "cached-refresh"
+        auth.id_token = "new-id"
+        auth.expires = time.time() + 3600
+
+    with patch.object(
+        specimen.Auth,
+        "refresh_tokens",
+        autospec=True,
+        side_effect=refresh_tokens,
+    ), patch.object(specimen.Auth, "get_new_tokens") as mock_get_new_tokens:
+        assert auth.get_tokens()["id_token"] == "new-id"
+    mock_get_new_tokens.assert_not_called()
+    assert auth.token_cache.get(key)["id_token"] == "new-id"
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_get_tokens_min_valid(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    mock_requests_get.return_value.json.return_value = dict()
+
+    auth = specimen.Auth(config_dir=str(tmp_path), token_cache=False)
+    auth.id_token = "id"
+    auth.expires = time.time() + 300
+    with patch.object(specimen.Auth, "_renew_tokens") as mock_renew_tokens:
+        auth.get_tokens()
+        mock_renew_tokens.assert_not_called()
+        auth.get_tokens(min_valid=600)
+        mock_renew_tokens.assert_called_once()
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_get_key_cached(mock_requests_get, mock_boto3_client, tmp_path):
+    mock_requests_get.return_value.json.return_value = {
+        "keys": [{"kid": "kid1"}, {"kid": "kid2"}]
+    }
+
+    auth = specimen.Auth(config_dir=str(tmp_path))
+    mock_requests_get.reset_mock()
+    assert auth.get_key("kid1") == {"kid": "kid1"}
+    assert auth.get_key("kid2") == {"kid": "kid2"}
+    assert mock_requests_get.call_count == 1
+    assert os.path.exists(tmp_path / "jwks.json")
+    with raises(specimen.ProxiMLException):
+        auth.get_key("unknown")
+
+
+@patch.dict(
+    os.environ,
+    {"PROXIML_USER": "user-id", "PROXIML_KEY": "key"},
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_config_discovered_lazily(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    for name in ["PROXIML_REGION", "PROXIML_CLIENT_ID", "PROXIML_POOL_ID"]:
+        os.environ.pop(name, None)
+    mock_requests_get.return_value.json.return_value = {
+        "region": "us-east-1",
+        "userPoolSDKClientId": "default_client_id",
+        "userPoolId": "default_pool_id",
+    }
+
+    auth = specimen.Auth(config_dir=str(tmp_path), pool_id="pool_id")
+    mock_requests_get.assert_not_called()
+    mock_boto3_client.assert_not_called()
+    assert auth.region == "us-east-1"
+    assert auth.client_id == "default_client_id"
+    assert auth.pool_id == "pool_id"
+    assert mock_requests_get.call_count == 1
+    assert isinstance(auth.client, specimen.CognitoIdpClient)
+    assert auth.client.region_name == "us-east-1"
+    mock_boto3_client.assert_not_called()
+
+    # Discovered settings are cached on disk
+    other = specimen.Auth(config_dir=str(tmp_path))
+    assert other.client_id == "default_client_id"
+    assert mock_requests_get.call_count == 1
+    with raises(AttributeError):
+        other.unknown
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_config_not_discovered_when_configured(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    auth = specimen.Auth(config_dir=str(tmp_path))
+    assert auth.region == "ap-east-1"
+    assert auth.client_id == "client_id"
+    assert auth.pool_id == "pool_id"
+    mock_requests_get.assert_not_called()
+
+
+@patch("proximl.utils.auth.requests.get")
+def test_get_auth_config_cache_expires(mock_requests_get, tmp_path):
+    mock_requests_get.return_value.json.return_value = {"region": "us-east-1"}
+    path = str(tmp_path / "auth_config.json")
+
+    assert specimen.get_auth_config("proximl.ai", path=path) == {
+        "region": "us-east-1"
+    }
+    specimen.get_auth_config("proximl.ai", path=path)
+    assert mock_requests_get.call_count == 1
+    specimen.get_auth_config("example.com", path=path)
+    assert mock_requests_get.call_count == 2
+    specimen.get_auth_config("proximl.ai", path=path, ttl=-1)
+    assert mock_requests_get.call_count == 3
+
+
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "ap-east-1",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+def test_auth_boto3_cognito_client(
+    mock_requests_get, mock_boto3_client, tmp_path
+):
+    auth = specimen.Auth(config_dir=str(tmp_path), cognito_client="boto3")
+    assert auth.client is mock_boto3_client.return_value
+    mock_boto3_client.assert_called_once_with(
+        "cognito-idp", region_name="ap-east-1"
+    )
@@ -125,6 +125,43 @@ class DatasetsTests:
         )
         assert response.id == "data-id-1"
 
+    @mark.asyncio
+    async def test_create_dataset_upload_filters(self, datasets, mock_proximl):
+        api_response = {
+            "project_uuid": "proj-id-1",
+            "dataset_uuid": "data-id-1",
+            "name": "new dataset",
+            "status": "downloading",
+            "source_type": "local",
+            "source_uri": "~/data",
+            "auth_token": "test-token",
+            "hostname": "example.com",
+        }
+
+        mock_proximl._query = AsyncMock(return_value=api_response)
+        dataset = await datasets.create(
+            name="new dataset",
+            source_type="local",
+            source_uri="~/data",
+            include=["*.csv"],
+        )
+        # Patterns are only used locally
+        assert "include" not in mock_proximl._query.call_args.args[3]
+        with patch(
+            "proximl.datasets.Dataset.refresh", new_callable=AsyncMock
+        ):
+            with patch(
+                "proximl.datasets.upload", new_callable=AsyncMock
+            ) as mock_upload:
+                await dataset.connect()
+                mock_upload.assert_called_once_with(
+                    "example.com",
+                    "test-token",
+                    "~/data",
+                    include=["*.csv"],
+                    exclude=None,
+                )
+
 
 class DatasetTests:
     def test_dataset_properties(self, dataset):
@@ -162,3 +162,27 @@ def test_region_error():
         repr(error) == "RegionError(failed, {'id': 'id-1', 'status': 'failed'})"
     )
     assert str(error) == "RegionError(failed, {'id': 'id-1', 'status': 'failed'})"
+
+
+def test_circuit_open_error():
+    """Test CircuitOpenError exception."""
+    error = specimen.CircuitOpenError("host", 12.34)
+    assert isinstance(error, specimen.ConnectionError)
+    assert error.host == "host"
+    assert error.retry_in == 12.34
+    assert error.message == "Circuit breaker open for host, retry in 12.3s"
+    assert (
+        repr(error)
+        == "CircuitOpenError(host, Circuit breaker open for host, retry in 12.3s)"
+    )
+    assert str(error) == repr(error)
+
+
+def test_cognito_error():
+    """Test CognitoError exception."""
+    error = specimen.CognitoError("NotAuthorizedException", "Bad token")
+    assert isinstance(error, specimen.ProxiMLException)
+    assert error.code == "NotAuthorizedException"
+    assert error.message == "Bad token"
+    assert repr(error) == "CognitoError(NotAuthorizedException, 'Bad token')"
+    assert str(error) == repr(error)
@@ -0,0 +1,94 @@
+import json
+import subprocess
+import sys
+from pytest import mark
+
+pytestmark = [mark.sdk, mark.unit]
+
+# CPU seconds allowed for "from proximl import ProxiML" in a fresh
+# interpreter (CPU rather than wall time, as parallel test runs share the
+# machine).  Generous so that slow CI machines pass; eager imports of boto3,
+# jose and every subsystem used to exceed it several times over on a laptop.
+IMPORT_TIME_BUDGET = 1.5
+# Modules only needed to sign in, or by subsystems that were not used
+LAZY_MODULES = [
+    "boto3",
+    "jose",
+    "requests",
+    "opentelemetry",
+    "proximl.cloudbender",
+    "proximl.projects",
+    "proximl.jobs",
+    "proximl.datasets",
+]
+
+
+def run(statements, tmp_path):
+    """Run statements in a fresh interpreter and report what they imported."""
+    code = "\n".join(
+        [
+            "import json, sys, time",
+            "start = time.process_time()",
+            *statements,
+            "elapsed = time.process_time() - start",
+            "print(json.dumps(dict(elapsed=elapsed, modules=list(sys.modules))))",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=dict(
+            PROXIML_CONFIG_DIR=str(tmp_path),
+            PROXIML_USER="user-id",
+            PROXIML_KEY="key",
+            PROXIML_REGION="us-east-1",
+            PROXIML_CLIENT_ID="client_id",
+            PROXIML_POOL_ID="pool_id",
+        ),
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_package_is_lazy(tmp_path):
+    result = run(["import proximl"], tmp_path)
+    assert "proximl.proximl" not in result["modules"]
+    assert "aiohttp" not in result["modules"]
+
+
+def test_import_client_within_budget(tmp_path):
+    result = run(["from proximl import ProxiML"], tmp_path)
+    assert result["elapsed"] < IMPORT_TIME_BUDGET
+    for module in LAZY_MODULES:
+        assert module not in result["modules"]
+
+
+def test_client_subsystems_imported_on_use(tmp_path):
+    result = run(
+        [
+            "from proximl import ProxiML",
+            "client = ProxiML()",
+            "client.jobs",
+        ],
+        tmp_path,
+    )
+    assert "proximl.jobs" in result["modules"]
+    for module in LAZY_MODULES:
+        if module != "proximl.jobs":
+            assert module not in result["modules"]
+
+
+def test_cli_help_imports_no_commands(tmp_path):
+    result = run(
+        [
+            "from click.testing import CliRunner",
+            "from proximl.cli import cli",
+            "output = CliRunner().invoke(cli, ['--help']).output",
+            "assert 'proxiML job commands.' in output, output",
+        ],
+        tmp_path,
+    )
+    assert "proximl.proximl" not in result["modules"]
+    assert "proximl.cli.job" not in result["modules"]
+    assert "proximl.cli.cloudbender" not in result["modules"]
@@ -194,6 +194,19 @@ class JobsTests:
         await jobs.list()
         mock_proximl._query.assert_called_once_with("/job", "GET", dict())
 
+    async def test_jobs_iter(
+        self,
+        jobs,
+        mock_proximl,
+    ):
+        api_response = [dict(job_uuid="job-id-1", name="first one")]
+        mock_proximl._query = AsyncMock(return_value=api_response)
+        result = [job async for job in jobs.iter(page_size=10, status="new")]
+        assert [job.id for job in result] == ["job-id-1"]
+        mock_proximl._query.assert_called_once_with(
+            "/job", "GET", dict(status="new", limit=10, offset=0)
+        )
+
     async def test_jobs_remove(
         self,
         jobs,
@@ -236,6 +249,63 @@ class JobsTests:
             "/job", "POST", None, expected_payload
         )
 
+    async def test_job_create_local_upload_filters(
+        self,
+        jobs,
+        mock_proximl,
+    ):
+        requested_config = dict(
+            name="job_name",
+            type="training",
+            gpu_type="GTX 1060",
+            gpu_count=1,
+            disk_size=10,
+            model=dict(
+                source_type="local",
+                source_uri="~/model",
+                exclude=["*.ckpt", ".git/"],
+            ),
+        )
+        expected_payload = dict(
+            project_uuid="proj-id-1",
+            name="job_name",
+            type="training",
+            resources=dict(
+                gpu_type_id="GTX 1060", gpu_count=1, disk_size=10, max_price=10
+            ),
+            model=dict(source_type="local", source_uri="~/model"),
+            worker_commands=[],
+        )
+        api_response = dict(
+            job_uuid="job-id-1",
+            type="training",
+            status="waiting for data/model download",
+            model=dict(
+                source_type="local",
+                source_uri="~/model",
+                auth_token="model-token",
+                hostname="model-host.com",
+            ),
+        )
+
+        mock_proximl._query = AsyncMock(return_value=api_response)
+        job = await jobs.create(**requested_config)
+        mock_proximl._query.assert_called_once_with(
+            "/job", "POST", None, expected_payload
+        )
+        with patch("proximl.jobs.Job.refresh", new_callable=AsyncMock):
+            with patch(
+                "proximl.jobs.upload", new_callable=AsyncMock
+            ) as mock_upload:
+                await job.connect()
+                mock_upload.assert_called_once_with(
+                    "model-host.com",
+                    "model-token",
+                    "~/model",
+                    include=None,
+                    exclude=["*.ckpt", ".git/"],
+                )
+
     async def test_job_create_from_empty_copy(
         self,
         jobs,
@@ -1,6 +1,8 @@
 import re
 import logging
 import json
+import asyncio
+import threading
 import os
 from unittest.mock import AsyncMock, patch, mock_open, MagicMock
 from pytest import mark, fixture, raises
@@ -25,8 +27,9 @@ class MockAsyncContextManager:
 
 def create_mock_aiohttp_session(mock_responses):
     """Helper to create a mock aiohttp ClientSession with responses.
-    Returns tuple: (MockAsyncContextManager, mock_session) where mock_session
-    can be accessed to check call_args."""
+    Returns tuple: (mock_session, mock_session) so the first value can be
+    used as the ClientSession return value and the second to check
+    call_args."""
     call_count = [0]
     
     def mock_request_impl(*args, **kwargs):
@@ -35,9 +38,10 @@ def create_mock_aiohttp_session(mock_responses):
         return MockAsyncContextManager(mock_responses[idx])
     
     mock_session = AsyncMock()
+    mock_session.closed = False
     mock_request = MagicMock(side_effect=mock_request_impl)
     mock_session.request = mock_request
-    return MockAsyncContextManager(mock_session), mock_session
+    return mock_session, mock_session
 
 
 def create_mock_aiohttp_response(status=200, json_data=None, headers=None, read_data=None):
@@ -594,9 +598,10 @@ async def test_proximl_query_client_response_error(mock_open, mock_requests_get,
     )
 
     mock_session = AsyncMock()
+    mock_session.closed = False
     mock_request = MagicMock(side_effect=error)
     mock_session.request = mock_request
-    mock_session_ctx = MockAsyncContextManager(mock_session)
+    mock_session_ctx = mock_session
 
     # The code raises ApiError with a string, which causes an AttributeError
     # This is actually a bug in the code, but we test that it raises an error
@@ -676,3 +681,690 @@ def test_proximl_project_property(mock_open, mock_requests_get, mock_boto3_clien
     proximl = specimen.ProxiML()
     proximl.active_project = "proj-123"
     assert proximl.project == "proj-123"
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_reuses_session(mock_open, mock_requests_get, mock_boto3_client):
+    """Test _query() reuses one pooled session across calls."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML(connection_limit=5, dns_cache_ttl=10)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session([mock_resp])
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ) as mock_client_session, patch(
+        "proximl.proximl.aiohttp.TCPConnector"
+    ) as mock_connector:
+        async with proximl:
+            await proximl._query("/test", "GET")
+            await proximl._query("/test", "GET")
+
+    mock_client_session.assert_called_once()
+    mock_connector.assert_called_once()
+    assert mock_connector.call_args[1]["limit"] == 5
+    assert mock_connector.call_args[1]["ttl_dns_cache"] == 10
+    assert mock_session.request.call_count == 2
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_async_context_manager_closes_session(mock_open, mock_requests_get, mock_boto3_client):
+    """Test the client closes its session when used as a context manager."""
+    mock_boto3_client.return_value = MagicMock()
+
+    mock_session_ctx, mock_session = create_mock_aiohttp_session([])
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        async with specimen.ProxiML() as proximl:
+            assert await proximl._get_session() is mock_session
+
+    mock_session.close.assert_awaited_once()
+    assert not proximl._sessions
+
+    # Closing an already closed client is a no-op
+    await proximl.close()
+    mock_session.close.assert_awaited_once()
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+def test_proximl_session_per_call(mock_open, mock_requests_get, mock_boto3_client):
+    """Test each call gets its own session unless the client is opened."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+
+    async def call():
+        async with proximl._call_session() as session:
+            return session
+
+    first = asyncio.run(call())
+    second = asyncio.run(call())
+    assert first is not second
+    assert first.closed and second.closed
+    assert not proximl._sessions
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+def test_proximl_session_per_event_loop(mock_open, mock_requests_get, mock_boto3_client):
+    """Test clients shared by threads keep one session per event loop."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+    opened = threading.Barrier(2)
+    first_closed = threading.Event()
+    sessions = dict()
+
+    async def use(name):
+        loop = asyncio.get_running_loop()
+        async with proximl:
+            session = sessions[name] = await proximl._get_session()
+            await loop.run_in_executor(None, opened.wait)
+            if name == "second":
+                # Still in use after the other thread closed the client
+                await loop.run_in_executor(None, first_closed.wait)
+                assert not session.closed
+                assert await proximl._get_session() is session
+        if name == "first":
+            first_closed.set()
+
+    threads = [
+        threading.Thread(target=asyncio.run, args=(use(name),))
+        for name in ("first", "second")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert sessions["first"] is not sessions["second"]
+    assert sessions["first"].closed and sessions["second"].closed
+    assert not proximl._sessions
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+def test_proximl_session_of_closed_loop_closed(mock_open, mock_requests_get, mock_boto3_client):
+    """Test the pooled session of a closed event loop is closed."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+
+    async def open_client():
+        await proximl.__aenter__()
+        return await proximl._get_session()
+
+    first = asyncio.run(open_client())
+    assert not first.closed
+    second = asyncio.run(proximl._get_session())
+    assert first.closed
+    assert list(proximl._sessions.values()) == [second]
+    asyncio.run(proximl.close())
+    assert second.closed
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_coalesces_concurrent_gets(mock_open, mock_requests_get, mock_boto3_client):
+    """Test concurrent identical GETs share one request when enabled."""
+    import asyncio
+
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML(coalesce_requests=True)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    async def slow_json(**kwargs):
+        await asyncio.sleep(0.01)
+        return {"result": "success"}
+
+    mock_resp = create_mock_aiohttp_response()
+    mock_resp.json = AsyncMock(side_effect=slow_json)
+    mock_session_ctx, mock_session = create_mock_aiohttp_session([mock_resp])
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        results = await asyncio.gather(
+            *[proximl._query("/job/1", "GET") for _ in range(4)],
+            proximl._query("/job/2", "GET"),
+        )
+
+    assert all(result == {"result": "success"} for result in results)
+    assert mock_session.request.call_count == 2
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_response_cache(mock_open, mock_requests_get, mock_boto3_client):
+    """Test cached GETs skip the API and writes invalidate them."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML(cache=True)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp = create_mock_aiohttp_response(json_data=[{"id": "env-1"}])
+    mock_resp.headers = {"ETag": '"v1"'}
+    mock_session_ctx, mock_session = create_mock_aiohttp_session([mock_resp])
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        first = await proximl._query("/job/environments", "GET")
+        second = await proximl._query("/job/environments", "GET")
+        assert first == second == [{"id": "env-1"}]
+        assert mock_session.request.call_count == 1
+
+        # uncached paths always go to the API
+        await proximl._query("/job", "GET")
+        await proximl._query("/job", "GET")
+        assert mock_session.request.call_count == 3
+
+        # writes invalidate the cached resource
+        await proximl._query("/job/environments", "PATCH")
+        await proximl._query("/job/environments", "GET")
+        assert mock_session.request.call_count == 5
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_response_cache_revalidation(mock_open, mock_requests_get, mock_boto3_client):
+    """Test stale cache entries are revalidated with If-None-Match."""
+    from proximl.utils.cache import ResponseCache
+
+    mock_boto3_client.return_value = MagicMock()
+
+    cache = ResponseCache(ttls={r"/job/environments": 10})
+    proximl = specimen.ProxiML(cache=cache)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp = create_mock_aiohttp_response(json_data=[{"id": "env-1"}])
+    mock_resp.headers = {"ETag": '"v1"'}
+    mock_resp_304 = create_mock_aiohttp_response(status=304)
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp, mock_resp_304]
+    )
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch("proximl.utils.cache.time.monotonic", return_value=100):
+            await proximl._query("/job/environments", "GET")
+        with patch("proximl.utils.cache.time.monotonic", return_value=200):
+            result = await proximl._query("/job/environments", "GET")
+
+    assert result == [{"id": "env-1"}]
+    assert mock_session.request.call_count == 2
+    headers = mock_session.request.call_args[1]["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert cache.revalidations == 1
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_429_honors_retry_after(mock_open, mock_requests_get, mock_boto3_client):
+    """Test _query() retries throttled requests after Retry-After."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+    limit = proximl._rate_limiter.concurrency.limit
+
+    mock_resp_429 = create_mock_aiohttp_response(
+        status=429, read_data=b'{"message": "Too Many Requests"}'
+    )
+    mock_resp_429.headers = {"Retry-After": "7"}
+    mock_resp_success = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_429, mock_resp_success]
+    )
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch(
+            "proximl.proximl.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            result = await proximl._query("/test", "GET")
+
+    assert result == {"result": "success"}
+    assert mock_sleep.call_args_list[0][0][0] >= 7
+    assert proximl._rate_limiter.throttled == 1
+    assert proximl._rate_limiter.concurrency.limit < limit
+    assert proximl._rate_limiter.concurrency.in_flight == 0
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_post_502_not_retried(mock_open, mock_requests_get, mock_boto3_client):
+    """Test _query() does not retry a non-idempotent request on 502."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp_502 = create_mock_aiohttp_response(
+        status=502, read_data=b'{"error": "Bad Gateway"}'
+    )
+    mock_resp_success = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_502, mock_resp_success]
+    )
+
+    from proximl.exceptions import ApiError
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch("proximl.proximl.asyncio.sleep", new_callable=AsyncMock):
+            with raises(ApiError):
+                await proximl._query("/test", "POST", data={"a": 1})
+    assert mock_session.request.call_count == 1
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_retry_policy_override(mock_open, mock_requests_get, mock_boto3_client):
+    """Test _query() accepts a per-call retry policy."""
+    from proximl.utils.retry import RetryPolicy
+
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp_404 = create_mock_aiohttp_response(
+        status=404, read_data=b'{"error": "Not Found"}'
+    )
+    mock_resp_success = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_404, mock_resp_success]
+    )
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch(
+            "proximl.proximl.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            result = await proximl._query(
+                "/test",
+                "GET",
+                retry_policy=RetryPolicy(statuses={404}, max_backoff=1),
+            )
+
+    assert result == {"result": "success"}
+    assert 0 <= mock_sleep.call_args[0][0] <= 1
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_circuit_breaker(mock_open, mock_requests_get, mock_boto3_client):
+    """Test _query() fails fast once the API host circuit is open."""
+    from proximl.exceptions import CircuitOpenError
+    from proximl.utils.circuit_breaker import CircuitBreakers
+
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML(
+        circuit_breakers=CircuitBreakers(failure_threshold=2)
+    )
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp = create_mock_aiohttp_response(
+        status=502, read_data=b'{"error": "Bad Gateway"}'
+    )
+    mock_session_ctx, mock_session = create_mock_aiohttp_session([mock_resp])
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch("proximl.proximl.asyncio.sleep", new_callable=AsyncMock):
+            with raises(CircuitOpenError):
+                await proximl._query("/test", "GET")
+            assert mock_session.request.call_count == 2
+            with raises(CircuitOpenError):
+                await proximl._query("/other", "GET")
+            assert mock_session.request.call_count == 2
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_throttling_keeps_circuit_closed(mock_open, mock_requests_get, mock_boto3_client):
+    """Test 503 throttling responses do not open the API host circuit."""
+    mock_boto3_client.return_value = MagicMock()
+
+    proximl = specimen.ProxiML()
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    from proximl.exceptions import ApiError
+    from proximl.utils.retry import RetryPolicy
+
+    mock_resp_503 = create_mock_aiohttp_response(
+        status=503, read_data=b'{"error": "Service Unavailable"}'
+    )
+    mock_resp_success = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_503] * 5 + [mock_resp_success]
+    )
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch("proximl.proximl.asyncio.sleep", new_callable=AsyncMock):
+            for i in range(5):
+                with raises(ApiError):
+                    await proximl._query(
+                        f"/test/{i}",
+                        "GET",
+                        retry_policy=RetryPolicy(max_attempts=1),
+                    )
+            result = await proximl._query("/test", "GET")
+
+    assert result == {"result": "success"}
+    assert mock_session.request.call_count == 6
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_retry_waits_for_circuit_probe(mock_open, mock_requests_get, mock_boto3_client):
+    """Test a retried request waits for an open circuit to be probed."""
+    from proximl.utils.circuit_breaker import CircuitBreakers
+
+    mock_boto3_client.return_value = MagicMock()
+
+    breakers = CircuitBreakers(failure_threshold=1)
+    proximl = specimen.ProxiML(circuit_breakers=breakers)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    mock_resp_502 = create_mock_aiohttp_response(
+        status=502, read_data=b'{"error": "Bad Gateway"}'
+    )
+    mock_resp_success = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_502, mock_resp_success]
+    )
+
+    async def sleep(delay):
+        # Let the time slept pass for the circuit
+        for breaker in breakers._breakers.values():
+            if breaker._opened_at is not None:
+                breaker._opened_at -= delay
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch("proximl.proximl.asyncio.sleep", side_effect=sleep):
+            result = await proximl._query("/test", "GET")
+
+    assert result == {"result": "success"}
+    assert mock_session.request.call_count == 2
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_hedged_get(mock_open, mock_requests_get, mock_boto3_client):
+    """Test a slow GET is hedged and the faster response is used."""
+    import asyncio
+    from proximl.utils.hedge import Hedger
+
+    mock_boto3_client.return_value = MagicMock()
+
+    hedger = Hedger(delay=0.01, budget=1)
+    proximl = specimen.ProxiML(hedge_requests=hedger)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+
+    async def stalled_json(**kwargs):
+        await asyncio.sleep(10)
+        return {"result": "slow"}
+
+    mock_resp_slow = create_mock_aiohttp_response()
+    mock_resp_slow.json = AsyncMock(side_effect=stalled_json)
+    mock_resp_fast = create_mock_aiohttp_response(json_data={"result": "fast"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_slow, mock_resp_fast]
+    )
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        result = await asyncio.wait_for(proximl._query("/job/1", "GET"), 1)
+        assert result == {"result": "fast"}
+        assert hedger.fired == 1
+        assert hedger.won == 1
+
+        # Writes are never hedged
+        await proximl._query("/job/1", "PATCH", data={})
+        assert hedger.requests == 1
+    assert proximl._rate_limiter.concurrency.in_flight == 0
+
+
+@patch("proximl.utils.auth.boto3.client")
+@patch("proximl.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@patch.dict(
+    os.environ,
+    {
+        "PROXIML_USER": "user-id",
+        "PROXIML_KEY": "key",
+        "PROXIML_REGION": "region",
+        "PROXIML_CLIENT_ID": "client_id",
+        "PROXIML_POOL_ID": "pool_id",
+    },
+)
+@mark.asyncio
+async def test_proximl_query_metrics(mock_open, mock_requests_get, mock_boto3_client):
+    """Test _query reports latency, attempts and sizes to the metrics sink."""
+    from proximl.utils.metrics import InMemorySink
+
+    mock_boto3_client.return_value = MagicMock()
+
+    sink = InMemorySink()
+    proximl = specimen.ProxiML(metrics=sink)
+    proximl.auth.get_tokens = MagicMock(return_value={"id_token": "token123"})
+    assert proximl.metrics is sink
+
+    mock_resp_error = create_mock_aiohttp_response(
+        status=429, read_data=b'{"error": "Too Many Requests"}'
+    )
+    mock_resp_ok = create_mock_aiohttp_response(json_data={"result": "success"})
+    mock_session_ctx, mock_session = create_mock_aiohttp_session(
+        [mock_resp_error, mock_resp_ok]
+    )
+
+    with patch(
+        "proximl.proximl.aiohttp.ClientSession", return_value=mock_session_ctx
+    ), patch("proximl.proximl.aiohttp.TCPConnector"):
+        with patch("proximl.proximl.asyncio.sleep", new_callable=AsyncMock):
+            await proximl._query(
+                "/job/0a1b2c3d-0000-4000-8000-123456789abc", "PATCH", data={"a": 1}
+            )
+
+    tags = dict(method="PATCH", path="/job/{id}", status=200)
+    assert sink.get("api.request", **tags).count == 1
+    assert sink.get("api.request.attempts", **tags).total == 2
+    assert sink.get("api.request.bytes_sent", **tags).total == 2 * len(
+        proximl.codec.encode({"a": 1})
+    )
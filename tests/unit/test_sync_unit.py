@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+from pytest import fixture, mark, raises
+
+import proximl.sync as specimen
+from proximl.exceptions import ProxiMLException
+from proximl.jobs import Job, Jobs
+
+pytestmark = [mark.sdk, mark.unit]
+
+JOBS = [
+    dict(job_uuid=f"job-id-{i}", name=f"job {i}", status="running")
+    for i in range(3)
+]
+
+
+@fixture
+def async_client():
+    client = MagicMock()
+    client.threads = []
+
+    async def query(path, method, params=None, *args, **kwargs):
+        client.threads.append(threading.current_thread())
+        if path == "/job/job-id-1":
+            return JOBS[1]
+        return JOBS
+
+    client._query = AsyncMock(side_effect=query)
+    client.close = AsyncMock()
+    client.jobs = Jobs(client)
+    return client
+
+
+@fixture
+def proximl_client(async_client):
+    with patch("proximl.sync.AsyncProxiML", return_value=async_client):
+        proximl_client = specimen.ProxiML()
+    yield proximl_client
+    proximl_client.close()
+
+
+class SyncProxiMLTests:
+    def test_sync_list_runs_on_loop_thread(self, proximl_client, async_client):
+        jobs = proximl_client.jobs.list()
+        assert [job.id for job in jobs] == [job["job_uuid"] for job in JOBS]
+        assert isinstance(jobs[0], specimen.SyncProxy)
+        assert async_client.threads[0] is not threading.current_thread()
+
+    def test_sync_entity_methods(self, proximl_client):
+        job = proximl_client.jobs.get("job-id-1")
+        assert job.name == "job 1"
+        assert str(job) == str(Job(proximl_client.client, **JOBS[1]))
+        job.refresh()
+        assert job.status == "running"
+
+    def test_sync_iter(self, proximl_client):
+        names = [job.name for job in proximl_client.jobs.iter(page_size=10)]
+        assert names == [job["name"] for job in JOBS]
+
+    def test_sync_concurrent_threads(self, proximl_client, async_client):
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(proximl_client.jobs.list())
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(results) == 8
+        assert len(set(async_client.threads)) == 1
+
+    def test_sync_inside_running_loop(self, proximl_client):
+        async def notebook_cell():
+            return proximl_client.jobs.list()
+
+        assert len(asyncio.run(notebook_cell())) == len(JOBS)
+
+    def test_sync_close(self, async_client):
+        with patch("proximl.sync.AsyncProxiML", return_value=async_client):
+            with specimen.ProxiML() as proximl_client:
+                proximl_client.jobs.list()
+        # Opened on the loop thread, so calls share its connection pool
+        async_client.__aenter__.assert_awaited_once()
+        async_client.close.assert_awaited_once()
+        with raises(ProxiMLException):
+            proximl_client.jobs.list()
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+from pytest import mark
+
+import proximl.utils.cache as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+class ResponseCacheTests:
+    def test_ttl_for_default_paths(self):
+        cache = specimen.ResponseCache()
+        assert cache.ttl_for("/job/environments") == 3600
+        assert cache.ttl_for("/project/proj-1/gputypes") == 300
+        assert cache.ttl_for("/provider/prov-1/region") == 300
+        assert cache.ttl_for("/job") == 0
+        assert cache.ttl_for("/job/job-1") == 0
+
+    def test_ttl_for_custom_paths(self):
+        cache = specimen.ResponseCache(ttls={r"/dataset/public": 30})
+        assert cache.ttl_for("/dataset/public") == 30
+        assert cache.ttl_for("/job/environments") == 0
+
+    def test_set_and_get(self):
+        cache = specimen.ResponseCache()
+        cache.set(("url", ()), "/project", [{"id": "1"}])
+        entry = cache.get(("url", ()))
+        assert entry.fresh
+        assert entry.value == [{"id": "1"}]
+        assert cache.hits == 1
+        assert cache.get(("other", ())) is None
+        assert cache.misses == 1
+
+    def test_set_ignores_uncached_paths(self):
+        cache = specimen.ResponseCache()
+        cache.set(("url", ()), "/job", [])
+        assert len(cache) == 0
+
+    def test_set_ignores_no_store(self):
+        cache = specimen.ResponseCache()
+        cache.set(
+            ("url", ()), "/project", [], {"Cache-Control": "private, no-store"}
+        )
+        assert len(cache) == 0
+
+    def test_set_copies_value(self):
+        cache = specimen.ResponseCache()
+        value = [{"id": "1"}]
+        cache.set(("url", ()), "/project", value)
+        value[0]["id"] = "2"
+        assert cache.get(("url", ())).value == [{"id": "1"}]
+
+    def test_entry_expires(self):
+        cache = specimen.ResponseCache(ttls={r"/project": 10})
+        with patch("proximl.utils.cache.time.monotonic", return_value=100):
+            cache.set(("url", ()), "/project", [])
+        with patch("proximl.utils.cache.time.monotonic", return_value=111):
+            entry = cache.get(("url", ()))
+            assert not entry.fresh
+            assert cache.hits == 0
+
+    def test_validators(self):
+        cache = specimen.ResponseCache()
+        cache.set(
+            ("url", ()),
+            "/project",
+            [],
+            {
+                "ETag": '"abc"',
+                "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+        )
+        entry = cache.get(("url", ()))
+        assert entry.validators == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+    def test_revalidated_refreshes_entry(self):
+        cache = specimen.ResponseCache(ttls={r"/project": 10})
+        with patch("proximl.utils.cache.time.monotonic", return_value=100):
+            cache.set(("url", ()), "/project", [{"id": "1"}], {"ETag": "x"})
+        with patch("proximl.utils.cache.time.monotonic", return_value=200):
+            entry = cache.get(("url", ()))
+            assert cache.revalidated(("url", ()), entry) == [{"id": "1"}]
+            assert cache.get(("url", ())).fresh
+        assert cache.revalidations == 1
+
+    def test_lru_eviction(self):
+        cache = specimen.ResponseCache(max_entries=2)
+        cache.set(("a", ()), "/project", 1)
+        cache.set(("b", ()), "/project", 2)
+        cache.get(("a", ()))
+        cache.set(("c", ()), "/project", 3)
+        assert cache.get(("a", ())) is not None
+        assert cache.get(("b", ())) is None
+        assert cache.get(("c", ())) is not None
+
+    def test_invalidate_related_paths(self):
+        cache = specimen.ResponseCache()
+        cache.set(("projects", ()), "/project", [])
+        cache.set(("gpus", ()), "/project/proj-1/gputypes", [])
+        cache.set(("other", ()), "/project/proj-2/gputypes", [])
+        cache.set(("envs", ()), "/job/environments", [])
+        cache.invalidate("/project/proj-1")
+        assert cache.get(("projects", ())) is None
+        assert cache.get(("gpus", ())) is None
+        assert cache.get(("other", ())) is not None
+        assert cache.get(("envs", ())) is not None
+
+    def test_invalidate_does_not_match_partial_segments(self):
+        cache = specimen.ResponseCache(ttls={r"/provider/[^/]+": 10})
+        cache.set(("a", ()), "/provider/abc", [])
+        cache.invalidate("/provider/ab")
+        assert len(cache) == 1
+
+    def test_clear(self):
+        cache = specimen.ResponseCache()
+        cache.set(("a", ()), "/project", 1)
+        cache.clear()
+        assert len(cache) == 0
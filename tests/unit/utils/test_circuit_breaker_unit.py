@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import Mock, AsyncMock, patch
+from pytest import mark, raises
+from aiohttp import ClientResponseError
+from aiohttp.client_exceptions import ClientConnectorError
+
+import proximl.utils.circuit_breaker as specimen
+from proximl.exceptions import CircuitOpenError, ConnectionError
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+class IsFailureTests:
+    def test_is_failure_status(self):
+        assert specimen.is_failure(status=502)
+        assert specimen.is_failure(status=504)
+        assert not specimen.is_failure(status=404)
+        assert not specimen.is_failure(status=429)
+        assert not specimen.is_failure(status=503)
+        assert not specimen.is_failure(status=200)
+
+    def test_is_failure_error(self):
+        assert specimen.is_failure(asyncio.TimeoutError())
+        assert specimen.is_failure(
+            ClientConnectorError(connection_key=Mock(), os_error=OSError())
+        )
+        assert specimen.is_failure(
+            ClientResponseError(request_info=Mock(), history=(), status=502)
+        )
+        assert not specimen.is_failure(
+            ClientResponseError(request_info=Mock(), history=(), status=400)
+        )
+        assert not specimen.is_failure(ConnectionError("bad request"))
+
+
+class CircuitBreakerTests:
+    def test_circuit_breaker_opens_after_threshold(self):
+        breaker = specimen.CircuitBreaker("host", failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == specimen.CLOSED
+        breaker.check()
+        breaker.record_failure()
+        assert breaker.state == specimen.OPEN
+        assert breaker.trips == 1
+        with raises(CircuitOpenError) as error:
+            breaker.check()
+        assert error.value.host == "host"
+        assert 0 < error.value.retry_in <= breaker.recovery_timeout
+
+    def test_circuit_breaker_success_resets_failures(self):
+        breaker = specimen.CircuitBreaker("host", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == specimen.CLOSED
+
+    def test_circuit_breaker_half_open_probe(self):
+        breaker = specimen.CircuitBreaker("host", recovery_timeout=10)
+        with patch("proximl.utils.circuit_breaker.time.monotonic") as now:
+            now.return_value = 100
+            trip(breaker)
+            now.return_value = 110
+            assert breaker.state == specimen.HALF_OPEN
+            breaker.check()
+            # Only one probe is let through
+            with raises(CircuitOpenError):
+                breaker.check()
+            breaker.record_success()
+            assert breaker.state == specimen.CLOSED
+            breaker.check()
+
+    def test_circuit_breaker_failed_probe_reopens(self):
+        breaker = specimen.CircuitBreaker("host", recovery_timeout=10)
+        with patch("proximl.utils.circuit_breaker.time.monotonic") as now:
+            now.return_value = 100
+            trip(breaker)
+            now.return_value = 110
+            breaker.check()
+            now.return_value = 115
+            breaker.record_failure()
+            assert breaker.state == specimen.OPEN
+            assert breaker.retry_in == 10
+            assert breaker.trips == 1
+
+    def test_circuit_breaker_record(self):
+        breaker = specimen.CircuitBreaker("host", failure_threshold=1)
+        breaker.record(status=404)
+        assert breaker.state == specimen.CLOSED
+        breaker.record(status=502)
+        assert breaker.state == specimen.OPEN
+
+    @mark.asyncio
+    async def test_circuit_breaker_wrap(self):
+        breaker = specimen.CircuitBreaker("host", failure_threshold=2)
+        func = AsyncMock(side_effect=asyncio.TimeoutError())
+        guarded = breaker.wrap(func)
+        for _ in range(2):
+            with raises(asyncio.TimeoutError):
+                await guarded("arg")
+        with raises(CircuitOpenError):
+            await guarded("arg")
+        assert func.call_count == 2
+        func.assert_called_with("arg")
+
+    @mark.asyncio
+    async def test_circuit_breaker_wrap_success(self):
+        breaker = specimen.CircuitBreaker("host", failure_threshold=2)
+        breaker.record_failure()
+        guarded = breaker.wrap(AsyncMock(return_value="ok"))
+        assert await guarded() == "ok"
+        assert breaker.failures == 0
+
+
+class CircuitBreakersTests:
+    def test_circuit_breakers_keyed_by_host(self):
+        breakers = specimen.CircuitBreakers(failure_threshold=2)
+        a = breakers.get("https://a.example.com/upload")
+        assert breakers.get("https://a.example.com/ping") is a
+        assert breakers.get("a.example.com") is a
+        assert breakers.get("https://b.example.com") is not a
+        assert a.failure_threshold == 2
+        breakers.clear()
+        assert breakers.get("https://a.example.com") is not a
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+from pytest import mark, raises
+
+import proximl.utils.codec as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+PAYLOAD = {
+    "job_uuid": "job-1",
+    "name": "tëst",
+    "workers": [{"status": "running", "gpu_count": 1, "price": 0.5}],
+    "tags": None,
+}
+
+
+class GetCodecTests:
+    def test_get_codec_prefers_fastest_installed(self):
+        codec = specimen.get_codec()
+        if specimen.orjson is not None:
+            assert codec.name == "orjson"
+        elif specimen.ujson is not None:
+            assert codec.name == "ujson"
+        else:
+            assert codec.name == "json"
+
+    def test_get_codec_falls_back_to_stdlib(self):
+        with patch.object(specimen, "orjson", None), patch.object(
+            specimen, "ujson", None
+        ):
+            assert specimen.get_codec().name == "json"
+
+    def test_get_codec_by_name(self):
+        assert specimen.get_codec("json").name == "json"
+
+    def test_get_codec_instance(self):
+        codec = specimen.JsonCodec()
+        assert specimen.get_codec(codec) is codec
+
+    def test_get_codec_unknown(self):
+        with raises(ValueError, match="Unknown JSON codec"):
+            specimen.get_codec("yaml")
+
+    def test_get_codec_not_installed(self):
+        with patch.object(specimen, "ujson", None):
+            with raises(ValueError, match="not installed"):
+                specimen.get_codec("ujson")
+
+
+class CodecTests:
+    def _available_codecs(self):
+        return [
+            codec_class()
+            for codec_class, available in specimen.CODECS.values()
+            if available()
+        ]
+
+    def test_round_trip(self):
+        for codec in self._available_codecs():
+            assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+            assert codec.loads(codec.encode(PAYLOAD)) == PAYLOAD
+
+    def test_dumps_returns_str_and_encode_returns_bytes(self):
+        for codec in self._available_codecs():
+            assert isinstance(codec.dumps(PAYLOAD), str)
+            assert isinstance(codec.encode(PAYLOAD), bytes)
+
+    def test_encode_none(self):
+        for codec in self._available_codecs():
+            assert codec.encode(None) == b"null"
+
+    def test_compatible_with_stdlib(self):
+        stdlib = specimen.JsonCodec()
+        for codec in self._available_codecs():
+            assert stdlib.loads(codec.encode(PAYLOAD)) == PAYLOAD
+            assert codec.loads(stdlib.encode(PAYLOAD)) == PAYLOAD
@@ -0,0 +1,90 @@
+import json
+from unittest.mock import MagicMock, patch
+from pytest import mark, raises
+
+import proximl.utils.cognito as specimen
+from proximl.exceptions import CognitoError
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def make_response(status_code=200, data=None, text=""):
+    response = MagicMock()
+    response.status_code = status_code
+    if data is None:
+        response.json.side_effect = ValueError("not json")
+    else:
+        response.json.return_value = data
+    response.text = text
+    return response
+
+
+class CognitoIdpClientTests:
+    @patch("proximl.utils.cognito.requests.Session")
+    def test_initiate_auth(self, mock_session_class):
+        session = mock_session_class.return_value
+        session.post.return_value = make_response(
+            data={"ChallengeName": "PASSWORD_VERIFIER"}
+        )
+        client = specimen.CognitoIdpClient("us-east-1")
+        result = client.initiate_auth(
+            AuthFlow="USER_SRP_AUTH",
+            AuthParameters={"USERNAME": "user"},
+            ClientId="client_id",
+        )
+        assert result == {"ChallengeName": "PASSWORD_VERIFIER"}
+        args, kwargs = session.post.call_args
+        assert args[0] == "https://cognito-idp.us-east-1.amazonaws.com/"
+        assert (
+            kwargs["headers"]["X-Amz-Target"]
+            == "AWSCognitoIdentityProviderService.InitiateAuth"
+        )
+        assert kwargs["headers"]["Content-Type"] == (
+            "application/x-amz-json-1.1"
+        )
+        assert json.loads(kwargs["data"]) == {
+            "AuthFlow": "USER_SRP_AUTH",
+            "AuthParameters": {"USERNAME": "user"},
+            "ClientId": "client_id",
+        }
+
+    @patch("proximl.utils.cognito.requests.Session")
+    def test_session_reused(self, mock_session_class):
+        session = mock_session_class.return_value
+        session.post.return_value = make_response(data={})
+        client = specimen.CognitoIdpClient("us-east-1")
+        client.initiate_auth(AuthFlow="REFRESH_TOKEN_AUTH")
+        client.respond_to_auth_challenge(ChallengeName="PASSWORD_VERIFIER")
+        mock_session_class.assert_called_once()
+        assert (
+            session.post.call_args.kwargs["headers"]["X-Amz-Target"]
+            == "AWSCognitoIdentityProviderService.RespondToAuthChallenge"
+        )
+        client.close()
+        session.close.assert_called_once()
+
+    @patch("proximl.utils.cognito.requests.Session")
+    def test_error(self, mock_session_class):
+        mock_session_class.return_value.post.return_value = make_response(
+            400,
+            data={
+                "__type": "com.amazonaws#NotAuthorizedException",
+                "message": "Refresh Token has expired",
+            },
+        )
+        client = specimen.CognitoIdpClient("us-east-1")
+        with raises(CognitoError) as error:
+            client.initiate_auth(AuthFlow="REFRESH_TOKEN_AUTH")
+        assert error.value.code == "NotAuthorizedException"
+        assert error.value.message == "Refresh Token has expired"
+
+    @patch("proximl.utils.cognito.requests.Session")
+    def test_error_without_body(self, mock_session_class):
+        mock_session_class.return_value.post.return_value = make_response(
+            503, text="Service Unavailable"
+        )
+        client = specimen.CognitoIdpClient("us-east-1")
+        with raises(CognitoError) as error:
+            client.initiate_auth(AuthFlow="REFRESH_TOKEN_AUTH")
+        assert error.value.code == "HTTP 503"
+        assert error.value.message == "Service Unavailable"
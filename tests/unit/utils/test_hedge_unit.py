@@ -0,0 +1,125 @@
+import asyncio
+from pytest import mark, raises
+
+import proximl.utils.hedge as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def make_request(delays, results=None, errors=None):
+    """Return a request function whose n-th call takes delays[n]."""
+    calls = []
+
+    async def request():
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(delays[index])
+        if errors and errors[index]:
+            raise errors[index]
+        return results[index] if results else index
+
+    return request, calls
+
+
+class HedgerTests:
+    def test_hedger_invalid_percentile(self):
+        with raises(ValueError):
+            specimen.Hedger(percentile=0)
+
+    def test_hedger_delay_from_percentile(self):
+        hedger = specimen.Hedger(percentile=90, initial_delay=2)
+        assert hedger.delay() == 2
+        for latency in range(1, 101):
+            hedger.record(latency / 100)
+        assert hedger.delay() == 0.91
+
+    def test_hedger_delay_bounds(self):
+        hedger = specimen.Hedger(min_delay=0.5)
+        for _ in range(specimen.MIN_SAMPLES):
+            hedger.record(0.01)
+        assert hedger.delay() == 0.5
+        assert specimen.Hedger(delay=0.2).delay() == 0.2
+
+    @mark.asyncio
+    async def test_hedger_fast_request_not_hedged(self):
+        hedger = specimen.Hedger(delay=0.5, budget=1)
+        request, calls = make_request([0])
+        assert await hedger.run(request) == 0
+        assert len(calls) == 1
+        assert hedger.fired == 0
+
+    @mark.asyncio
+    async def test_hedger_hedge_wins(self):
+        hedger = specimen.Hedger(delay=0.01, budget=1)
+        request, calls = make_request([10, 0])
+        assert await asyncio.wait_for(hedger.run(request), 1) == 1
+        assert len(calls) == 2
+        assert hedger.fired == 1
+        assert hedger.won == 1
+
+    @mark.asyncio
+    async def test_hedger_primary_wins(self):
+        hedger = specimen.Hedger(delay=0.01, budget=1)
+        request, calls = make_request([0.05, 10])
+        assert await asyncio.wait_for(hedger.run(request), 1) == 0
+        assert hedger.fired == 1
+        assert hedger.won == 0
+
+    @mark.asyncio
+    async def test_hedger_budget(self):
+        hedger = specimen.Hedger(delay=0.01, budget=0.5)
+        request, calls = make_request([0.03, 0.03, 0.03, 0.03])
+        await hedger.run(request)
+        # The first request is within the budget, the second is not
+        assert hedger.fired == 1
+        await hedger.run(request)
+        assert hedger.fired == 1
+        assert hedger.requests == 2
+
+    @mark.asyncio
+    async def test_hedger_budget_burst(self):
+        hedger = specimen.Hedger(delay=0.01, budget=0.1, burst=2)
+        fast, _ = make_request([0] * 1000)
+        for _ in range(1000):
+            await hedger.run(fast)
+        assert hedger.fired == 0
+        # A slowdown after a long healthy run only spends the capped burst
+        # and then the budget of the new requests
+        slow, _ = make_request([0.03] * 16)
+        for _ in range(8):
+            await hedger.run(slow)
+        assert hedger.fired == 3
+
+    @mark.asyncio
+    async def test_hedger_failed_primary_uses_hedge(self):
+        hedger = specimen.Hedger(delay=0.01, budget=1)
+        request, calls = make_request(
+            [0.05, 0.1], errors=[ValueError("primary"), None]
+        )
+        assert await asyncio.wait_for(hedger.run(request), 1) == 1
+        assert hedger.won == 1
+
+    @mark.asyncio
+    async def test_hedger_all_fail(self):
+        hedger = specimen.Hedger(delay=0.01, budget=1)
+        request, calls = make_request(
+            [0.02, 0.01], errors=[ValueError("primary"), KeyError("hedge")]
+        )
+        with raises(ValueError, match="primary"):
+            await asyncio.wait_for(hedger.run(request), 1)
+
+    @mark.asyncio
+    async def test_hedger_cancel(self):
+        hedger = specimen.Hedger(delay=0.01, budget=1)
+        request, calls = make_request([10, 10])
+        task = asyncio.ensure_future(hedger.run(request))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with raises(asyncio.CancelledError):
+            await task
+        assert len(calls) == 2
+        assert not [
+            t
+            for t in asyncio.all_tasks()
+            if t is not asyncio.current_task() and not t.done()
+        ]
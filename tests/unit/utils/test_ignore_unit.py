@@ -0,0 +1,160 @@
+import io
+import tarfile
+from pytest import mark, fixture
+
+import proximl.utils.ignore as specimen
+from proximl.utils.tar_stream import TarStream
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+@fixture
+def repo(tmp_path):
+    for relpath in (
+        "train.py",
+        "README.md",
+        "src/model.py",
+        "src/__pycache__/model.cpython-311.pyc",
+        ".git/HEAD",
+        "venv/lib/site.py",
+        "checkpoints/epoch1.ckpt",
+        "checkpoints/best.ckpt",
+        "data/a.csv",
+        "data/raw/b.csv",
+        "notes.txt~",
+    ):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(relpath.encode())
+    return tmp_path
+
+
+def archived(path, **kwargs):
+    """Return the names of the files an upload of path would archive."""
+    archive = TarStream(
+        str(path), filter=specimen.archive_filter(str(path), **kwargs)
+    )
+    with tarfile.open(fileobj=io.BytesIO(bytes(archive.read()))) as tar:
+        return sorted(
+            member.name[2:] for member in tar.getmembers() if member.isreg()
+        )
+
+
+class IgnoreRulesTests:
+    def test_ignore_rules_patterns(self):
+        rules = specimen.IgnoreRules(
+            [
+                "# comment",
+                "",
+                "*.pyc",
+                "__pycache__/",
+                "/build",
+                "doc/*.txt",
+                "**/tmp/**",
+                "a/**/b",
+                "x[0-9].log",
+                "\\#notes",
+                "trailing   ",
+            ]
+        )
+        for relpath, is_dir in (
+            ("m.pyc", False),
+            ("src/m.pyc", False),
+            ("__pycache__", True),
+            ("src/__pycache__", True),
+            ("build", True),
+            ("doc/a.txt", False),
+            ("q/tmp/z", False),
+            ("a/b", False),
+            ("a/x/y/b", False),
+            ("x1.log", False),
+            ("#notes", False),
+            ("trailing", False),
+        ):
+            assert rules.match(relpath, is_dir), relpath
+        for relpath, is_dir in (
+            ("m.py", False),
+            ("__pycache__", False),
+            ("src/build", True),
+            ("doc/x/a.txt", False),
+            ("xa.log", False),
+            ("comment", False),
+        ):
+            assert not rules.match(relpath, is_dir), relpath
+
+    def test_ignore_rules_negation(self):
+        rules = specimen.IgnoreRules(["*.ckpt", "!best.ckpt", "\\!bang"])
+        assert rules.match("epoch1.ckpt", False)
+        assert not rules.match("checkpoints/best.ckpt", False)
+        assert rules.match("!bang", False)
+
+    def test_ignore_rules_match_tree(self):
+        rules = specimen.IgnoreRules(["src/"])
+        assert rules.match_tree("src/pkg/model.py", False)
+        assert not rules.match("src/pkg/model.py", False)
+        assert not rules.match_tree("train.py", False)
+
+    def test_ignore_rules_match_inside(self):
+        rules = specimen.IgnoreRules(["src/*/model.py", "!venv/"])
+        assert rules.match_inside("src")
+        assert rules.match_inside("src/pkg")
+        assert rules.match_inside("src/pkg/model.py/x")
+        assert not rules.match_inside("data")
+        assert not rules.match_inside("venv")
+        assert specimen.IgnoreRules(["*.py"]).match_inside("venv/lib")
+        assert specimen.IgnoreRules(["a/**/b"]).match_inside("a/x/y")
+        assert not specimen.IgnoreRules(["a/**/b"]).match_inside("c")
+
+
+class ArchiveFilterTests:
+    def test_archive_filter_none(self, repo):
+        assert specimen.archive_filter(str(repo)) is None
+
+    def test_archive_filter_ignore_file(self, repo):
+        (repo / specimen.IGNORE_FILE).write_text(
+            "# Python\n__pycache__/\n.git/\nvenv/\n*.ckpt\n!best.ckpt\n*~\n"
+        )
+        assert archived(repo) == [
+            specimen.IGNORE_FILE,
+            "README.md",
+            "checkpoints/best.ckpt",
+            "data/a.csv",
+            "data/raw/b.csv",
+            "src/model.py",
+            "train.py",
+        ]
+
+    def test_archive_filter_include_exclude(self, repo):
+        (repo / specimen.IGNORE_FILE).write_text(".git/\nvenv/\n")
+        assert archived(
+            repo, include=["*.py", "data/"], exclude=["data/raw/"]
+        ) == ["data/a.csv", "src/model.py", "train.py"]
+
+    def test_archive_filter_include_walk(self, repo):
+        select = specimen.archive_filter(
+            str(repo), include=["src/*.py", "data/raw/"]
+        )
+        for relpath in (".git", "venv", "checkpoints", "src/__pycache__"):
+            assert not select(relpath, True), relpath
+        for relpath in ("src", "data", "data/raw"):
+            assert select(relpath, True), relpath
+        archive = TarStream(str(repo), filter=select, empty_directories=False)
+        with tarfile.open(fileobj=io.BytesIO(bytes(archive.read()))) as tar:
+            assert tar.getnames() == [
+                ".",
+                "./data",
+                "./data/raw",
+                "./data/raw/b.csv",
+                "./src",
+                "./src/model.py",
+            ]
+
+    def test_archive_filter_combined(self, repo):
+        select = specimen.archive_filter(
+            str(repo),
+            exclude=[".git/"],
+            filter=lambda relpath, is_dir: relpath != "venv",
+        )
+        assert not select(".git", True)
+        assert not select("venv", True)
+        assert select("src", True)
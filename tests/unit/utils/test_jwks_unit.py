@@ -0,0 +1,72 @@
+import time
+from unittest.mock import MagicMock, patch
+from pytest import mark
+
+import proximl.utils.jwks as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def make_fetch(*kid_sets):
+    """Return a fetch mock returning a key set per call."""
+    return MagicMock(
+        side_effect=[
+            dict(keys=[dict(kid=kid, kty="RSA") for kid in kids])
+            for kids in kid_sets
+        ]
+    )
+
+
+class JwksCacheTests:
+    def test_jwks_cache_fetches_once(self):
+        fetch = make_fetch(["a", "b"])
+        cache = specimen.JwksCache(fetch)
+        assert cache.get("a") == dict(kid="a", kty="RSA")
+        assert cache.get("b") == dict(kid="b", kty="RSA")
+        assert fetch.call_count == 1
+
+    def test_jwks_cache_expires(self):
+        fetch = make_fetch(["a"], ["a"])
+        cache = specimen.JwksCache(fetch, ttl=10)
+        cache.get("a")
+        with patch(
+            "proximl.utils.jwks.time.time", return_value=time.time() + 11
+        ):
+            cache.get("a")
+        assert fetch.call_count == 2
+
+    def test_jwks_cache_refetches_unknown_kid(self):
+        fetch = make_fetch(["a"], ["a", "b"])
+        cache = specimen.JwksCache(fetch)
+        cache.get("a")
+        # Refetches for unknown kids are rate limited
+        assert cache.get("b") is None
+        assert fetch.call_count == 1
+        cache._fetched -= specimen.MIN_REFETCH_INTERVAL + 1
+        assert cache.get("b") == dict(kid="b", kty="RSA")
+        assert fetch.call_count == 2
+
+    def test_jwks_cache_shared_through_file(self, tmp_path):
+        path = str(tmp_path / "jwks.json")
+        first = specimen.JwksCache(make_fetch(["a"]), path=path, source="p")
+        first.get("a")
+        fetch = make_fetch(["a"])
+        second = specimen.JwksCache(fetch, path=path, source="p")
+        assert second.get("a") == dict(kid="a", kty="RSA")
+        fetch.assert_not_called()
+
+    def test_jwks_cache_ignores_file_of_other_source(self, tmp_path):
+        path = str(tmp_path / "jwks.json")
+        specimen.JwksCache(make_fetch(["a"]), path=path, source="p1").get("a")
+        fetch = make_fetch(["b"])
+        other = specimen.JwksCache(fetch, path=path, source="p2")
+        assert other.get("b") == dict(kid="b", kty="RSA")
+        assert fetch.call_count == 1
+
+    def test_jwks_cache_corrupt_file(self, tmp_path):
+        path = tmp_path / "jwks.json"
+        path.write_text("[]")
+        fetch = make_fetch(["a"])
+        cache = specimen.JwksCache(fetch, path=str(path))
+        assert cache.get("a")
+        assert fetch.call_count == 1
@@ -0,0 +1,32 @@
+from pytest import mark, raises
+
+import proximl.utils.lazy as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+class Owner(object):
+    ident = specimen.LazyAttribute("builtins", "id")
+
+
+class LazyTests:
+    def test_lazy_module(self):
+        module = specimen.LazyModule("json")
+        assert module.dumps([1]) == "[1]"
+
+    def test_lazy_module_missing(self):
+        module = specimen.LazyModule("proximl_missing_module")
+        with raises(ImportError):
+            module.anything
+
+    def test_lazy_attribute_created_once(self):
+        owner = Owner()
+        assert "ident" not in vars(owner)
+        assert owner.ident == id(owner)
+        assert vars(owner)["ident"] == id(owner)
+
+    def test_lazy_attribute_assignable(self):
+        owner = Owner()
+        owner.ident = "replaced"
+        assert owner.ident == "replaced"
+        assert isinstance(Owner.ident, specimen.LazyAttribute)
@@ -0,0 +1,158 @@
+import sys
+import asyncio
+import aiohttp
+from unittest.mock import MagicMock, patch
+from pytest import mark, raises
+
+import proximl.utils.metrics as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+class FailingSink(specimen.MetricsSink):
+    def record(self, name, value, tags):
+        raise RuntimeError("sink down")
+
+
+class MetricsTests:
+    def test_path_template(self):
+        assert specimen.path_template("/job") == "/job"
+        assert specimen.path_template("/job/123/logs") == "/job/{id}/logs"
+        assert (
+            specimen.path_template(
+                "/project/0a1b2c3d-0000-4000-8000-123456789abc/datastore"
+            )
+            == "/project/{id}/datastore"
+        )
+        assert specimen.path_template("/job/abc") == "/job/abc"
+
+    def test_record_without_sink(self):
+        specimen.record(None, "api.request", 1.0)
+
+    def test_record_swallows_sink_errors(self):
+        specimen.record(FailingSink(), "api.request", 1.0, method="GET")
+
+    def test_metrics_sink_not_implemented(self):
+        with raises(NotImplementedError):
+            specimen.MetricsSink().record("api.request", 1.0, dict())
+
+    def test_timer_records_tags_and_values(self):
+        sink = specimen.InMemorySink()
+        with patch(
+            "proximl.utils.metrics.time.monotonic", side_effect=[10.0, 12.5]
+        ):
+            with specimen.Timer(sink, "api.request", method="GET") as timer:
+                timer.tags["status"] = 200
+                timer.add("api.request.attempts", 1)
+                timer.add("api.request.attempts", 2)
+        histogram = sink.get("api.request", method="GET", status=200)
+        assert histogram.count == 1
+        assert histogram.total == 2.5
+        attempts = sink.get("api.request.attempts", method="GET", status=200)
+        assert attempts.count == 1
+        assert attempts.total == 2
+
+    def test_timer_records_error(self):
+        sink = specimen.InMemorySink()
+        with raises(ValueError):
+            with specimen.Timer(sink, "api.request", method="GET"):
+                raise ValueError("bad")
+        assert sink.get("api.request", method="GET", error="ValueError")
+
+    def test_timer_without_sink(self):
+        with specimen.Timer(None, "api.request") as timer:
+            timer.add("api.request.attempts", 1)
+
+    def test_histogram(self):
+        histogram = specimen.Histogram(reservoir_size=100)
+        assert histogram.mean is None
+        assert histogram.percentile(50) is None
+        for value in range(1, 101):
+            histogram.add(value)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 100
+        assert snapshot["min"] == 1
+        assert snapshot["max"] == 100
+        assert snapshot["mean"] == 50.5
+        assert snapshot["p50"] == 51
+        assert snapshot["p99"] == 100
+
+    def test_histogram_reservoir_keeps_recent_values(self):
+        histogram = specimen.Histogram(reservoir_size=2)
+        for value in [100, 1, 2]:
+            histogram.add(value)
+        assert histogram.count == 3
+        assert histogram.max == 100
+        assert histogram.percentile(99) == 2
+
+    def test_in_memory_sink_summary(self):
+        sink = specimen.InMemorySink()
+        sink.record("api.request", 0.1, dict(path="/job"))
+        sink.record("api.request", 0.3, dict(path="/job"))
+        sink.record("api.request", 1.0, dict(path="/dataset"))
+        sink.record("ws.message", 50, dict(entity="job"))
+        summary = sink.summary("api.request")
+        assert [row["tags"] for row in summary] == [
+            dict(path="/dataset"),
+            dict(path="/job"),
+        ]
+        assert summary[1]["count"] == 2
+        assert len(sink.summary()) == 3
+        sink.clear()
+        assert sink.summary() == []
+
+    def test_opentelemetry_sink(self):
+        meter = MagicMock()
+        sink = specimen.OpenTelemetrySink(meter=meter)
+        sink.record("api.request", 0.5, dict(method="GET", status=None))
+        sink.record("api.request", 0.7, dict(method="GET", status=200))
+        meter.create_histogram.assert_called_once_with(
+            "proximl.api.request", unit="s"
+        )
+        histogram = meter.create_histogram.return_value
+        histogram.record.assert_any_call(0.5, attributes=dict(method="GET"))
+        histogram.record.assert_any_call(
+            0.7, attributes=dict(method="GET", status=200)
+        )
+
+    def test_opentelemetry_sink_requires_package(self):
+        with patch.dict(sys.modules, {"opentelemetry": None}):
+            with raises(ImportError):
+                specimen.OpenTelemetrySink()
+
+    def test_trace_config(self):
+        config = specimen.trace_config(specimen.InMemorySink())
+        assert isinstance(config, aiohttp.TraceConfig)
+        assert len(config.on_request_end) == 1
+        assert len(config.on_response_chunk_received) == 1
+
+    @mark.asyncio
+    async def test_measure_transfer(self):
+        sink = specimen.InMemorySink()
+
+        async def transfer():
+            await asyncio.sleep(0.01)
+            return 1000
+
+        size = await specimen.measure_transfer(
+            sink, "upload", transfer(), entity="dataset"
+        )
+        assert size == 1000
+        tags = dict(direction="upload", entity="dataset")
+        assert sink.get("transfer.duration", **tags).count == 1
+        assert sink.get("transfer.bytes", **tags).total == 1000
+        assert sink.get("transfer.throughput", **tags).total > 0
+
+    @mark.asyncio
+    async def test_measure_transfer_error(self):
+        sink = specimen.InMemorySink()
+
+        async def transfer():
+            raise ConnectionError("failed")
+
+        with raises(ConnectionError):
+            await specimen.measure_transfer(sink, "download", transfer())
+        assert sink.get(
+            "transfer.duration", direction="download", error="ConnectionError"
+        )
+        assert not sink.get("transfer.bytes", direction="download")
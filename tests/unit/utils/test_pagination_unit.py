@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+from pytest import mark, raises
+
+import proximl.utils.pagination as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def _pages(items, page_size):
+    async def query(path, method, params):
+        offset = params["offset"]
+        return items[offset : offset + params["limit"]]
+
+    return query
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class PaginateTests:
+    @mark.asyncio
+    async def test_paginate_multiple_pages(self):
+        items = [dict(id=i) for i in range(7)]
+        proximl = Mock()
+        proximl._query = AsyncMock(side_effect=_pages(items, 3))
+        result = await _collect(
+            specimen.paginate(
+                proximl, "/job", lambda item: item["id"], dict(a=1), 3
+            )
+        )
+        assert result == list(range(7))
+        assert proximl._query.call_count == 3
+        proximl._query.assert_any_call(
+            "/job", "GET", dict(a=1, limit=3, offset=6)
+        )
+
+    @mark.asyncio
+    async def test_paginate_exact_multiple_requests_empty_page(self):
+        items = [dict(id=i) for i in range(6)]
+        proximl = Mock()
+        proximl._query = AsyncMock(side_effect=_pages(items, 3))
+        result = await _collect(
+            specimen.paginate(
+                proximl, "/job", lambda item: item["id"], None, 3
+            )
+        )
+        assert result == list(range(6))
+        assert proximl._query.call_count == 3
+
+    @mark.asyncio
+    async def test_paginate_empty(self):
+        proximl = Mock()
+        proximl._query = AsyncMock(return_value=[])
+        result = await _collect(
+            specimen.paginate(proximl, "/job", lambda item: item)
+        )
+        assert result == []
+
+    @mark.asyncio
+    async def test_paginate_server_ignores_limit(self):
+        items = [dict(id=i) for i in range(10)]
+        proximl = Mock()
+        proximl._query = AsyncMock(return_value=items)
+        result = await _collect(
+            specimen.paginate(
+                proximl, "/job", lambda item: item["id"], None, 3
+            )
+        )
+        assert result == list(range(10))
+        proximl._query.assert_called_once()
+
+    @mark.asyncio
+    async def test_paginate_server_ignores_offset(self):
+        items = [dict(id=i) for i in range(3)]
+        proximl = Mock()
+        proximl._query = AsyncMock(return_value=items)
+        result = await _collect(
+            specimen.paginate(
+                proximl, "/job", lambda item: item["id"], None, 3
+            )
+        )
+        assert result == [0, 1, 2]
+        assert proximl._query.call_count == 2
+
+    @mark.asyncio
+    async def test_paginate_prefetches_next_page(self):
+        items = [dict(id=i) for i in range(4)]
+        requested = []
+        proximl = Mock()
+
+        async def query(path, method, params):
+            requested.append(params["offset"])
+            return items[params["offset"] : params["offset"] + 2]
+
+        proximl._query = query
+        iterator = specimen.paginate(
+            proximl, "/job", lambda item: item["id"], None, 2
+        )
+        assert await iterator.__anext__() == 0
+        await asyncio.sleep(0)
+        # the second page is requested before the first is consumed
+        assert requested == [0, 2]
+        await iterator.aclose()
+
+    @mark.asyncio
+    async def test_paginate_close_cancels_prefetch(self):
+        proximl = Mock()
+        started = asyncio.Event()
+
+        async def query(path, method, params):
+            if params["offset"]:
+                started.set()
+                await asyncio.sleep(10)
+            return [dict(id=1), dict(id=2)]
+
+        proximl._query = query
+        iterator = specimen.paginate(
+            proximl, "/job", lambda item: item["id"], None, 2
+        )
+        await iterator.__anext__()
+        await started.wait()
+        await iterator.aclose()
+        tasks = [
+            task
+            for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+        await asyncio.sleep(0)
+        assert all(task.done() for task in tasks)
+
+    @mark.asyncio
+    async def test_paginate_invalid_page_size(self):
+        with raises(ValueError):
+            await _collect(specimen.paginate(Mock(), "/job", None, None, 0))
@@ -0,0 +1,182 @@
+import time
+import asyncio
+from email.utils import formatdate
+from unittest.mock import patch
+from pytest import mark, raises
+
+import proximl.utils.rate_limit as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+class ParseRetryAfterTests:
+    def test_parse_retry_after_seconds(self):
+        assert specimen.parse_retry_after("5") == 5.0
+
+    def test_parse_retry_after_http_date(self):
+        value = formatdate(time.time() + 30, usegmt=True)
+        assert 25 < specimen.parse_retry_after(value) <= 30
+
+    def test_parse_retry_after_past_date(self):
+        value = formatdate(time.time() - 30, usegmt=True)
+        assert specimen.parse_retry_after(value) == 0
+
+    def test_parse_retry_after_invalid(self):
+        assert specimen.parse_retry_after(None) is None
+        assert specimen.parse_retry_after("") is None
+        assert specimen.parse_retry_after("application/json") is None
+
+
+class TokenBucketTests:
+    def test_token_bucket_invalid_rate(self):
+        with raises(ValueError):
+            specimen.TokenBucket(0)
+
+    @mark.asyncio
+    async def test_token_bucket_allows_burst(self):
+        bucket = specimen.TokenBucket(rate=1, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.1
+
+    @mark.asyncio
+    async def test_token_bucket_limits_rate(self):
+        bucket = specimen.TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+
+class AimdLimiterTests:
+    def test_aimd_increase_and_decrease(self):
+        limiter = specimen.AimdLimiter(initial=4, minimum=1, maximum=5)
+        limiter.on_success()
+        assert limiter.limit == 4.25
+        limiter.on_throttle()
+        assert limiter.limit == 2.125
+        for _ in range(10):
+            limiter.on_throttle()
+        assert limiter.limit == 1
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.limit == 5
+
+    @mark.asyncio
+    async def test_aimd_decrease_once_per_window(self):
+        limiter = specimen.AimdLimiter(initial=8, maximum=8)
+        windows = await asyncio.gather(*[limiter.acquire() for _ in range(8)])
+        # Every request in flight is throttled
+        for window in windows:
+            limiter.release()
+            limiter.on_throttle(window)
+        assert limiter.limit == 4
+        window = await limiter.acquire()
+        limiter.release()
+        limiter.on_throttle(window)
+        assert limiter.limit == 2
+
+    @mark.asyncio
+    async def test_aimd_limits_concurrency(self):
+        limiter = specimen.AimdLimiter(initial=2, maximum=2)
+        active = []
+        peak = []
+
+        async def work():
+            await limiter.acquire()
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+            limiter.release()
+
+        await asyncio.gather(*[work() for _ in range(6)])
+        assert max(peak) == 2
+        assert limiter.in_flight == 0
+
+    @mark.asyncio
+    async def test_aimd_cancelled_waiter(self):
+        limiter = specimen.AimdLimiter(initial=1, maximum=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire(), 1)
+
+    def test_aimd_reset_on_new_loop(self):
+        limiter = specimen.AimdLimiter(initial=1, maximum=1)
+        asyncio.run(limiter.acquire())
+        # the slot taken on the first loop does not block the next one
+        asyncio.run(asyncio.wait_for(limiter.acquire(), 1))
+
+    def test_aimd_slots_per_loop(self):
+        limiter = specimen.AimdLimiter(initial=1, maximum=1)
+
+        async def release():
+            limiter.release()
+
+        first = asyncio.new_event_loop()
+        second = asyncio.new_event_loop()
+        try:
+            first.run_until_complete(limiter.acquire())
+            second.run_until_complete(asyncio.wait_for(limiter.acquire(), 1))
+            assert limiter.in_flight == 2
+            # Alternating between the loops does not reset their slots
+            first.run_until_complete(release())
+            first.run_until_complete(asyncio.wait_for(limiter.acquire(), 1))
+            with raises(asyncio.TimeoutError):
+                second.run_until_complete(
+                    asyncio.wait_for(limiter.acquire(), 0.05)
+                )
+            second.run_until_complete(release())
+            assert limiter.in_flight == 1
+        finally:
+            first.close()
+            second.close()
+        assert limiter.in_flight == 0
+
+
+class RateLimiterTests:
+    @mark.asyncio
+    async def test_rate_limiter_throttle_reduces_concurrency(self):
+        limiter = specimen.RateLimiter(initial_concurrency=8)
+        await limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.concurrency.limit == 4
+        assert limiter.throttled == 1
+
+    @mark.asyncio
+    async def test_rate_limiter_concurrent_throttles(self):
+        limiter = specimen.RateLimiter(initial_concurrency=16)
+
+        async def throttled_request():
+            window = await limiter.acquire()
+            await asyncio.sleep(0.01)
+            limiter.release(throttled=True, window=window)
+
+        await asyncio.gather(*[throttled_request() for _ in range(16)])
+        assert limiter.concurrency.limit == 8
+        assert limiter.throttled == 16
+
+    @mark.asyncio
+    async def test_rate_limiter_honors_retry_after(self):
+        limiter = specimen.RateLimiter()
+        await limiter.acquire()
+        limiter.release(throttled=True, retry_after=0.05)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.04
+        limiter.release()
+
+    @mark.asyncio
+    async def test_rate_limiter_with_bucket(self):
+        limiter = specimen.RateLimiter(requests_per_second=50, burst=1)
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+            limiter.release()
+        assert time.monotonic() - start >= 0.05
@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import Mock, AsyncMock, patch
+from pytest import mark, raises
+from aiohttp import ClientResponseError
+from aiohttp.client_exceptions import (
+    ClientConnectorError,
+    ServerDisconnectedError,
+)
+
+import proximl.utils.retry as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def response_error(status):
+    return ClientResponseError(
+        request_info=Mock(), history=(), status=status, message="error"
+    )
+
+
+class RetryPolicyTests:
+    def test_retry_policy_requires_limit(self):
+        with raises(ValueError):
+            specimen.RetryPolicy(max_attempts=None)
+        with raises(ValueError):
+            specimen.RetryPolicy().replace(max_attempts=None)
+
+    def test_retry_policy_replace(self):
+        policy = specimen.RetryPolicy(statuses={502})
+        other = policy.replace(max_attempts=7)
+        assert other.max_attempts == 7
+        assert other.statuses == {502}
+        assert policy.max_attempts == 3
+        with raises(TypeError):
+            policy.replace(retries=7)
+
+    def test_retry_policy_backoff_capped(self):
+        policy = specimen.RetryPolicy(
+            initial_backoff=1, multiplier=2, max_backoff=5, jitter=False
+        )
+        assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_retry_policy_backoff_full_jitter(self):
+        policy = specimen.RetryPolicy(initial_backoff=4)
+        delays = [policy.backoff(1) for _ in range(100)]
+        assert all(0 <= d <= 4 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_state_max_attempts(self):
+        state = specimen.RetryPolicy(max_attempts=3, statuses={502}).start()
+        assert state.retry(status=502) is not None
+        assert state.retry(status=502) is not None
+        assert state.retry(status=502) is None
+        assert state.attempt == 3
+
+    def test_retry_state_non_retry_status(self):
+        state = specimen.RetryPolicy(statuses={502}).start()
+        assert state.retry(status=400) is None
+        assert state.retry(response_error(400)) is None
+        assert state.retry(response_error(502)) is not None
+
+    def test_retry_state_retry_after(self):
+        state = specimen.RetryPolicy(statuses={429}).start()
+        assert state.retry(status=429, retry_after=10) == 10
+
+    def test_retry_state_budget(self):
+        policy = specimen.RetryPolicy(
+            max_attempts=None, statuses={502}, budget=5, jitter=False
+        )
+        state = policy.start()
+        assert state.retry(status=502) == 0.5
+        assert state.retry(status=502, retry_after=10) is None
+
+    def test_retry_state_wait(self):
+        state = specimen.RetryPolicy(max_attempts=3, statuses={502}).start()
+        assert state.wait(20) == 20
+        assert state.retry(status=502) is not None
+        assert state.wait(20) is None
+        policy = specimen.RetryPolicy(max_attempts=None, budget=5)
+        assert policy.start().wait(10) is None
+
+    def test_retry_state_exception_attempts(self):
+        policy = specimen.RetryPolicy(
+            max_attempts=2,
+            exceptions=(ServerDisconnectedError,),
+            exception_attempts={ClientConnectorError: 4},
+        )
+        state = policy.start()
+        error = ClientConnectorError(
+            connection_key=Mock(), os_error=OSError("dns")
+        )
+        assert [state.retry(error) is not None for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        state = policy.start()
+        assert state.retry(ServerDisconnectedError()) is not None
+        assert state.retry(ServerDisconnectedError()) is None
+        assert state.retry(ValueError()) is None
+
+    def test_retry_state_non_idempotent(self):
+        policy = specimen.RetryPolicy(
+            statuses={429, 502},
+            exceptions=(ServerDisconnectedError, ClientConnectorError),
+        )
+        state = policy.start("POST")
+        assert state.retry(status=502) is None
+        assert state.retry(ServerDisconnectedError()) is None
+        assert state.retry(status=429) is not None
+        state = policy.start("POST")
+        assert (
+            state.retry(
+                ClientConnectorError(
+                    connection_key=Mock(), os_error=OSError("refused")
+                )
+            )
+            is not None
+        )
+        assert policy.start("put").retry(status=502) is not None
+
+    @mark.asyncio
+    async def test_retry_policy_call(self):
+        policy = specimen.RetryPolicy(statuses={503})
+        func = AsyncMock(side_effect=[response_error(503), "success"])
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep_mock:
+            assert await policy.call(func, 1, key="value") == "success"
+        func.assert_called_with(1, key="value")
+        assert sleep_mock.call_count == 1
+
+    @mark.asyncio
+    async def test_retry_policy_call_gives_up(self):
+        policy = specimen.RetryPolicy(
+            max_attempts=2, exceptions=(asyncio.TimeoutError,)
+        )
+        func = AsyncMock(side_effect=asyncio.TimeoutError())
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with raises(asyncio.TimeoutError):
+                await policy.call(func)
+        assert func.call_count == 2
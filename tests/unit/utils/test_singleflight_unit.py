@@ -0,0 +1,116 @@
+import asyncio
+from pytest import mark, raises
+
+import proximl.utils.singleflight as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+class FreezeTests:
+    def test_freeze_empty(self):
+        assert specimen.freeze(None) == ()
+        assert specimen.freeze({}) == ()
+
+    def test_freeze_order_independent(self):
+        assert specimen.freeze(dict(a=1, b=[1, 2])) == specimen.freeze(
+            dict(b=[1, 2], a=1)
+        )
+
+    def test_freeze_distinguishes_values(self):
+        assert specimen.freeze(dict(a=1)) != specimen.freeze(dict(a="1"))
+
+
+class SingleFlightTests:
+    @mark.asyncio
+    async def test_concurrent_calls_share_one_call(self):
+        flight = specimen.SingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "job-1", "workers": [{"status": "running"}]}
+
+        results = await asyncio.gather(
+            *[flight.do(("key",), func) for _ in range(5)]
+        )
+        assert len(calls) == 1
+        assert all(result == results[0] for result in results)
+        # followers get their own copy of the data
+        results[1]["workers"][0]["status"] = "stopped"
+        assert results[0]["workers"][0]["status"] == "running"
+        assert len(flight) == 0
+
+    @mark.asyncio
+    async def test_different_keys_do_not_share(self):
+        flight = specimen.SingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        await asyncio.gather(flight.do(("a",), func), flight.do(("b",), func))
+        assert len(calls) == 2
+
+    @mark.asyncio
+    async def test_sequential_calls_are_not_cached(self):
+        flight = specimen.SingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            return len(calls)
+
+        assert await flight.do(("key",), func) == 1
+        assert await flight.do(("key",), func) == 2
+
+    @mark.asyncio
+    async def test_exception_propagates_to_all_callers(self):
+        flight = specimen.SingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do(("key",), func),
+            flight.do(("key",), func),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @mark.asyncio
+    async def test_cancelling_one_caller_does_not_cancel_others(self):
+        flight = specimen.SingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do(("key",), func))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do(("key",), func))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+        with raises(asyncio.CancelledError):
+            await first
+
+    @mark.asyncio
+    async def test_cancelling_only_caller_cancels_call(self):
+        flight = specimen.SingleFlight()
+        started = asyncio.Event()
+
+        async def func():
+            started.set()
+            await asyncio.sleep(10)
+
+        caller = asyncio.ensure_future(flight.do(("key",), func))
+        await started.wait()
+        caller.cancel()
+        with raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        assert len(flight) == 0
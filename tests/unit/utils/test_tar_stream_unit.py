@@ -0,0 +1,147 @@
+import io
+import os
+import shutil
+import tarfile
+import subprocess
+from pytest import fixture, mark, raises, skip
+
+import proximl.utils.tar_stream as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+@fixture
+def tree(tmp_path):
+    (tmp_path / "b.txt").write_bytes(b"b" * 1000)
+    (tmp_path / "a.txt").write_bytes(b"a")
+    (tmp_path / "empty").write_bytes(b"")
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "run.log").write_bytes(b"log")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "x.bin").write_bytes(os.urandom(70000))
+    os.symlink("a.txt", tmp_path / "link")
+    return tmp_path
+
+
+def members(data):
+    with tarfile.open(fileobj=io.BytesIO(bytes(data))) as archive:
+        return {
+            member.name: (
+                archive.extractfile(member).read()
+                if member.isreg()
+                else member.type
+            )
+            for member in archive.getmembers()
+        }
+
+
+class TarStreamTests:
+    def test_tar_stream_directory(self, tree):
+        data = specimen.TarStream(str(tree)).read()
+        assert len(data) % tarfile.RECORDSIZE == 0
+        archived = members(data)
+        assert list(archived) == [
+            ".",
+            "./a.txt",
+            "./b.txt",
+            "./data",
+            "./data/x.bin",
+            "./empty",
+            "./link",
+            "./logs",
+            "./logs/run.log",
+        ]
+        assert archived["./data/x.bin"] == (tree / "data/x.bin").read_bytes()
+        assert archived["./empty"] == b""
+        assert archived["./link"] == tarfile.SYMTYPE
+
+    def test_tar_stream_symlinked_directory(self, tree, tmp_path_factory):
+        link = tmp_path_factory.mktemp("links") / "tree"
+        os.symlink(tree, link)
+        data = specimen.TarStream(str(link)).read()
+        archived = members(data)
+        assert archived["."] == tarfile.DIRTYPE
+        assert archived["./a.txt"] == b"a"
+        assert archived["./link"] == tarfile.SYMTYPE
+        destination = tmp_path_factory.mktemp("extracted")
+        with tarfile.open(fileobj=io.BytesIO(bytes(data))) as archive:
+            archive.extractall(destination)
+        assert (destination / "a.txt").read_bytes() == b"a"
+
+    def test_tar_stream_file_matches_tar(self, tree):
+        if shutil.which("tar") is None:
+            skip("tar is not installed")
+        expected = subprocess.run(
+            ["tar", "-c", "-C", str(tree / "data"), "x.bin"],
+            capture_output=True,
+            check=True,
+        ).stdout
+        data = specimen.TarStream(str(tree / "data" / "x.bin")).read()
+        assert bytes(data) == expected
+
+    def test_tar_stream_small_reads(self, tree):
+        expected = specimen.TarStream(str(tree)).read()
+        archive = specimen.TarStream(str(tree))
+        chunks = []
+        while True:
+            chunk = archive.read(777)
+            if not chunk:
+                break
+            assert len(chunk) == 777 or not archive.read(1)
+            chunks.append(bytes(chunk))
+        assert b"".join(chunks) == expected
+
+    def test_tar_stream_filter_and_order(self, tree):
+        filtered = []
+
+        def keep(relpath, is_dir):
+            filtered.append(relpath)
+            return relpath != "logs" and not relpath.endswith(".bin")
+
+        data = specimen.TarStream(
+            str(tree),
+            filter=keep,
+            sort_key=lambda entry: (not entry.is_dir(), entry.name),
+        ).read()
+        assert list(members(data)) == [
+            ".",
+            "./data",
+            "./a.txt",
+            "./b.txt",
+            "./empty",
+            "./link",
+        ]
+        # Excluded directories are not walked
+        assert "logs/run.log" not in filtered
+        assert "data/x.bin" in filtered
+
+    def test_tar_stream_progress(self, tree):
+        progress = []
+        archive = specimen.TarStream(
+            str(tree / "logs"),
+            progress=lambda relpath, size: progress.append((relpath, size)),
+        )
+        archive.read()
+        assert progress == [("run.log", 3)]
+        assert archive.files == 1
+
+    def test_tar_stream_without_empty_directories(self, tree):
+        (tree / "logs" / "run.log").unlink()
+        (tree / "data" / "nested").mkdir()
+        (tree / "data" / "nested" / "deeper").mkdir()
+        archive = specimen.TarStream(str(tree), empty_directories=False)
+        assert list(members(archive.read())) == [
+            ".",
+            "./a.txt",
+            "./b.txt",
+            "./data",
+            "./data/x.bin",
+            "./empty",
+            "./link",
+        ]
+        empty = specimen.TarStream(str(tree / "logs"), empty_directories=False)
+        assert list(members(empty.read())) == ["."]
+
+    def test_tar_stream_invalid_path(self, tmp_path):
+        with raises(ValueError, match="neither a file nor directory"):
+            specimen.TarStream(str(tmp_path / "missing"))
@@ -0,0 +1,105 @@
+import os
+import stat
+import time
+import threading
+from pytest import mark
+
+import proximl.utils.token_cache as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def make_tokens(expires):
+    return dict(
+        id_token="id",
+        access_token="access",
+        refresh_token="refresh",
+        expires=expires,
+    )
+
+
+class TokenCacheTests:
+    def test_token_cache_round_trip(self, tmp_path):
+        cache = specimen.TokenCache(str(tmp_path / "cache" / "tokens.json"))
+        key = specimen.TokenCache.key("pool", "client", "user")
+        assert cache.get(key) is None
+        tokens = make_tokens(time.time() + 3600)
+        cache.set(key, tokens)
+        assert cache.get(key) == tokens
+        assert specimen.TokenCache(cache.path).get(key) == tokens
+
+    def test_token_cache_owner_only_permissions(self, tmp_path):
+        cache = specimen.TokenCache(str(tmp_path / "cache" / "tokens.json"))
+        cache.set("key", make_tokens(time.time() + 3600))
+        mode = stat.S_IMODE(os.stat(cache.path).st_mode)
+        assert mode == 0o600
+        directory_mode = stat.S_IMODE(os.stat(tmp_path / "cache").st_mode)
+        assert directory_mode == 0o700
+
+    def test_token_cache_expired_tokens(self, tmp_path):
+        cache = specimen.TokenCache(str(tmp_path / "tokens.json"))
+        expires = time.time() - 1
+        cache.set("old", make_tokens(expires))
+        cache.set("revoked", dict(make_tokens(expires), refresh_token=None))
+        assert cache.get("old") is None
+        tokens = make_tokens(time.time() + 3600)
+        cache.set("new", tokens)
+        # Another user's refresh token is still usable once their id and
+        # access tokens expire
+        assert cache.load() == dict(
+            old=dict(refresh_token="refresh", expires=expires), new=tokens
+        )
+        assert cache.get("old") is None
+
+    def test_token_cache_remove(self, tmp_path):
+        cache = specimen.TokenCache(str(tmp_path / "tokens.json"))
+        cache.set("key", make_tokens(time.time() + 3600))
+        cache.remove("key")
+        assert cache.get("key") is None
+
+    def test_token_cache_corrupt_file(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("not json")
+        cache = specimen.TokenCache(str(path))
+        assert cache.get("key") is None
+        cache.set("key", make_tokens(time.time() + 3600))
+        assert cache.get("key")
+
+    def test_token_cache_unwritable(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = specimen.TokenCache(str(blocker / "tokens.json"))
+        cache.set("key", make_tokens(time.time() + 3600))
+        assert cache.get("key") is None
+        with cache.lock():
+            pass
+
+    def test_token_cache_lock_is_exclusive(self, tmp_path):
+        cache = specimen.TokenCache(str(tmp_path / "tokens.json"))
+        events = []
+
+        def worker(name):
+            with specimen.TokenCache(cache.path).lock():
+                events.append(f"{name} start")
+                time.sleep(0.05)
+                events.append(f"{name} end")
+
+        threads = [
+            threading.Thread(target=worker, args=(name,))
+            for name in ["a", "b"]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert events[0][0] == events[1][0]
+        assert events[2][0] == events[3][0]
+
+    def test_token_cache_lock_timeout(self, tmp_path):
+        cache = specimen.TokenCache(
+            str(tmp_path / "tokens.json"), lock_timeout=0.1
+        )
+        with cache.lock():
+            start = time.monotonic()
+            with specimen.TokenCache(cache.path, lock_timeout=0.1).lock():
+                assert time.monotonic() - start >= 0.1
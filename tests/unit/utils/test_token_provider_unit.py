@@ -0,0 +1,135 @@
+import time
+import asyncio
+import threading
+from unittest.mock import MagicMock
+from pytest import mark, raises
+
+import proximl.utils.token_provider as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def make_auth(lifetime=3600, delay=0, error=None):
+    """Return a mock Auth whose get_tokens blocks for ``delay`` seconds."""
+    auth = MagicMock()
+    threads = []
+
+    def get_tokens(min_valid=0):
+        threads.append(threading.current_thread())
+        time.sleep(delay)
+        if error:
+            raise error
+        return dict(
+            id_token=f"id-{len(threads)}",
+            expires=time.time() + lifetime,
+        )
+
+    auth.get_tokens = MagicMock(side_effect=get_tokens)
+    return auth, threads
+
+
+class TokenProviderTests:
+    @mark.asyncio
+    async def test_token_provider_runs_auth_off_loop(self):
+        auth, threads = make_auth()
+        provider = specimen.TokenProvider(auth)
+        tokens = await provider.get_tokens()
+        assert tokens["id_token"] == "id-1"
+        assert threads[0] is not threading.current_thread()
+        provider.close()
+
+    @mark.asyncio
+    async def test_token_provider_deduplicates_refreshes(self):
+        auth, _ = make_auth(delay=0.05)
+        provider = specimen.TokenProvider(auth)
+        results = await asyncio.gather(
+            *[provider.get_tokens() for _ in range(10)]
+        )
+        assert auth.get_tokens.call_count == 1
+        assert all(tokens["id_token"] == "id-1" for tokens in results)
+        provider.close()
+
+    @mark.asyncio
+    async def test_token_provider_reuses_valid_tokens(self):
+        auth, _ = make_auth()
+        provider = specimen.TokenProvider(auth)
+        await provider.get_tokens()
+        await provider.get_tokens()
+        assert auth.get_tokens.call_count == 1
+        provider.close()
+
+    @mark.asyncio
+    async def test_token_provider_refreshes_in_background(self):
+        auth, _ = make_auth(lifetime=3600, delay=0.05)
+        provider = specimen.TokenProvider(auth, refresh_margin=600)
+        await provider.get_tokens()
+        # Tokens obtained 59 minutes ago, expiring in a minute
+        provider._tokens["expires"] = time.time() + 60
+        provider._obtained = time.time() - 3540
+
+        start = time.monotonic()
+        tokens = await provider.get_tokens()
+        assert time.monotonic() - start < 0.05
+        assert tokens["id_token"] == "id-1"
+
+        await asyncio.sleep(0.1)
+        assert auth.get_tokens.call_count == 2
+        assert auth.get_tokens.call_args.kwargs["min_valid"] == 600
+        assert (await provider.get_tokens())["id_token"] == "id-2"
+        provider.close()
+
+    @mark.asyncio
+    async def test_token_provider_waits_for_expired_tokens(self):
+        auth, _ = make_auth()
+        provider = specimen.TokenProvider(auth)
+        await provider.get_tokens()
+        provider._tokens["expires"] = time.time() - 1
+        assert (await provider.get_tokens())["id_token"] == "id-2"
+        provider.close()
+
+    @mark.asyncio
+    async def test_token_provider_refresh_timer(self):
+        auth, _ = make_auth(lifetime=0.1)
+        provider = specimen.TokenProvider(auth)
+        await provider.get_tokens()
+        await asyncio.sleep(0.15)
+        assert auth.get_tokens.call_count >= 2
+        timer = provider._loops[asyncio.get_running_loop()].timer
+        provider.close()
+        assert timer.cancelled()
+        assert not provider._loops
+
+    @mark.asyncio
+    async def test_token_provider_error(self):
+        auth, _ = make_auth(error=ValueError("bad credentials"))
+        provider = specimen.TokenProvider(auth)
+        with raises(ValueError):
+            await provider.get_tokens()
+        with raises(ValueError):
+            await provider.get_tokens()
+        assert auth.get_tokens.call_count == 2
+
+    def test_token_provider_across_event_loops(self):
+        auth, _ = make_auth(lifetime=-1)
+        provider = specimen.TokenProvider(auth)
+        for _ in range(2):
+            asyncio.run(provider.get_tokens())
+        assert auth.get_tokens.call_count == 2
+
+    def test_token_provider_concurrent_event_loops(self):
+        auth, _ = make_auth(lifetime=3600)
+        provider = specimen.TokenProvider(auth)
+        first = asyncio.new_event_loop()
+        try:
+            first.run_until_complete(provider.get_tokens())
+            timer = provider._loops[first].timer
+            # Another loop using the provider does not drop the timer of
+            # the first one
+            asyncio.run(provider.get_tokens())
+            assert not timer.cancelled()
+            assert provider._loops[first].timer is timer
+        finally:
+            first.close()
+        provider.close()
+        assert timer.cancelled()
+        assert auth.get_tokens.call_count == 1
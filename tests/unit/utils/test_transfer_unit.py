@@ -2,6 +2,7 @@ import os
 import re
 import asyncio
 import tempfile
+import threading
 from unittest.mock import (
     Mock,
     AsyncMock,
@@ -21,11 +22,22 @@ from aiohttp.client_exceptions import (
 )
 
 import proximl.utils.transfer as specimen
-from proximl.exceptions import ConnectionError, ProxiMLException
+from proximl.exceptions import (
+    CircuitOpenError,
+    ConnectionError,
+    ProxiMLException,
+)
 
 pytestmark = [mark.sdk, mark.unit]
 
 
+@fixture(autouse=True)
+def reset_circuit_breakers():
+    specimen.CIRCUIT_BREAKERS.clear()
+    yield
+    specimen.CIRCUIT_BREAKERS.clear()
+
+
 class NormalizeEndpointTests:
     def test_normalize_endpoint_with_https(self):
         result = specimen.normalize_endpoint("https://example.com")
@@ -183,13 +195,48 @@ class RetryRequestTests:
 
     @mark.asyncio
     async def test_retry_request_exponential_backoff(self):
-        func = AsyncMock(side_effect=[ServerTimeoutError(), "success"])
+        func = AsyncMock(
+            side_effect=[
+                ServerTimeoutError(),
+                ServerTimeoutError(),
+                ServerTimeoutError(),
+                "success",
+            ]
+        )
+        sleep_mock = AsyncMock()
+        with patch("asyncio.sleep", sleep_mock), patch(
+            "proximl.utils.retry.random.uniform", side_effect=lambda a, b: b
+        ):
+            await specimen.retry_request(func, max_retries=4, retry_backoff=2)
+        # Backoff ceiling doubles from DNS_INITIAL_DELAY on each retry
+        assert [c[0][0] for c in sleep_mock.call_args_list] == [1, 2, 4]
+
+    @mark.asyncio
+    async def test_retry_request_backoff_capped_with_jitter(self):
+        func = AsyncMock(side_effect=ServerTimeoutError())
         sleep_mock = AsyncMock()
         with patch("asyncio.sleep", sleep_mock):
-            await specimen.retry_request(func, max_retries=3, retry_backoff=2)
-        # Should sleep with exponential backoff: 2^1 = 2 seconds
-        assert sleep_mock.call_count == 1
-        sleep_mock.assert_called_with(2)
+            with raises(ServerTimeoutError):
+                await specimen.retry_request(func, max_retries=10)
+        delays = [c[0][0] for c in sleep_mock.call_args_list]
+        assert len(delays) == 9
+        assert all(0 <= d <= specimen.MAX_BACKOFF for d in delays)
+
+    @mark.asyncio
+    async def test_retry_request_retry_policy_override(self):
+        func = AsyncMock(
+            side_effect=ClientResponseError(
+                request_info=Mock(),
+                history=(),
+                status=409,
+                message="Conflict",
+            )
+        )
+        policy = specimen.RETRY_POLICY.replace(statuses={409}, max_attempts=2)
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with raises(ClientResponseError):
+                await specimen.retry_request(func, retry_policy=policy)
+        assert func.call_count == 2
 
 
 class PingEndpointTests:
@@ -310,7 +357,10 @@ class PingEndpointTests:
             mock_session_ctx.__aexit__ = AsyncMock(return_value=None)
             mock_session_class.return_value = mock_session_ctx
             sleep_mock = AsyncMock()
-            with patch("asyncio.sleep", sleep_mock):
+            with patch("asyncio.sleep", sleep_mock), patch(
+                "proximl.utils.retry.random.uniform",
+                side_effect=lambda a, b: b,
+            ):
                 await specimen.ping_endpoint(
                     "https://host", "token", max_retries=2
                 )
@@ -379,7 +429,10 @@ class PingEndpointTests:
             mock_session_ctx.__aexit__ = AsyncMock(return_value=None)
             mock_session_class.return_value = mock_session_ctx
             sleep_mock = AsyncMock()
-            with patch("asyncio.sleep", sleep_mock):
+            with patch("asyncio.sleep", sleep_mock), patch(
+                "proximl.utils.retry.random.uniform",
+                side_effect=lambda a, b: b,
+            ):
                 await specimen.ping_endpoint(
                     "https://host", "token", max_retries=5, retry_backoff=2
                 )
@@ -548,8 +601,64 @@ class PingEndpointTests:
             call_kw = sess.get.call_args[1]
             assert call_kw["headers"]["Authorization"] == "Bearer my_token"
 
+    @mark.asyncio
+    async def test_ping_endpoint_waits_for_open_circuit(self):
+        clock = [1000.0]
+
+        async def sleep(delay):
+            clock[0] += delay
+
+        breaker = specimen.CIRCUIT_BREAKERS.get("https://host")
+        with patch(
+            "proximl.utils.transfer.aiohttp.ClientSession"
+        ) as mock_session_class, patch(
+            "proximl.utils.circuit_breaker.time.monotonic",
+            side_effect=lambda: clock[0],
+        ), patch(
+            "asyncio.sleep", side_effect=sleep
+        ) as sleep_mock:
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+            mock_session_class.return_value = self._make_ping_session_mock(200)
+            await specimen.ping_endpoint("https://host", "token")
+            sess = mock_session_class.return_value.__aenter__.return_value
+            sess.get.assert_called_once()
+        assert sleep_mock.call_args[0][0] == breaker.recovery_timeout
+        assert breaker.state == "closed"
+
+    @mark.asyncio
+    async def test_ping_endpoint_open_circuit_max_retries(self):
+        breaker = specimen.CIRCUIT_BREAKERS.get("https://host")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        with patch(
+            "proximl.utils.transfer.aiohttp.ClientSession"
+        ) as mock_session_class:
+            with patch("asyncio.sleep", new_callable=AsyncMock):
+                with raises(ConnectionError, match="Circuit breaker open"):
+                    await specimen.ping_endpoint(
+                        "https://host", "token", max_retries=2
+                    )
+            mock_session_class.assert_not_called()
+
 
 class UploadChunkTests:
+    @mark.asyncio
+    async def test_upload_chunk_ignores_open_circuit(self):
+        breaker = specimen.CIRCUIT_BREAKERS.get("https://example.com")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        response = AsyncMock()
+        response.status = 200
+        session = Mock()
+        session.put = Mock(return_value=response)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        await specimen.upload_chunk(
+            session, "https://example.com", "token", 4, b"data", 0
+        )
+        session.put.assert_called_once()
+
     @mark.asyncio
     async def test_upload_chunk_success(self):
         # Mock session.put to return an async context manager
@@ -836,70 +945,56 @@ class UploadTests:
             with patch(
                 "proximl.utils.transfer.ping_endpoint", new_callable=AsyncMock
             ):
-                with patch(
-                    "asyncio.create_subprocess_exec"
-                ) as mock_subprocess:
-                    mock_process = AsyncMock()
-                    mock_process.stdout.read = AsyncMock(
-                        side_effect=[b"data", b""]
+                with patch("aiohttp.ClientSession") as mock_session:
+                    mock_session_instance = AsyncMock()
+                    mock_session.return_value.__aenter__ = AsyncMock(
+                        return_value=mock_session_instance
+                    )
+                    mock_session.return_value.__aexit__ = AsyncMock(
+                        return_value=None
                     )
-                    mock_process.returncode = 0
-                    mock_process.wait = AsyncMock(return_value=0)
-                    mock_process.stderr.read = AsyncMock(return_value=b"")
-                    mock_subprocess.return_value = mock_process
 
-                    with patch("aiohttp.ClientSession") as mock_session:
-                        mock_session_instance = AsyncMock()
-                        mock_session.return_value.__aenter__ = AsyncMock(
-                            return_value=mock_session_instance
+                    with patch(
+                        "proximl.utils.transfer.upload_chunk",
+                        new_callable=AsyncMock,
+                    ) as mock_upload_chunk:
+                        mock_finalize_response = AsyncMock()
+                        mock_finalize_response.status = 200
+                        mock_finalize_response.json = AsyncMock(
+                            return_value={"status": "ok"}
                         )
-                        mock_session.return_value.__aexit__ = AsyncMock(
+                        mock_finalize_response.__aenter__ = AsyncMock(
+                            return_value=mock_finalize_response
+                        )
+                        mock_finalize_response.__aexit__ = AsyncMock(
                             return_value=None
                         )
 
-                        with patch(
-                            "proximl.utils.transfer.upload_chunk",
-                            new_callable=AsyncMock,
-                        ) as mock_upload_chunk:
-                            mock_finalize_response = AsyncMock()
-                            mock_finalize_response.status = 200
-                            mock_finalize_response.json = AsyncMock(
-                                return_value={"status": "ok"}
-                            )
-                            mock_finalize_response.__aenter__ = AsyncMock(
-                                return_value=mock_finalize_response
-                            )
-                            mock_finalize_response.__aexit__ = AsyncMock(
-                                return_value=None
-                            )
-
-                            # session.post() should return something that is both awaitable and an async context manager
-                            class AwaitableContextManager:
-                                def __init__(self, return_value):
-                                    self.return_value = return_value
+                        # session.post() should return something that is both awaitable and an async context manager
+                        class AwaitableContextManager:
+                            def __init__(self, return_value):
+                                self.return_value = return_value
 
-                                def __await__(self):
-                                    yield
-                                    return self
+                            def __await__(self):
+                                yield
+                                return self
 
-                                async def __aenter__(self):
-                                    return self.return_value
+                            async def __aenter__(self):
+                                return self.return_value
 
-                                async def __aexit__(self, *args):
-                                    return None
+                            async def __aexit__(self, *args):
+                                return None
 
-                            mock_post_context = AwaitableContextManager(
-                                mock_finalize_response
-                            )
-                            mock_session_instance.post = Mock(
-                                return_value=mock_post_context
-                            )
+                        mock_post_context = AwaitableContextManager(
+                            mock_finalize_response
+                        )
+                        mock_session_instance.post = Mock(
+                            return_value=mock_post_context
+                        )
 
-                            await specimen.upload(
-                                "example.com", "token", tmp.name
-                            )
-                            # Verify upload_chunk was called
-                            assert mock_upload_chunk.called
+                        await specimen.upload("example.com", "token", tmp.name)
+                        # Verify upload_chunk was called
+                        assert mock_upload_chunk.called
 
     @mark.asyncio
     async def test_upload_directory(self):
@@ -911,140 +1006,92 @@ class UploadTests:
             with patch(
                 "proximl.utils.transfer.ping_endpoint", new_callable=AsyncMock
             ):
-                with patch(
-                    "asyncio.create_subprocess_exec"
-                ) as mock_subprocess:
-                    mock_process = AsyncMock()
-                    mock_process.stdout.read = AsyncMock(
-                        side_effect=[b"data", b""]
+                with patch("aiohttp.ClientSession") as mock_session:
+                    mock_session_instance = AsyncMock()
+                    mock_session.return_value.__aenter__ = AsyncMock(
+                        return_value=mock_session_instance
+                    )
+                    mock_session.return_value.__aexit__ = AsyncMock(
+                        return_value=None
                     )
-                    mock_process.returncode = 0
-                    mock_process.wait = AsyncMock(return_value=0)
-                    mock_process.stderr.read = AsyncMock(return_value=b"")
-                    mock_subprocess.return_value = mock_process
 
-                    with patch("aiohttp.ClientSession") as mock_session:
-                        mock_session_instance = AsyncMock()
-                        mock_session.return_value.__aenter__ = AsyncMock(
-                            return_value=mock_session_instance
+                    with patch(
+                        "proximl.utils.transfer.upload_chunk",
+                        new_callable=AsyncMock,
+                    ) as mock_upload_chunk:
+                        mock_finalize_response = AsyncMock()
+                        mock_finalize_response.status = 200
+                        mock_finalize_response.json = AsyncMock(
+                            return_value={"status": "ok"}
                         )
-                        mock_session.return_value.__aexit__ = AsyncMock(
+                        mock_finalize_response.__aenter__ = AsyncMock(
+                            return_value=mock_finalize_response
+                        )
+                        mock_finalize_response.__aexit__ = AsyncMock(
                             return_value=None
                         )
 
-                        with patch(
-                            "proximl.utils.transfer.upload_chunk",
-                            new_callable=AsyncMock,
-                        ) as mock_upload_chunk:
-                            mock_finalize_response = AsyncMock()
-                            mock_finalize_response.status = 200
-                            mock_finalize_response.json = AsyncMock(
-                                return_value={"status": "ok"}
-                            )
-                            mock_finalize_response.__aenter__ = AsyncMock(
-                                return_value=mock_finalize_response
-                            )
-                            mock_finalize_response.__aexit__ = AsyncMock(
-                                return_value=None
-                            )
-
-                            # session.post() should return something that is both awaitable and an async context manager
-                            class AwaitableContextManager:
-                                def __init__(self, return_value):
-                                    self.return_value = return_value
+                        # session.post() should return something that is both awaitable and an async context manager
+                        class AwaitableContextManager:
+                            def __init__(self, return_value):
+                                self.return_value = return_value
 
-                                def __await__(self):
-                                    yield
-                                    return self
+                            def __await__(self):
+                                yield
+                                return self
 
-                                async def __aenter__(self):
-                                    return self.return_value
+                            async def __aenter__(self):
+                                return self.return_value
 
-                                async def __aexit__(self, *args):
-                                    return None
+                            async def __aexit__(self, *args):
+                                return None
 
-                            mock_post_context = AwaitableContextManager(
-                                mock_finalize_response
-                            )
-                            mock_session_instance.post = Mock(
-                                return_value=mock_post_context
-                            )
+                        mock_post_context = AwaitableContextManager(
+                            mock_finalize_response
+                        )
+                        mock_session_instance.post = Mock(
+                            return_value=mock_post_context
+                        )
 
-                            await specimen.upload(
-                                "example.com", "token", tmpdir
-                            )
-                            # Verify upload_chunk was called
-                            assert mock_upload_chunk.called
+                        await specimen.upload("example.com", "token", tmpdir)
+                        # Verify upload_chunk was called
+                        assert mock_upload_chunk.called
 
     @mark.asyncio
-    async def test_upload_tar_command_failure(self):
+    async def test_upload_archive_read_failure(self):
         with tempfile.NamedTemporaryFile() as tmp:
-            with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-                mock_process = AsyncMock()
-                mock_process.stdout.read = AsyncMock(
-                    side_effect=[b"data", b""]
+            tmp.write(b"test content")
+            tmp.flush()
+            with patch("aiohttp.ClientSession") as mock_session:
+                mock_session_instance = AsyncMock()
+                mock_session.return_value.__aenter__ = AsyncMock(
+                    return_value=mock_session_instance
                 )
-                mock_process.wait = AsyncMock(return_value=1)
-                mock_process.stderr.read = AsyncMock(return_value=b"tar error")
-                mock_subprocess.return_value = mock_process
-
-                with patch("aiohttp.ClientSession") as mock_session:
-                    mock_session_instance = AsyncMock()
-                    mock_session.return_value.__aenter__ = AsyncMock(
-                        return_value=mock_session_instance
-                    )
-                    mock_session.return_value.__aexit__ = AsyncMock(
-                        return_value=None
-                    )
-                    with patch(
-                        "proximl.utils.transfer.ping_endpoint",
-                        new_callable=AsyncMock,
-                    ):
-                        with patch(
-                            "proximl.utils.transfer.upload_chunk",
-                            new_callable=AsyncMock,
-                        ):
-                            with raises(
-                                ProxiMLException, match="tar command failed"
-                            ):
-                                await specimen.upload(
-                                    "example.com", "token", tmp.name
-                                )
-
-    @mark.asyncio
-    async def test_upload_tar_command_failure_no_stderr(self):
-        with tempfile.NamedTemporaryFile() as tmp:
-            with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-                mock_process = AsyncMock()
-                mock_process.stdout.read = AsyncMock(
-                    side_effect=[b"data", b""]
+                mock_session.return_value.__aexit__ = AsyncMock(
+                    return_value=None
                 )
-                mock_process.wait = AsyncMock(return_value=1)
-                mock_process.stderr.read = AsyncMock(return_value=None)
-                mock_subprocess.return_value = mock_process
-
-                with patch("aiohttp.ClientSession") as mock_session:
-                    mock_session_instance = AsyncMock()
-                    mock_session.return_value.__aenter__ = AsyncMock(
-                        return_value=mock_session_instance
-                    )
-                    mock_session.return_value.__aexit__ = AsyncMock(
-                        return_value=None
-                    )
+                with patch(
+                    "proximl.utils.transfer.ping_endpoint",
+                    new_callable=AsyncMock,
+                ):
                     with patch(
-                        "proximl.utils.transfer.ping_endpoint",
+                        "proximl.utils.transfer.upload_chunk",
                         new_callable=AsyncMock,
-                    ):
+                    ) as mock_upload_chunk:
                         with patch(
-                            "proximl.utils.transfer.upload_chunk",
-                            new_callable=AsyncMock,
+                            "proximl.utils.tar_stream.open",
+                            side_effect=PermissionError("Permission denied"),
+                            create=True,
                         ):
                             with raises(
-                                ProxiMLException, match="tar command failed"
+                                ProxiMLException,
+                                match="Unable to archive.*Permission denied",
                             ):
                                 await specimen.upload(
                                     "example.com", "token", tmp.name
                                 )
+                        mock_upload_chunk.assert_not_called()
+                        mock_session_instance.post.assert_not_called()
 
     @mark.asyncio
     async def test_upload_finalize_failure(self):
@@ -1052,99 +1099,6 @@ class UploadTests:
             with patch(
                 "proximl.utils.transfer.ping_endpoint", new_callable=AsyncMock
             ):
-                with patch(
-                    "asyncio.create_subprocess_exec"
-                ) as mock_subprocess:
-                    mock_process = AsyncMock()
-                    mock_process.stdout.read = AsyncMock(
-                        side_effect=[b"data", b""]
-                    )
-                    mock_process.returncode = 0
-                    mock_process.wait = AsyncMock(return_value=0)
-                    mock_process.stderr.read = AsyncMock(return_value=b"")
-                    mock_subprocess.return_value = mock_process
-
-                    with patch("aiohttp.ClientSession") as mock_session:
-                        mock_session_instance = AsyncMock()
-                        mock_session.return_value.__aenter__ = AsyncMock(
-                            return_value=mock_session_instance
-                        )
-                        mock_session.return_value.__aexit__ = AsyncMock(
-                            return_value=None
-                        )
-
-                        with patch(
-                            "proximl.utils.transfer.upload_chunk",
-                            new_callable=AsyncMock,
-                        ) as mock_upload_chunk:
-                            mock_finalize_response = AsyncMock()
-                            mock_finalize_response.status = 500
-                            mock_finalize_response.text = AsyncMock(
-                                return_value="Finalize error"
-                            )
-                            mock_finalize_response.__aenter__ = AsyncMock(
-                                return_value=mock_finalize_response
-                            )
-                            mock_finalize_response.__aexit__ = AsyncMock(
-                                return_value=None
-                            )
-
-                            # session.post() should return something that is both awaitable and an async context manager
-                            class AwaitableContextManager:
-                                def __init__(self, return_value):
-                                    self.return_value = return_value
-
-                                def __await__(self):
-                                    yield
-                                    return self
-
-                                async def __aenter__(self):
-                                    return self.return_value
-
-                                async def __aexit__(self, *args):
-                                    return None
-
-                            mock_post_context = AwaitableContextManager(
-                                mock_finalize_response
-                            )
-                            mock_session_instance.post = Mock(
-                                return_value=mock_post_context
-                            )
-
-                            with patch(
-                                "proximl.utils.transfer.ping_endpoint",
-                                new_callable=AsyncMock,
-                            ):
-                                with raises(
-                                    ConnectionError, match="Finalize failed"
-                                ):
-                                    await specimen.upload(
-                                        "example.com", "token", tmp.name
-                                    )
-                            # Verify upload_chunk was called before finalize
-                            assert mock_upload_chunk.called
-
-    @mark.asyncio
-    async def test_upload_multiple_chunks(self):
-        with tempfile.NamedTemporaryFile() as tmp:
-            tmp.write(b"x" * (10 * 1024 * 1024))  # 10MB file
-            tmp.flush()
-
-            with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-                mock_process = AsyncMock()
-                # Simulate multiple chunks
-                mock_process.stdout.read = AsyncMock(
-                    side_effect=[
-                        b"x" * (5 * 1024 * 1024),
-                        b"x" * (5 * 1024 * 1024),
-                        b"",
-                    ]
-                )
-                mock_process.returncode = 0
-                mock_process.wait = AsyncMock(return_value=0)
-                mock_process.stderr.read = AsyncMock(return_value=b"")
-                mock_subprocess.return_value = mock_process
-
                 with patch("aiohttp.ClientSession") as mock_session:
                     mock_session_instance = AsyncMock()
                     mock_session.return_value.__aenter__ = AsyncMock(
@@ -1154,15 +1108,14 @@ class UploadTests:
                         return_value=None
                     )
 
-                    upload_chunk_mock = AsyncMock()
                     with patch(
                         "proximl.utils.transfer.upload_chunk",
-                        upload_chunk_mock,
-                    ):
+                        new_callable=AsyncMock,
+                    ) as mock_upload_chunk:
                         mock_finalize_response = AsyncMock()
-                        mock_finalize_response.status = 200
-                        mock_finalize_response.json = AsyncMock(
-                            return_value={"status": "ok"}
+                        mock_finalize_response.status = 500
+                        mock_finalize_response.text = AsyncMock(
+                            return_value="Finalize error"
                         )
                         mock_finalize_response.__aenter__ = AsyncMock(
                             return_value=mock_finalize_response
@@ -1197,11 +1150,232 @@ class UploadTests:
                             "proximl.utils.transfer.ping_endpoint",
                             new_callable=AsyncMock,
                         ):
-                            await specimen.upload(
-                                "example.com", "token", tmp.name
-                            )
-                        # Should have called upload_chunk twice (one per chunk)
-                        assert upload_chunk_mock.call_count == 2
+                            with raises(
+                                ConnectionError, match="Finalize failed"
+                            ):
+                                await specimen.upload(
+                                    "example.com", "token", tmp.name
+                                )
+                        # Verify upload_chunk was called before finalize
+                        assert mock_upload_chunk.called
+
+    @mark.asyncio
+    async def test_upload_multiple_chunks(self):
+        with tempfile.NamedTemporaryFile() as tmp:
+            tmp.write(b"x" * (10 * 1024 * 1024))  # 10MB file
+            tmp.flush()
+
+            with patch("aiohttp.ClientSession") as mock_session:
+                mock_session_instance = AsyncMock()
+                mock_session.return_value.__aenter__ = AsyncMock(
+                    return_value=mock_session_instance
+                )
+                mock_session.return_value.__aexit__ = AsyncMock(
+                    return_value=None
+                )
+
+                upload_chunk_mock = AsyncMock()
+                with patch(
+                    "proximl.utils.transfer.upload_chunk",
+                    upload_chunk_mock,
+                ):
+                    mock_finalize_response = AsyncMock()
+                    mock_finalize_response.status = 200
+                    mock_finalize_response.json = AsyncMock(
+                        return_value={"status": "ok"}
+                    )
+                    mock_finalize_response.__aenter__ = AsyncMock(
+                        return_value=mock_finalize_response
+                    )
+                    mock_finalize_response.__aexit__ = AsyncMock(
+                        return_value=None
+                    )
+
+                    # session.post() should return something that is both awaitable and an async context manager
+                    class AwaitableContextManager:
+                        def __init__(self, return_value):
+                            self.return_value = return_value
+
+                        def __await__(self):
+                            yield
+                            return self
+
+                        async def __aenter__(self):
+                            return self.return_value
+
+                        async def __aexit__(self, *args):
+                            return None
+
+                    mock_post_context = AwaitableContextManager(
+                        mock_finalize_response
+                    )
+                    mock_session_instance.post = Mock(
+                        return_value=mock_post_context
+                    )
+
+                    with patch(
+                        "proximl.utils.transfer.ping_endpoint",
+                        new_callable=AsyncMock,
+                    ):
+                        await specimen.upload("example.com", "token", tmp.name)
+                    # Two full chunks, then the end of the archive
+                    assert upload_chunk_mock.call_count == 3
+                    offsets = [
+                        call.args[5]
+                        for call in upload_chunk_mock.call_args_list
+                    ]
+                    assert sorted(offsets) == [
+                        0,
+                        specimen.CHUNK_SIZE,
+                        2 * specimen.CHUNK_SIZE,
+                    ]
+
+
+class FakeStream:
+    """Pipe-like stream returning at most ``read_size`` bytes per read."""
+
+    def __init__(self, data, read_size=64 * 1024):
+        self.data = data
+        self.position = 0
+        self.read_size = read_size
+
+    async def read(self, n):
+        await asyncio.sleep(0)
+        part = self.data[
+            self.position : self.position + min(n, self.read_size)
+        ]
+        self.position += len(part)
+        return part
+
+
+class UploadPipelineTests:
+    @mark.asyncio
+    async def test_chunk_hasher_off_loop(self):
+        threads = []
+
+        class RecordingHash:
+            def __init__(self):
+                self.hash = specimen.hashlib.sha512()
+
+            def update(self, data):
+                threads.append(threading.current_thread())
+                self.hash.update(data)
+
+            def hexdigest(self):
+                return self.hash.hexdigest()
+
+        hasher = specimen.ChunkHasher(RecordingHash())
+        chunks = [os.urandom(1024) for _ in range(5)]
+        for chunk in chunks:
+            await hasher.update(chunk)
+        digest = await hasher.hexdigest()
+        hasher.close()
+        assert digest == specimen.hashlib.sha512(b"".join(chunks)).hexdigest()
+        assert len(set(threads)) == 1
+        assert threads[0] is not threading.current_thread()
+
+    @mark.asyncio
+    async def test_read_chunk_collects_full_chunks(self):
+        stream = FakeStream(b"x" * 300, read_size=64)
+        assert len(await specimen.read_chunk(stream, 256)) == 256
+        assert len(await specimen.read_chunk(stream, 256)) == 44
+        assert await specimen.read_chunk(stream, 256) == b""
+
+    @mark.asyncio
+    async def test_upload_stream_concurrent_and_bounded(self):
+        data = bytes(range(256)) * 64
+        stream = FakeStream(data)
+        active = 0
+        max_active = 0
+        saturated = asyncio.Event()
+        chunks = []
+
+        async def upload_chunk(
+            session, endpoint, auth_token, total_size, chunk, offset
+        ):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            if active == specimen.PARALLEL_UPLOADS:
+                saturated.set()
+            # Chunks read ahead of the uploads are bounded by the queue
+            assert stream.position <= offset + 1024 * (
+                specimen.UPLOAD_QUEUE_SIZE + specimen.PARALLEL_UPLOADS + 1
+            )
+            # Hold the first uploads until all of them are in flight
+            await asyncio.wait_for(saturated.wait(), 1)
+            chunks.append((offset, chunk))
+            active -= 1
+
+        sha512 = specimen.hashlib.sha512()
+        with patch.object(specimen, "CHUNK_SIZE", 1024), patch(
+            "proximl.utils.transfer.upload_chunk", side_effect=upload_chunk
+        ):
+            size = await specimen._upload_stream(
+                Mock(), "https://example.com", "token", stream, sha512
+            )
+        assert size == len(data)
+        assert max_active == specimen.PARALLEL_UPLOADS
+        assert b"".join(chunk for _, chunk in sorted(chunks)) == data
+        assert sha512.hexdigest() == specimen.hashlib.sha512(data).hexdigest()
+
+    @mark.asyncio
+    async def test_upload_stream_rides_out_gateway_errors(self):
+        data = os.urandom(1024 * 12)
+        puts = 0
+
+        def put(url, headers, data, timeout):
+            nonlocal puts
+            puts += 1
+            response = AsyncMock()
+            # A burst of gateway errors across the parallel chunks
+            response.status = 502 if puts <= 6 else 200
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            return response
+
+        session = Mock()
+        session.put = Mock(side_effect=put)
+        with patch.object(specimen, "CHUNK_SIZE", 1024), patch.object(
+            specimen,
+            "RETRY_POLICY",
+            specimen.RETRY_POLICY.replace(max_backoff=0),
+        ):
+            size = await specimen._upload_stream(
+                session,
+                "https://example.com",
+                "token",
+                FakeStream(data),
+                specimen.hashlib.sha512(),
+            )
+        assert size == len(data)
+        assert puts == 12 + 6
+
+    @mark.asyncio
+    async def test_upload_stream_failure_cancels_uploads(self):
+        calls = 0
+
+        async def upload_chunk(*args):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise ConnectionError("Chunk failed")
+            await asyncio.sleep(10)
+
+        with patch.object(specimen, "CHUNK_SIZE", 1024), patch(
+            "proximl.utils.transfer.upload_chunk", side_effect=upload_chunk
+        ):
+            with raises(ConnectionError, match="Chunk failed"):
+                await asyncio.wait_for(
+                    specimen._upload_stream(
+                        Mock(),
+                        "https://example.com",
+                        "token",
+                        FakeStream(b"x" * 1024 * 100),
+                        specimen.hashlib.sha512(),
+                    ),
+                    1,
+                )
 
 
 class DownloadTests:
@@ -3316,71 +3490,59 @@ class DownloadTests:
             with patch(
                 "proximl.utils.transfer.ping_endpoint", new_callable=AsyncMock
             ):
-                with patch(
-                    "asyncio.create_subprocess_exec"
-                ) as mock_subprocess:
-                    mock_process = AsyncMock()
-                    mock_process.stdout.read = AsyncMock(
-                        side_effect=[b"data", b""]
+                with patch("aiohttp.ClientSession") as mock_session:
+                    mock_session_instance = AsyncMock()
+                    mock_session.return_value.__aenter__ = AsyncMock(
+                        return_value=mock_session_instance
+                    )
+                    mock_session.return_value.__aexit__ = AsyncMock(
+                        return_value=None
                     )
-                    mock_process.returncode = 0
-                    mock_process.wait = AsyncMock(return_value=0)
-                    mock_process.stderr.read = AsyncMock(return_value=b"")
-                    mock_subprocess.return_value = mock_process
 
-                    with patch("aiohttp.ClientSession") as mock_session:
-                        mock_session_instance = AsyncMock()
-                        mock_session.return_value.__aenter__ = AsyncMock(
-                            return_value=mock_session_instance
+                    with patch(
+                        "proximl.utils.transfer.upload_chunk",
+                        new_callable=AsyncMock,
+                    ):
+                        mock_finalize_response = AsyncMock()
+                        mock_finalize_response.status = 200
+                        mock_finalize_response.json = AsyncMock(
+                            return_value={"status": "ok", "hash": "abc123"}
+                        )
+                        mock_finalize_response.__aenter__ = AsyncMock(
+                            return_value=mock_finalize_response
                         )
-                        mock_session.return_value.__aexit__ = AsyncMock(
+                        mock_finalize_response.__aexit__ = AsyncMock(
                             return_value=None
                         )
 
-                        with patch(
-                            "proximl.utils.transfer.upload_chunk",
-                            new_callable=AsyncMock,
-                        ):
-                            mock_finalize_response = AsyncMock()
-                            mock_finalize_response.status = 200
-                            mock_finalize_response.json = AsyncMock(
-                                return_value={"status": "ok", "hash": "abc123"}
-                            )
-                            mock_finalize_response.__aenter__ = AsyncMock(
-                                return_value=mock_finalize_response
-                            )
-                            mock_finalize_response.__aexit__ = AsyncMock(
-                                return_value=None
-                            )
+                        # session.post() should return something that is both awaitable and an async context manager
+                        class AwaitableContextManager:
+                            def __init__(self, return_value):
+                                self.return_value = return_value
 
-                            # session.post() should return something that is both awaitable and an async context manager
-                            class AwaitableContextManager:
-                                def __init__(self, return_value):
-                                    self.return_value = return_value
+                            def __await__(self):
+                                yield
+                                return self
 
-                                def __await__(self):
-                                    yield
-                                    return self
+                            async def __aenter__(self):
+                                return self.return_value
 
-                                async def __aenter__(self):
-                                    return self.return_value
+                            async def __aexit__(self, *args):
+                                return None
 
-                                async def __aexit__(self, *args):
-                                    return None
+                        mock_post_context = AwaitableContextManager(
+                            mock_finalize_response
+                        )
+                        mock_session_instance.post = Mock(
+                            return_value=mock_post_context
+                        )
 
-                            mock_post_context = AwaitableContextManager(
-                                mock_finalize_response
-                            )
-                            mock_session_instance.post = Mock(
-                                return_value=mock_post_context
+                        with patch("logging.debug") as mock_log:
+                            await specimen.upload(
+                                "example.com", "token", tmp.name
                             )
-
-                            with patch("logging.debug") as mock_log:
-                                await specimen.upload(
-                                    "example.com", "token", tmp.name
-                                )
-                                # Verify logging.debug was called for finalize
-                                mock_log.assert_called()
+                            # Verify logging.debug was called for finalize
+                            mock_log.assert_called()
 
     @mark.asyncio
     async def test_download_info_endpoint_non_200_status(self):